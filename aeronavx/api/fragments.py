@@ -0,0 +1,160 @@
+import json
+from collections.abc import Iterable, Sequence
+from dataclasses import fields as dataclass_fields
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from ..core.loader import get_airport_row, get_all_airports, get_dataset_version
+from ..models.airport import Airport
+from ..utils.cache import BoundedCache
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+AIRPORT_FIELDS = tuple(f.name for f in dataclass_fields(Airport))
+
+# Named projections accepted by fields= next to explicit field lists
+FIELD_PRESETS = {
+    "all": AIRPORT_FIELDS,
+    "compact": ("iata_code", "gps_code", "name", "latitude_deg", "longitude_deg"),
+}
+
+_tables = BoundedCache(maxsize=32)
+
+
+def dumps(value: Any) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(value)
+
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson when installed, compact stdlib JSON otherwise.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class RawJSONResponse(JSONResponse):
+    """
+    Response whose content is already encoded JSON bytes.
+    """
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+def parse_fields(fields: str | None) -> tuple[str, ...]:
+    """
+    Parse a fields= parameter: a preset name or comma-separated Airport fields.
+
+    Raises:
+        ValueError: If a field is unknown or none is given
+    """
+    if fields is None:
+        return AIRPORT_FIELDS
+
+    if fields in FIELD_PRESETS:
+        return FIELD_PRESETS[fields]
+
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    if not names:
+        raise ValueError("fields must name at least one airport field")
+
+    unknown = [name for name in names if name not in AIRPORT_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown airport fields: {', '.join(unknown)}")
+
+    return names
+
+
+class FragmentTable:
+    """
+    Encoded JSON object of every loaded airport for one field projection.
+
+    Each airport is encoded at most once per dataset version (all at once by
+    build(), e.g. at server startup, or on first use) and then reused byte
+    for byte, so responses are assembled by joining bytes instead of
+    building and encoding dicts for each request.
+    """
+
+    def __init__(self, airports: list[Airport], version: int, fields: tuple[str, ...]):
+        self.airports = airports
+        self.version = version
+        self.fields = fields
+        self._fragments: list[bytes | None] = [None] * len(airports)
+
+    def encode(self, airport: Airport) -> bytes:
+        return dumps({name: getattr(airport, name) for name in self.fields})
+
+    def build(self) -> "FragmentTable":
+        self._fragments = [
+            fragment if fragment is not None else self.encode(airport)
+            for fragment, airport in zip(self._fragments, self.airports)
+        ]
+        return self
+
+    def fragment(self, airport: Airport) -> bytes:
+        row = get_airport_row(airport, load=False)
+        if row is None or row >= len(self._fragments) or self.airports[row] is not airport:
+            return self.encode(airport)
+
+        fragment = self._fragments[row]
+        if fragment is None:
+            fragment = self._fragments[row] = self.encode(airport)
+
+        return fragment
+
+
+def get_fragment_table(fields: tuple[str, ...] = AIRPORT_FIELDS) -> FragmentTable:
+    version = get_dataset_version()
+    table = _tables.get(fields)
+
+    if table is None or table.version != version:
+        airports = get_all_airports()
+        table = FragmentTable(airports, get_dataset_version(), fields)
+        _tables.set(fields, table)
+
+    return table
+
+
+def airport_json(airport: Airport, fields: tuple[str, ...]) -> bytes:
+    return get_fragment_table(fields).fragment(airport)
+
+
+def airports_json(
+    airports: Iterable[Airport],
+    fields: tuple[str, ...],
+    distances_km: Sequence[float] | None = None,
+) -> bytes:
+    """
+    Return a JSON array of airport fragments, each optionally with distance_km.
+    """
+    table = get_fragment_table(fields)
+    fragments = [table.fragment(airport) for airport in airports]
+
+    if distances_km is not None:
+        fragments = [
+            fragment[:-1] + b',"distance_km":' + dumps(d) + b"}"
+            for fragment, d in zip(fragments, distances_km)
+        ]
+
+    return b"[" + b",".join(fragments) + b"]"
+
+
+def compose(members: dict[str, Any]) -> bytes:
+    """
+    Encode a JSON object whose bytes members are already-encoded JSON.
+    """
+    return b"{" + b",".join(
+        dumps(key) + b":" + (value if isinstance(value, bytes) else dumps(value))
+        for key, value in members.items()
+    ) + b"}"
@@ -1,42 +1,176 @@
-from typing import Optional
+import asyncio
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, Literal, TypeVar
+
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
 
 from ..core.airports import get
-from ..core.distance import distance
-from ..core.search import nearest_airports, search_airports_by_name
-from ..core.routing import estimate_flight_time_hours
+from ..core.batch import PairBatch, batch_distances, batch_emissions, batch_flight_times
+from ..core.distance import airport_distance
 from ..core.emissions import estimate_co2_kg_by_codes
+from ..core.loader import get_all_airports, get_dataset_version, load_airports
+from ..core.routing import estimate_flight_time_hours
+from ..core.search import (
+    airports_within_radius_page,
+    filter_airports_page,
+    get_spatial_index,
+    nearest_airports_with_distance,
+    search_airports_by_name,
+)
 from ..exceptions import AeroNavXError
+from ..utils.logging import get_logger
+from ..utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from .fragments import (
+    AIRPORT_FIELDS,
+    FIELD_PRESETS,
+    FastJSONResponse,
+    RawJSONResponse,
+    airport_json,
+    airports_json,
+    compose,
+    get_fragment_table,
+    parse_fields,
+)
+
+T = TypeVar('T')
+
+MAX_BATCH_SIZE = 10000
+
+WORKERS_ENV = "AERONAVX_API_WORKERS"
+
+logger = get_logger()
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_ready = threading.Event()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            workers = int(os.environ.get(WORKERS_ENV, 0)) or min(32, (os.cpu_count() or 1) + 4)
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aeronavx-api")
+        return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run CPU-bound or blocking work on the bounded worker pool, off the event loop.
+
+    A thread pool rather than a process pool: the airport data and indexes
+    live in this process, and the numpy/scipy kernels release the GIL.
+    The pool size comes from AERONAVX_API_WORKERS (default: CPUs + 4, at most 32).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+
+
+def warm_up() -> None:
+    """
+    Load the airport data and build the indexes and JSON fragments handlers use.
+    """
+    load_airports()
+    get_spatial_index()
+    filter_airports_page(limit=1)
+    for fields in (AIRPORT_FIELDS, FIELD_PRESETS["compact"]):
+        get_fragment_table(fields).build()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _executor
+
+    try:
+        await run_blocking(warm_up)
+        _ready.set()
+        logger.info("AeroNavX API ready")
+    except AeroNavXError as e:
+        # Stay up (health passes) but never report ready
+        logger.error(f"Warm-up failed: {e}")
+
+    yield
+
+    _ready.clear()
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 app = FastAPI(
     title="AeroNavX API",
     description="Airport and flight geometry utilities",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
+)
+
+FIELDS_QUERY = Query(
+    None,
+    description="Airport fields to return: comma-separated names, or 'compact' / 'all'"
 )
 
 
+def _fields(fields: str | None) -> tuple[str, ...]:
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok", "service": "AeroNavX API"}
 
 
+@app.get("/ready")
+async def ready():
+    """
+    Readiness probe: 503 until data, indexes and fragments are warm.
+
+    /health only reports that the process is alive, so load balancers
+    should route traffic on /ready.
+    """
+    if not _ready.is_set():
+        return FastJSONResponse({"status": "starting"}, status_code=503)
+
+    return {
+        "status": "ready",
+        "airports": len(get_all_airports()),
+        "dataset_version": get_dataset_version()
+    }
+
+
 @app.get("/airport/{code}")
 async def get_airport(
     code: str,
-    code_type: str = Query("auto", regex="^(iata|icao|auto)$")
+    code_type: str = Query("auto", regex="^(iata|icao|auto)$"),
+    fields: str | None = FIELDS_QUERY
 ):
-    try:
-        airport = get(code, code_type=code_type)
+    projection = _fields(fields)
 
-        if airport is None:
-            raise HTTPException(status_code=404, detail=f"Airport not found: {code}")
+    def compute():
+        try:
+            airport = get(code, code_type=code_type)
 
-        return airport.as_dict()
+            if airport is None:
+                raise HTTPException(status_code=404, detail=f"Airport not found: {code}")
 
-    except AeroNavXError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+            return RawJSONResponse(airport_json(airport, projection))
+
+        except AeroNavXError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await run_blocking(compute)
 
 
 @app.get("/distance")
@@ -44,132 +178,309 @@ async def calculate_distance(
     from_code: str = Query(..., alias="from"),
     to_code: str = Query(..., alias="to"),
     code_type: str = Query("auto", regex="^(iata|icao|auto)$"),
-    model: str = Query("haversine", regex="^(haversine|slc|vincenty)$"),
-    unit: str = Query("km", regex="^(km|mi|nmi)$")
+    model: str = Query("haversine", regex="^(haversine|slc|vincenty|karney)$"),
+    unit: str = Query("km", regex="^(km|mi|nmi)$"),
+    fields: str | None = FIELDS_QUERY
 ):
-    try:
-        from_airport = get(from_code, code_type=code_type)
-        to_airport = get(to_code, code_type=code_type)
-
-        if from_airport is None:
-            raise HTTPException(status_code=404, detail=f"Origin airport not found: {from_code}")
-
-        if to_airport is None:
-            raise HTTPException(status_code=404, detail=f"Destination airport not found: {to_code}")
-
-        dist = distance(
-            from_airport.latitude_deg,
-            from_airport.longitude_deg,
-            to_airport.latitude_deg,
-            to_airport.longitude_deg,
-            model=model,
-            unit=unit
-        )
+    projection = _fields(fields)
 
-        return {
-            "from": from_airport.as_dict(),
-            "to": to_airport.as_dict(),
-            "distance": dist,
-            "unit": unit,
-            "model": model
-        }
+    def compute():
+        try:
+            from_airport = get(from_code, code_type=code_type)
+            to_airport = get(to_code, code_type=code_type)
 
-    except AeroNavXError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+            if from_airport is None:
+                raise HTTPException(
+                    status_code=404, detail=f"Origin airport not found: {from_code}"
+                )
+
+            if to_airport is None:
+                raise HTTPException(
+                    status_code=404, detail=f"Destination airport not found: {to_code}"
+                )
+
+            dist = airport_distance(from_airport, to_airport, model=model, unit=unit)
+
+            return RawJSONResponse(compose({
+                "from": airport_json(from_airport, projection),
+                "to": airport_json(to_airport, projection),
+                "distance": dist,
+                "unit": unit,
+                "model": model
+            }))
+
+        except AeroNavXError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await run_blocking(compute)
 
 
 @app.get("/nearest")
 async def find_nearest(
     lat: float = Query(..., ge=-90, le=90),
     lon: float = Query(..., ge=-180, le=180),
-    n: int = Query(5, ge=1, le=100)
+    n: int = Query(5, ge=1, le=100),
+    fields: str | None = FIELDS_QUERY
 ):
-    try:
-        airports = nearest_airports(lat, lon, n=n)
+    projection = _fields(fields)
 
-        return {
-            "query": {"lat": lat, "lon": lon},
-            "count": len(airports),
-            "airports": [a.as_dict() for a in airports]
-        }
+    def compute():
+        try:
+            results = nearest_airports_with_distance(lat, lon, n=n)
 
-    except AeroNavXError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+            return RawJSONResponse(compose({
+                "query": {"lat": lat, "lon": lon},
+                "count": len(results),
+                "airports": airports_json(
+                    [r.airport for r in results], projection, [r.distance_km for r in results]
+                )
+            }))
+
+        except AeroNavXError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await run_blocking(compute)
 
 
 @app.get("/search")
 async def search(
     q: str = Query(..., min_length=1),
-    limit: int = Query(20, ge=1, le=100)
+    limit: int = Query(20, ge=1, le=100),
+    fields: str | None = FIELDS_QUERY
 ):
-    try:
-        airports = search_airports_by_name(q, limit=limit)
+    projection = _fields(fields)
+
+    def compute():
+        try:
+            airports = search_airports_by_name(q, limit=limit)
+
+            return RawJSONResponse(compose({
+                "query": q,
+                "count": len(airports),
+                "airports": airports_json(airports, projection)
+            }))
+
+        except AeroNavXError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await run_blocking(compute)
+
+
+@app.get("/airports")
+async def list_airports(
+    country: str | None = None,
+    region: str | None = None,
+    municipality: str | None = None,
+    types: list[str] | None = Query(None, alias="type"),
+    scheduled_only: bool = False,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = FIELDS_QUERY
+):
+    projection = _fields(fields)
+
+    def compute():
+        try:
+            page = filter_airports_page(
+                country=country,
+                region=region,
+                municipality=municipality,
+                types=types,
+                scheduled_only=scheduled_only,
+                limit=limit,
+                cursor=cursor
+            )
+
+            return RawJSONResponse(compose({
+                "count": len(page.items),
+                "airports": airports_json(page.items, projection),
+                "next_cursor": page.next_cursor
+            }))
+
+        except (AeroNavXError, ValueError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await run_blocking(compute)
+
+
+@app.get("/within-radius")
+async def within_radius(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(..., gt=0, le=20040),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = FIELDS_QUERY
+):
+    projection = _fields(fields)
 
-        return {
-            "query": q,
-            "count": len(airports),
-            "airports": [a.as_dict() for a in airports]
-        }
+    def compute():
+        try:
+            page = airports_within_radius_page(lat, lon, radius_km, limit=limit, cursor=cursor)
 
-    except AeroNavXError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+            return RawJSONResponse(compose({
+                "query": {"lat": lat, "lon": lon, "radius_km": radius_km},
+                "count": len(page.items),
+                "airports": airports_json(
+                    [r.airport for r in page.items], projection, [r.distance_km for r in page.items]
+                ),
+                "next_cursor": page.next_cursor
+            }))
+
+        except (AeroNavXError, ValueError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await run_blocking(compute)
 
 
 @app.get("/flight-time")
 async def flight_time(
     from_code: str = Query(..., alias="from"),
     to_code: str = Query(..., alias="to"),
-    speed_kts: float = Query(450.0, ge=100, le=1000)
+    speed_kts: float = Query(450.0, ge=100, le=1000),
+    fields: str | None = FIELDS_QUERY
 ):
-    try:
-        from_airport = get(from_code, code_type="auto")
-        to_airport = get(to_code, code_type="auto")
+    projection = _fields(fields)
 
-        if from_airport is None:
-            raise HTTPException(status_code=404, detail=f"Origin airport not found: {from_code}")
+    def compute():
+        try:
+            from_airport = get(from_code, code_type="auto")
+            to_airport = get(to_code, code_type="auto")
 
-        if to_airport is None:
-            raise HTTPException(status_code=404, detail=f"Destination airport not found: {to_code}")
+            if from_airport is None:
+                raise HTTPException(
+                    status_code=404, detail=f"Origin airport not found: {from_code}"
+                )
 
-        time_hours = estimate_flight_time_hours(from_airport, to_airport, speed_kts=speed_kts)
+            if to_airport is None:
+                raise HTTPException(
+                    status_code=404, detail=f"Destination airport not found: {to_code}"
+                )
 
-        hours = int(time_hours)
-        minutes = int((time_hours - hours) * 60)
+            time_hours = estimate_flight_time_hours(from_airport, to_airport, speed_kts=speed_kts)
 
-        return {
-            "from": from_airport.as_dict(),
-            "to": to_airport.as_dict(),
-            "speed_kts": speed_kts,
-            "time_hours": time_hours,
-            "time_formatted": f"{hours}h {minutes}m"
-        }
+            hours = int(time_hours)
+            minutes = int((time_hours - hours) * 60)
 
-    except AeroNavXError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+            return RawJSONResponse(compose({
+                "from": airport_json(from_airport, projection),
+                "to": airport_json(to_airport, projection),
+                "speed_kts": speed_kts,
+                "time_hours": time_hours,
+                "time_formatted": f"{hours}h {minutes}m"
+            }))
+
+        except AeroNavXError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await run_blocking(compute)
 
 
 @app.get("/emissions")
 async def emissions(
     from_code: str = Query(..., alias="from"),
     to_code: str = Query(..., alias="to"),
-    model: str = Query("haversine", regex="^(haversine|slc|vincenty)$")
+    model: str = Query("haversine", regex="^(haversine|slc|vincenty|karney)$"),
+    fields: str | None = FIELDS_QUERY
 ):
+    projection = _fields(fields)
+
+    def compute():
+        try:
+            co2_kg = estimate_co2_kg_by_codes(from_code, to_code, code_type="auto", model=model)
+
+            from_airport = get(from_code, code_type="auto")
+            to_airport = get(to_code, code_type="auto")
+
+            return RawJSONResponse(compose({
+                "from": airport_json(from_airport, projection),
+                "to": airport_json(to_airport, projection),
+                "co2_kg_per_passenger": co2_kg,
+                "model": model
+            }))
+
+        except AeroNavXError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await run_blocking(compute)
+
+
+class PairBatchRequest(BaseModel):
+    pairs: list[tuple[str, str]]
+    code_type: Literal["iata", "icao", "auto"] = "auto"
+    model: Literal["haversine", "slc", "vincenty", "karney"] = "haversine"
+
+
+class DistanceBatchRequest(PairBatchRequest):
+    unit: Literal["km", "mi", "nmi"] = "km"
+
+
+class FlightTimeBatchRequest(PairBatchRequest):
+    speed_kts: float = Field(450.0, ge=100, le=1000)
+
+
+def _check_batch_size(request: PairBatchRequest) -> None:
+    if len(request.pairs) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {len(request.pairs)} pairs exceeds the limit of {MAX_BATCH_SIZE}"
+        )
+
+
+def _batch_response(batch: PairBatch, column: str, **extra):
+    # Columnar: one array per field, aligned with request.pairs; failed pairs are null
+    return {
+        "count": len(batch.values),
+        "model": batch.model,
+        **extra,
+        column: batch.values,
+        "errors": [{"index": i, "error": message} for i, message in sorted(batch.errors.items())],
+    }
+
+
+@app.post("/distance/batch")
+async def calculate_distance_batch(request: DistanceBatchRequest):
+    _check_batch_size(request)
+
     try:
-        co2_kg = estimate_co2_kg_by_codes(from_code, to_code, code_type="auto", model=model)
+        batch = await run_blocking(
+            batch_distances, request.pairs, model=request.model, unit=request.unit,
+            code_type=request.code_type
+        )
+    except AeroNavXError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        from_airport = get(from_code, code_type="auto")
-        to_airport = get(to_code, code_type="auto")
+    return _batch_response(batch, "distance", unit=batch.unit)
 
-        return {
-            "from": from_airport.as_dict(),
-            "to": to_airport.as_dict(),
-            "co2_kg_per_passenger": co2_kg,
-            "model": model
-        }
 
+@app.post("/flight-time/batch")
+async def flight_time_batch(request: FlightTimeBatchRequest):
+    _check_batch_size(request)
+
+    try:
+        batch = await run_blocking(
+            batch_flight_times, request.pairs, speed_kts=request.speed_kts,
+            model=request.model, code_type=request.code_type
+        )
+    except AeroNavXError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return _batch_response(batch, "time_hours", speed_kts=request.speed_kts)
+
+
+@app.post("/emissions/batch")
+async def emissions_batch(request: PairBatchRequest):
+    _check_batch_size(request)
+
+    try:
+        batch = await run_blocking(
+            batch_emissions, request.pairs, model=request.model, code_type=request.code_type
+        )
     except AeroNavXError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    return _batch_response(batch, "co2_kg_per_passenger")
+
 
 def run_server(host: str = "0.0.0.0", port: int = 8000):
     import uvicorn
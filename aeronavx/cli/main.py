@@ -3,9 +3,9 @@ import sys
 
 from ..core.airports import get
 from ..core.distance import distance
-from ..core.search import nearest_airports, search_airports_by_name
 from ..core.emissions import estimate_co2_kg_by_codes
 from ..core.routing import estimate_flight_time_hours, route_distance_by_codes
+from ..core.search import nearest_airports_with_distance, search_airports_by_name
 from ..exceptions import AeroNavXError
 
 
@@ -43,15 +43,16 @@ def cmd_distance(args):
 
 def cmd_nearest(args):
     try:
-        airports = nearest_airports(args.lat, args.lon, n=args.n)
+        results = nearest_airports_with_distance(args.lat, args.lon, n=args.n)
 
-        if not airports:
+        if not results:
             print("No airports found")
             return 0
 
-        print(f"Nearest {len(airports)} airport(s) to ({args.lat}, {args.lon}):\n")
+        print(f"Nearest {len(results)} airport(s) to ({args.lat}, {args.lon}):\n")
 
-        for i, airport in enumerate(airports, 1):
+        for i, result in enumerate(results, 1):
+            airport = result.airport
             codes = []
             if airport.iata_code:
                 codes.append(f"IATA: {airport.iata_code}")
@@ -60,14 +61,8 @@ def cmd_nearest(args):
 
             code_str = f" ({', '.join(codes)})" if codes else ""
 
-            dist_km = distance(
-                args.lat, args.lon,
-                airport.latitude_deg, airport.longitude_deg,
-                unit="km"
-            )
-
             print(f"{i}. {airport.name}{code_str}")
-            print(f"   Distance: {dist_km:.2f} km")
+            print(f"   Distance: {result.distance_km:.2f} km")
             print(f"   Location: {airport.municipality}, {airport.iso_country}")
             print()
 
@@ -172,10 +167,19 @@ def main():
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     distance_parser = subparsers.add_parser("distance", help="Calculate distance between airports")
-    distance_parser.add_argument("--from", dest="from_code", required=True, help="Origin airport code")
-    distance_parser.add_argument("--to", dest="to_code", required=True, help="Destination airport code")
-    distance_parser.add_argument("--unit", choices=["km", "mi", "nmi"], default="km", help="Distance unit")
-    distance_parser.add_argument("--model", choices=["haversine", "slc", "vincenty"], default="haversine", help="Distance model")
+    distance_parser.add_argument(
+        "--from", dest="from_code", required=True, help="Origin airport code"
+    )
+    distance_parser.add_argument(
+        "--to", dest="to_code", required=True, help="Destination airport code"
+    )
+    distance_parser.add_argument(
+        "--unit", choices=["km", "mi", "nmi"], default="km", help="Distance unit"
+    )
+    distance_parser.add_argument(
+        "--model", choices=["haversine", "slc", "vincenty", "karney"], default="haversine",
+        help="Distance model"
+    )
 
     nearest_parser = subparsers.add_parser("nearest", help="Find nearest airports to coordinates")
     nearest_parser.add_argument("--lat", type=float, required=True, help="Latitude")
@@ -187,9 +191,16 @@ def main():
     search_parser.add_argument("--limit", type=int, default=10, help="Maximum results")
 
     emissions_parser = subparsers.add_parser("emissions", help="Estimate CO2 emissions")
-    emissions_parser.add_argument("--from", dest="from_code", required=True, help="Origin airport code")
-    emissions_parser.add_argument("--to", dest="to_code", required=True, help="Destination airport code")
-    emissions_parser.add_argument("--model", choices=["haversine", "slc", "vincenty"], default="haversine", help="Distance model")
+    emissions_parser.add_argument(
+        "--from", dest="from_code", required=True, help="Origin airport code"
+    )
+    emissions_parser.add_argument(
+        "--to", dest="to_code", required=True, help="Destination airport code"
+    )
+    emissions_parser.add_argument(
+        "--model", choices=["haversine", "slc", "vincenty", "karney"], default="haversine",
+        help="Distance model"
+    )
 
     time_parser = subparsers.add_parser("flight-time", help="Estimate flight time")
     time_parser.add_argument("--from", dest="from_code", required=True, help="Origin airport code")
@@ -1,52 +1,153 @@
-from .airports import get, get_by_iata, get_by_icao, all, search_by_name, nearby
-from .distance import distance, distance_km, distance_mi, distance_nmi
-from .geodesy import initial_bearing, final_bearing, midpoint, intermediate_point, great_circle_path
-from .search import (
-    search_airports_by_name,
-    filter_airports,
-    airports_in_country,
-    airports_in_region,
-    nearest_airports,
-    airports_within_radius,
-    nearest_airport_to_point,
-    nearest_airport_to_airport,
-)
-from .routing import (
-    estimate_flight_time_hours,
-    estimate_flight_time_h_m,
-    route_distance,
-    route_distance_by_codes,
-    shortest_path,
+from .aggregation import (
+    AirportTable,
+    clear_aggregation_cache,
+    get_airport_table,
+    group_by,
+    top_n,
+    top_n_per_group,
 )
+from .airports import all, get, get_by_iata, get_by_icao, get_many, nearby, search_by_name
 from .analytics import (
-    airports_per_country,
     airports_per_continent,
+    airports_per_country,
     airports_per_type,
+    airports_with_scheduled_service,
+    country_centroids,
+    get_precomputed_neighbors,
     highest_elevation_airports,
+    highest_elevation_airports_per_country,
+    load_precomputed_neighbors,
+    longest_pairs_per_country,
     lowest_elevation_airports,
-    country_centroids,
     precompute_nearest_neighbors,
-    get_precomputed_neighbors,
+    save_precomputed_neighbors,
     total_airports,
-    airports_with_scheduled_service,
 )
+from .batch import (
+    PairBatch,
+    batch_distances,
+    batch_emissions,
+    batch_flight_times,
+)
+from .distance import (
+    PairDistanceCache,
+    SolverStats,
+    airport_distance,
+    clear_pair_cache,
+    distance,
+    distance_arrays,
+    distance_km,
+    distance_mi,
+    distance_nmi,
+    enable_solver_stats,
+    get_pair_cache_stats,
+    get_solver_stats,
+    karney_km,
+    karney_km_arrays,
+    reset_solver_stats,
+    set_pair_cache_size,
+    vincenty_direct,
+    vincenty_direct_arrays,
+    vincenty_km_arrays,
+)
+from .emissions import (
+    estimate_co2_kg_by_codes,
+    estimate_co2_kg_for_route,
+    estimate_co2_kg_for_segment,
+    estimate_co2_kg_route_by_codes,
+)
+from .geodesy import (
+    along_track_distance_km,
+    cross_track_distance_km,
+    densify,
+    densify_route,
+    destination_point,
+    destination_points,
+    distance_to_segment_km,
+    final_bearing,
+    final_bearings,
+    great_circle_path,
+    great_circle_path_arrays,
+    initial_and_final_bearings,
+    initial_bearing,
+    initial_bearings,
+    intermediate_point,
+    intermediate_points,
+    iter_great_circle_path,
+    midpoint,
+    midpoints,
+    range_ring,
+    range_rings,
+)
+from .incremental import AnalyticsSnapshot, get_analytics_snapshot
+from .metar import (
+    DecodedReport,
+    decode_columns,
+    decode_report,
+    decode_reports,
+    flight_category,
+)
+from .routing import (
+    estimate_flight_time_h_m,
+    estimate_flight_time_hours,
+    route_distance,
+    route_distance_by_codes,
+    shortest_path,
+)
+from .search import (
+    airports_along_route,
+    airports_in_bbox,
+    airports_in_country,
+    airports_in_polygon,
+    airports_in_region,
+    airports_near_track,
+    airports_within_radius,
+    airports_within_radius_page,
+    airports_within_radius_with_distance,
+    filter_airports,
+    filter_airports_page,
+    nearest_airport_to_airport,
+    nearest_airport_to_point,
+    nearest_airports,
+    nearest_airports_with_distance,
+    search_airports_by_name,
+)
+from .tiles import TileNearestCache, tile_bounds, tile_for_point
 from .timezone import (
+    TimezoneColumn,
+    get_timezone_column,
     get_timezone_for_airport,
     get_timezone_for_code,
     local_time_for_airport,
     local_time_for_code,
+    local_times,
+    precompute_timezones,
+    utc_offsets,
 )
-from .emissions import (
-    estimate_co2_kg_for_segment,
-    estimate_co2_kg_for_route,
-    estimate_co2_kg_by_codes,
-    estimate_co2_kg_route_by_codes,
+from .weather import (
+    StationReportTable,
+    WeatherCache,
+    WeatherCacheStats,
+    WeatherClient,
+    clear_station_table,
+    clear_weather_cache,
+    cycle_url,
+    get_decoded_metar,
+    get_decoded_metars,
+    get_metar,
+    get_metars,
+    get_station_table,
+    get_taf,
+    get_tafs,
+    get_weather_cache,
+    get_weather_cache_stats,
+    ingest_cycle,
+    set_weather_base_url,
 )
-from .weather import get_metar, get_taf
-
 
 __all__ = [
     "get",
+    "get_many",
     "get_by_iata",
     "get_by_icao",
     "all",
@@ -56,42 +157,126 @@ __all__ = [
     "distance_km",
     "distance_mi",
     "distance_nmi",
+    "vincenty_direct",
+    "vincenty_direct_arrays",
+    "karney_km",
+    "karney_km_arrays",
+    "vincenty_km_arrays",
+    "distance_arrays",
+    "SolverStats",
+    "enable_solver_stats",
+    "get_solver_stats",
+    "reset_solver_stats",
+    "PairDistanceCache",
+    "airport_distance",
+    "get_pair_cache_stats",
+    "clear_pair_cache",
+    "set_pair_cache_size",
     "initial_bearing",
     "final_bearing",
     "midpoint",
     "intermediate_point",
+    "destination_point",
+    "destination_points",
+    "range_ring",
+    "range_rings",
+    "cross_track_distance_km",
+    "along_track_distance_km",
+    "distance_to_segment_km",
+    "initial_bearings",
+    "final_bearings",
+    "initial_and_final_bearings",
+    "midpoints",
+    "intermediate_points",
     "great_circle_path",
+    "great_circle_path_arrays",
+    "iter_great_circle_path",
+    "densify",
+    "densify_route",
     "search_airports_by_name",
     "filter_airports",
+    "filter_airports_page",
     "airports_in_country",
     "airports_in_region",
     "nearest_airports",
+    "nearest_airports_with_distance",
     "airports_within_radius",
+    "airports_within_radius_with_distance",
+    "airports_within_radius_page",
+    "airports_in_bbox",
+    "airports_in_polygon",
+    "airports_along_route",
+    "airports_near_track",
     "nearest_airport_to_point",
     "nearest_airport_to_airport",
+    "TileNearestCache",
+    "tile_for_point",
+    "tile_bounds",
     "estimate_flight_time_hours",
     "estimate_flight_time_h_m",
     "route_distance",
     "route_distance_by_codes",
     "shortest_path",
+    "AirportTable",
+    "group_by",
+    "top_n",
+    "top_n_per_group",
+    "get_airport_table",
+    "clear_aggregation_cache",
+    "AnalyticsSnapshot",
+    "get_analytics_snapshot",
     "airports_per_country",
     "airports_per_continent",
     "airports_per_type",
     "highest_elevation_airports",
     "lowest_elevation_airports",
+    "highest_elevation_airports_per_country",
+    "longest_pairs_per_country",
     "country_centroids",
     "precompute_nearest_neighbors",
+    "save_precomputed_neighbors",
+    "load_precomputed_neighbors",
     "get_precomputed_neighbors",
     "total_airports",
     "airports_with_scheduled_service",
+    "TimezoneColumn",
+    "get_timezone_column",
+    "precompute_timezones",
     "get_timezone_for_airport",
     "get_timezone_for_code",
     "local_time_for_airport",
     "local_time_for_code",
+    "utc_offsets",
+    "local_times",
     "estimate_co2_kg_for_segment",
     "estimate_co2_kg_for_route",
     "estimate_co2_kg_by_codes",
     "estimate_co2_kg_route_by_codes",
+    "WeatherCache",
+    "WeatherCacheStats",
+    "PairBatch",
+    "batch_distances",
+    "batch_flight_times",
+    "batch_emissions",
+    "DecodedReport",
+    "decode_report",
+    "decode_reports",
+    "decode_columns",
+    "flight_category",
+    "StationReportTable",
+    "WeatherClient",
+    "clear_station_table",
+    "clear_weather_cache",
+    "cycle_url",
+    "get_decoded_metar",
+    "get_decoded_metars",
     "get_metar",
     "get_taf",
+    "get_metars",
+    "get_tafs",
+    "get_weather_cache",
+    "get_station_table",
+    "get_weather_cache_stats",
+    "ingest_cycle",
+    "set_weather_base_url",
 ]
@@ -0,0 +1,402 @@
+import heapq
+import math
+from collections.abc import Sequence
+from typing import Any, Literal
+
+from ..core.loader import get_all_airports, get_dataset_version
+from ..utils.cache import BoundedCache
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+AggregateFunc = Literal["count", "sum", "mean", "min", "max", "centroid"]
+
+_AGGREGATE_FUNCS = ("count", "sum", "mean", "min", "max", "centroid")
+
+_results = BoundedCache(maxsize=256)
+_table: "AirportTable | None" = None
+
+
+def _is_missing(value: Any) -> bool:
+    # Group keys are strings or booleans: a False key is a real group
+    return value is None or value == ""
+
+
+class AirportTable:
+    """
+    Columnar view of the loaded airports for one dataset version.
+
+    Categorical columns are dictionary-encoded to integer codes (-1 for
+    missing values, i.e. None or "") and numeric columns are float arrays (NaN for missing),
+    both built on first use and kept for the lifetime of the version.
+    """
+
+    def __init__(self, airports: list, version: int):
+        self.airports = airports
+        self.version = version
+        self._codes: dict[str, tuple[Any, list]] = {}
+        self._numeric: dict[str, Any] = {}
+        self._orders: dict[tuple, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.airports)
+
+    def codes(self, column: str) -> tuple[Any, list]:
+        """
+        Return (codes, labels) for a categorical column.
+        """
+        if column not in self._codes:
+            labels: list = []
+            lookup: dict = {}
+            codes = []
+            for airport in self.airports:
+                value = getattr(airport, column)
+                if _is_missing(value):
+                    codes.append(-1)
+                    continue
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(labels)
+                    labels.append(value)
+                codes.append(code)
+
+            self._codes[column] = (np.array(codes, dtype=np.int64), labels)
+
+        return self._codes[column]
+
+    def numeric(self, column: str) -> Any:
+        if column not in self._numeric:
+            values = [getattr(a, column) for a in self.airports]
+            self._numeric[column] = np.array(
+                [math.nan if v is None else v for v in values], dtype=np.float64
+            )
+
+        return self._numeric[column]
+
+    def order(self, column: str, largest: bool) -> Any:
+        """
+        Row ids with a value in column, sorted by it (stable, so ties keep row order).
+        """
+        key = (column, largest)
+        if key not in self._orders:
+            values = self.numeric(column)
+            rows = np.flatnonzero(~np.isnan(values))
+            sort_values = -values[rows] if largest else values[rows]
+            self._orders[key] = rows[np.argsort(sort_values, kind="stable")]
+
+        return self._orders[key]
+
+    def group_order(self, column: str, by: str, largest: bool) -> tuple[Any, Any]:
+        """
+        Return (rows, starts): rows ordered by group of `by`, then by column,
+        and the offset where each group starts.
+        """
+        key = (column, by, largest)
+        if key not in self._orders:
+            rows = self.order(column, largest)
+            codes = self.codes(by)[0][rows]
+            rows = rows[codes >= 0]
+            codes = codes[codes >= 0]
+            # Stable sort by group keeps the value order inside each group
+            by_group = np.argsort(codes, kind="stable")
+            rows = rows[by_group]
+            codes = codes[by_group]
+            starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else codes
+            self._orders[key] = (rows, starts)
+
+        return self._orders[key]
+
+
+def get_airport_table() -> AirportTable:
+    global _table
+
+    version = get_dataset_version()
+    if _table is None or _table.version != version:
+        _table = AirportTable(get_all_airports(), version)
+
+    return _table
+
+
+def _parse_aggregates(aggregates: dict[str, Any]) -> tuple[tuple[str, str, str | None], ...]:
+    specs = []
+    for name, spec in aggregates.items():
+        func, column = (spec, None) if isinstance(spec, str) else spec
+
+        if func not in _AGGREGATE_FUNCS:
+            raise ValueError(f"Unknown aggregate function: {func}")
+        if func in ("sum", "mean", "min", "max") and column is None:
+            raise ValueError(f"Aggregate {name!r} needs a column for {func}")
+
+        specs.append((name, func, column))
+
+    if not specs:
+        raise ValueError("At least one aggregate is required")
+
+    return tuple(specs)
+
+
+def group_by(by: str | Sequence[str], **aggregates: Any) -> dict[Any, dict[str, Any]]:
+    """
+    Group the loaded airports by categorical columns and aggregate each group.
+
+    All aggregates are computed together, and results are cached per dataset
+    version, so repeated calls are dictionary lookups until the data changes.
+    Airports with a missing value (None or an empty string, as in the
+    incremental analytics) in any grouping column are left out; missing
+    numeric values are ignored by sum, mean, min and max.
+
+    Args:
+        by: Airport attribute, or sequence of attributes, to group by
+        **aggregates: name=(func, column) with func one of sum, mean, min, max,
+            or name="count" / name="centroid" (spherical mean of positions)
+
+    Returns:
+        Mapping of group key (a value, or a tuple for several columns) to a
+        dict of aggregate name -> value. Empty means and extrema are None and
+        a centroid is a (lat, lon) tuple.
+
+    Example:
+        >>> load_airports(data_path="aeronavx/data/airports_minimal.csv")
+        >>> group_by("iso_country", n="count", elev=("mean", "elevation_ft"))["US"]
+        {'n': 2, 'elev': 69.0}
+    """
+    columns = (by,) if isinstance(by, str) else tuple(by)
+    if not columns:
+        raise ValueError("At least one group-by column is required")
+
+    specs = _parse_aggregates(aggregates)
+    table = get_airport_table()
+
+    cache_key = (table.version, columns, specs)
+    result = _results.get(cache_key)
+
+    if result is None:
+        if HAS_NUMPY:
+            result = _group_by_numpy(table, columns, specs)
+        else:
+            result = _group_by_python(table.airports, columns, specs)
+        _results.set(cache_key, result)
+
+    return {key: dict(values) for key, values in result.items()}
+
+
+def _group_by_numpy(table: AirportTable, columns: tuple[str, ...], specs) -> dict:
+    combined = np.zeros(len(table), dtype=np.int64)
+    valid = np.ones(len(table), dtype=bool)
+    all_labels = []
+
+    for column in columns:
+        codes, labels = table.codes(column)
+        combined = combined * max(len(labels), 1) + codes
+        valid &= codes >= 0
+        all_labels.append(labels)
+
+    rows = np.flatnonzero(valid)
+    groups, inverse = np.unique(combined[rows], return_inverse=True)
+    n_groups = len(groups)
+
+    keys = []
+    for code in groups.tolist():
+        parts = []
+        for labels in reversed(all_labels):
+            code, part = divmod(code, max(len(labels), 1))
+            parts.append(labels[part])
+        parts.reverse()
+        keys.append(parts[0] if len(parts) == 1 else tuple(parts))
+
+    columns_out = {}
+    centroid = None
+
+    for name, func, column in specs:
+        if func == "count":
+            columns_out[name] = np.bincount(inverse, minlength=n_groups).tolist()
+            continue
+
+        if func == "centroid":
+            if centroid is None:
+                lat = np.radians(table.numeric("latitude_deg")[rows])
+                lon = np.radians(table.numeric("longitude_deg")[rows])
+                cos_lat = np.cos(lat)
+                x = np.bincount(inverse, weights=cos_lat * np.cos(lon), minlength=n_groups)
+                y = np.bincount(inverse, weights=cos_lat * np.sin(lon), minlength=n_groups)
+                z = np.bincount(inverse, weights=np.sin(lat), minlength=n_groups)
+                centroid = [
+                    _vector_to_latlon(*v) for v in zip(x.tolist(), y.tolist(), z.tolist())
+                ]
+            columns_out[name] = centroid
+            continue
+
+        values = table.numeric(column)[rows]
+        present = ~np.isnan(values)
+        group_of = inverse[present]
+        values = values[present]
+        counts = np.bincount(group_of, minlength=n_groups)
+
+        if func in ("sum", "mean"):
+            sums = np.bincount(group_of, weights=values, minlength=n_groups)
+            if func == "sum":
+                out = sums
+            else:
+                out = np.divide(sums, counts, out=np.full(n_groups, np.nan), where=counts > 0)
+        else:
+            reduce = np.minimum if func == "min" else np.maximum
+            out = np.full(n_groups, np.inf if func == "min" else -np.inf)
+            reduce.at(out, group_of, values)
+
+        columns_out[name] = [
+            None if count == 0 and func != "sum" else value
+            for value, count in zip(out.tolist(), counts.tolist())
+        ]
+
+    return {
+        key: {name: columns_out[name][i] for name, _, _ in specs}
+        for i, key in enumerate(keys)
+    }
+
+
+def _group_by_python(airports: list, columns: tuple[str, ...], specs) -> dict:
+    groups: dict[Any, dict] = {}
+
+    for airport in airports:
+        parts = tuple(getattr(airport, column) for column in columns)
+        if any(_is_missing(part) for part in parts):
+            continue
+
+        key = parts[0] if len(parts) == 1 else parts
+        state = groups.get(key)
+        if state is None:
+            state = groups[key] = {name: _initial(func) for name, func, _ in specs}
+
+        for name, func, column in specs:
+            if func == "count":
+                state[name] += 1
+            elif func == "centroid":
+                lat = math.radians(airport.latitude_deg)
+                lon = math.radians(airport.longitude_deg)
+                acc = state[name]
+                acc[0] += math.cos(lat) * math.cos(lon)
+                acc[1] += math.cos(lat) * math.sin(lon)
+                acc[2] += math.sin(lat)
+            else:
+                value = getattr(airport, column)
+                if value is None:
+                    continue
+                acc = state[name]
+                if func in ("sum", "mean"):
+                    acc[0] += value
+                    acc[1] += 1
+                elif func == "min":
+                    state[name] = value if acc is None else min(acc, value)
+                else:
+                    state[name] = value if acc is None else max(acc, value)
+
+    for state in groups.values():
+        for name, func, _ in specs:
+            if func == "centroid":
+                state[name] = _vector_to_latlon(*state[name])
+            elif func == "sum":
+                state[name] = state[name][0]
+            elif func == "mean":
+                total, count = state[name]
+                state[name] = total / count if count else None
+
+    return groups
+
+
+def _initial(func: str) -> Any:
+    if func == "count":
+        return 0
+    if func == "centroid":
+        return [0.0, 0.0, 0.0]
+    if func in ("sum", "mean"):
+        return [0.0, 0]
+    return None
+
+
+def _vector_to_latlon(x: float, y: float, z: float) -> tuple[float, float] | None:
+    # Directions cancel out (e.g. two antipodal airports): no meaningful centroid
+    if math.sqrt(x * x + y * y + z * z) < 1e-9:
+        return None
+
+    return (math.degrees(math.atan2(z, math.hypot(x, y))), math.degrees(math.atan2(y, x)))
+
+
+def top_n(column: str, n: int = 10, largest: bool = True) -> list:
+    """
+    Return the n airports with the largest (or smallest) value in a numeric column.
+
+    Airports without a value are skipped and ties keep dataset order. With
+    numpy the sort order is built once per dataset version, so each later
+    call only slices it; without numpy heapq selects the n items in one pass.
+
+    Example:
+        >>> [a.name for a in top_n("elevation_ft", 3)]
+    """
+    if n < 0:
+        raise ValueError(f"n must be non-negative, got {n}")
+
+    table = get_airport_table()
+
+    if HAS_NUMPY:
+        return [table.airports[i] for i in table.order(column, largest)[:n].tolist()]
+
+    select = heapq.nlargest if largest else heapq.nsmallest
+    with_value = (a for a in table.airports if getattr(a, column) is not None)
+    return select(n, with_value, key=lambda a: getattr(a, column))
+
+
+def top_n_per_group(column: str, by: str, n: int = 10, largest: bool = True) -> dict[Any, list]:
+    """
+    Return the top n airports by a numeric column within each group of `by`.
+
+    Example:
+        >>> top_n_per_group("elevation_ft", "iso_country", n=3)["TR"]
+    """
+    if n < 0:
+        raise ValueError(f"n must be non-negative, got {n}")
+
+    table = get_airport_table()
+
+    if HAS_NUMPY:
+        rows, starts = table.group_order(column, by, largest)
+        ends = np.r_[starts[1:], len(rows)].astype(np.int64)
+        airports = table.airports
+        return {
+            getattr(airports[rows[start]], by): [
+                airports[i] for i in rows[start:min(start + n, end)].tolist()
+            ]
+            for start, end in zip(starts.tolist(), ends.tolist())
+        }
+
+    # One pass with a bounded heap per group; the row id breaks ties in dataset order
+    sign = 1 if largest else -1
+    heaps: dict[Any, list] = {}
+    for row, airport in enumerate(table.airports):
+        group = getattr(airport, by)
+        value = getattr(airport, column)
+        if _is_missing(group) or value is None:
+            continue
+
+        heap = heaps.setdefault(group, [])
+        item = (sign * value, -row)
+        if len(heap) < n:
+            heapq.heappush(heap, item)
+        elif n and item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    return {
+        group: [table.airports[-neg_row] for _, neg_row in sorted(heap, reverse=True)]
+        for group, heap in heaps.items()
+    }
+
+
+def clear_aggregation_cache() -> None:
+    global _table
+
+    _results.clear()
+    _table = None
@@ -1,16 +1,20 @@
+from collections.abc import Iterable
 from typing import Literal
 
-from ..models.airport import Airport
 from ..core.loader import (
     get_airport_by_iata,
     get_airport_by_icao,
+)
+from ..core.loader import (
     get_all_airports as loader_get_all,
 )
 from ..core.search import (
-    search_airports_by_name as search_by_name_impl,
     airports_within_radius as nearby_impl,
 )
-
+from ..core.search import (
+    search_airports_by_name as search_by_name_impl,
+)
+from ..models.airport import Airport
 
 CodeType = Literal["iata", "icao", "auto"]
 
@@ -29,6 +33,15 @@ def get(code: str, code_type: CodeType = "auto") -> Airport | None:
         raise ValueError(f"Invalid code_type: {code_type}. Must be 'iata', 'icao', or 'auto'")
 
 
+def get_many(codes: Iterable[str], code_type: CodeType = "auto") -> list[Airport | None]:
+    """
+    Resolve many codes at once; each distinct code is looked up only once.
+    """
+    codes = list(codes)
+    resolved = {code: get(code, code_type) for code in dict.fromkeys(codes)}
+    return [resolved[code] for code in codes]
+
+
 def get_by_iata(code: str) -> Airport | None:
     return get_airport_by_iata(code)
 
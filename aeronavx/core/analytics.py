@@ -1,137 +1,223 @@
+import heapq
 from collections import defaultdict
-from typing import Optional
-
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any, TypeVar
+
+from ..core.aggregation import group_by, top_n, top_n_per_group
+from ..core.distance import haversine_km
+from ..core.incremental import get_analytics_snapshot
+from ..core.loader import (
+    get_airport_by_iata,
+    get_airport_by_icao,
+    get_airport_row,
+    get_all_airports,
+    get_dataset_fingerprint,
+    get_dataset_version,
+)
+from ..core.search import get_spatial_index
+from ..exceptions import DataLoadError
 from ..models.airport import Airport
-from ..core.loader import get_all_airports
-from ..core.search import nearest_airports
-
+from ..utils.neighbor_graph import NeighborGraph
+from ..utils.result_cache import NEIGHBOR_GRAPH_CODEC, Codec, get_result_cache
 
-_precomputed_neighbors: Optional[dict[str, list[Airport]]] = None
+T = TypeVar('T')
 
+_precomputed_neighbors: NeighborGraph | None = None
+_precomputed_version: int | None = None
 
-def airports_per_country() -> dict[str, int]:
-    airports = get_all_airports()
-    counts = defaultdict(int)
 
-    for airport in airports:
-        if airport.iso_country:
-            counts[airport.iso_country] += 1
+def _disk_cached(
+    function: str, params: dict[str, Any], compute: Callable[[], T], codec: Codec
+) -> T:
+    cache = get_result_cache()
+    if cache is None:
+        return compute()
 
-    return dict(counts)
+    return cache.get_or_compute(get_dataset_fingerprint(), function, params, compute, codec)
 
 
-def airports_per_continent() -> dict[str, int]:
-    airports = get_all_airports()
-    counts = defaultdict(int)
+def airports_per_country() -> dict[str, int]:
+    return dict(get_analytics_snapshot().per_country)
 
-    for airport in airports:
-        if airport.continent:
-            counts[airport.continent] += 1
 
-    return dict(counts)
+def airports_per_continent() -> dict[str, int]:
+    return dict(get_analytics_snapshot().per_continent)
 
 
 def airports_per_type() -> dict[str, int]:
-    airports = get_all_airports()
-    counts = defaultdict(int)
+    return dict(get_analytics_snapshot().per_type)
 
-    for airport in airports:
-        if airport.type:
-            counts[airport.type] += 1
 
-    return dict(counts)
+def highest_elevation_airports(n: int = 10) -> list[Airport]:
+    return top_n("elevation_ft", n, largest=True)
 
 
-def highest_elevation_airports(n: int = 10) -> list[Airport]:
-    airports = get_all_airports()
+def lowest_elevation_airports(n: int = 10) -> list[Airport]:
+    return top_n("elevation_ft", n, largest=False)
 
-    airports_with_elevation = [
-        a for a in airports if a.elevation_ft is not None
-    ]
 
-    airports_with_elevation.sort(key=lambda a: a.elevation_ft, reverse=True)
+def highest_elevation_airports_per_country(n: int = 3) -> dict[str, list[Airport]]:
+    return top_n_per_group("elevation_ft", "iso_country", n, largest=True)
 
-    return airports_with_elevation[:n]
 
+def longest_pairs_per_country(
+    n: int = 1,
+    types: Sequence[str] | None = ("large_airport",),
+) -> dict[str, list[tuple[Airport, Airport, float]]]:
+    """
+    Return the n most distant airport pairs inside each country.
 
-def lowest_elevation_airports(n: int = 10) -> list[Airport]:
-    airports = get_all_airports()
+    Every pair within a country is scored, so restrict `types` for countries
+    with many airports; the n longest are kept with a heap instead of sorting
+    all pairs.
 
-    airports_with_elevation = [
-        a for a in airports if a.elevation_ft is not None
-    ]
+    Returns:
+        Mapping of country to [(airport, airport, distance_km), ...], longest first
+    """
+    if n < 0:
+        raise ValueError(f"n must be non-negative, got {n}")
 
-    airports_with_elevation.sort(key=lambda a: a.elevation_ft)
+    by_country = defaultdict(list)
+    for airport in get_all_airports():
+        if airport.iso_country and (types is None or airport.type in types):
+            by_country[airport.iso_country].append(airport)
 
-    return airports_with_elevation[:n]
+    result = {}
+    for country, airports in by_country.items():
+        pairs = (
+            (haversine_km(a.latitude_deg, a.longitude_deg, b.latitude_deg, b.longitude_deg), i, j)
+            for i, a in enumerate(airports)
+            for j, b in enumerate(airports[i + 1:], i + 1)
+        )
+        longest = heapq.nlargest(n, pairs)
+        if longest:
+            result[country] = [(airports[i], airports[j], d) for d, i, j in longest]
 
+    return result
 
-def country_centroids() -> dict[str, tuple[float, float]]:
-    airports = get_all_airports()
 
-    country_coords = defaultdict(list)
+def country_centroids() -> dict[str, tuple[float, float]]:
+    """
+    Return the spherical-mean position of each country's airports.
 
-    for airport in airports:
-        if airport.iso_country:
-            country_coords[airport.iso_country].append(
-                (airport.latitude_deg, airport.longitude_deg)
-            )
+    Positions are averaged as unit vectors, so countries spanning the
+    antimeridian (e.g. FJ) are not pulled towards longitude 0.
+    """
+    return dict(get_analytics_snapshot().country_centroids)
 
-    centroids = {}
 
-    for country, coords in country_coords.items():
-        avg_lat = sum(lat for lat, _ in coords) / len(coords)
-        avg_lon = sum(lon for _, lon in coords) / len(coords)
-        centroids[country] = (avg_lat, avg_lon)
+def precompute_nearest_neighbors(k: int = 5, workers: int = -1) -> NeighborGraph:
+    """
+    Precompute the k nearest neighbours of every airport.
 
-    return centroids
+    The graph is built with one batched spatial-index query and stored in CSR
+    form keyed by row id, so get_precomputed_neighbors is a constant-time slice.
+    When the on-disk result cache is enabled, a graph built earlier for the
+    same data and k is loaded instead of recomputed.
 
+    Args:
+        k: Number of neighbours per airport
+        workers: Threads used for the tree query (-1 uses all cores)
 
-def precompute_nearest_neighbors(k: int = 5) -> dict[str, list[Airport]]:
-    global _precomputed_neighbors
+    Returns:
+        The precomputed NeighborGraph
+    """
+    global _precomputed_neighbors, _precomputed_version
 
-    airports = get_all_airports()
-    _precomputed_neighbors = {}
+    version = get_dataset_version()
+    _precomputed_neighbors = _disk_cached(
+        "analytics.precompute_nearest_neighbors", {"k": k},
+        lambda: get_spatial_index().knn_graph(k, workers=workers),
+        NEIGHBOR_GRAPH_CODEC
+    )
+    _precomputed_version = version
 
-    for airport in airports:
-        neighbors = nearest_airports(
-            airport.latitude_deg,
-            airport.longitude_deg,
-            n=k + 1
-        )
+    return _precomputed_neighbors
 
-        neighbors_filtered = [
-            a for a in neighbors if a.name != airport.name
-        ][:k]
 
-        key = airport.iata_code or airport.gps_code or str(airport.id)
-        _precomputed_neighbors[key] = neighbors_filtered
+def _current_neighbors() -> NeighborGraph | None:
+    # The graph is keyed by row id, so it is only valid for the data it was
+    # built from
+    if _precomputed_version != get_dataset_version():
+        return None
 
     return _precomputed_neighbors
 
 
+def save_precomputed_neighbors(path: Path | str) -> None:
+    graph = _current_neighbors()
+    if graph is None:
+        raise DataLoadError("No precomputed neighbours for the loaded data to save")
+
+    graph.save(path)
+
+
+def load_precomputed_neighbors(path: Path | str) -> NeighborGraph:
+    """
+    Load a neighbour graph saved with save_precomputed_neighbors.
+
+    The graph must have been built from the currently loaded airport data.
+    """
+    global _precomputed_neighbors, _precomputed_version
+
+    try:
+        graph = NeighborGraph.load(path)
+    except (OSError, ValueError) as e:
+        raise DataLoadError(f"Failed to load precomputed neighbours: {e}")
+
+    if len(graph) != len(get_all_airports()):
+        raise DataLoadError(
+            f"Precomputed neighbours cover {len(graph)} airports, "
+            f"but {len(get_all_airports())} are loaded"
+        )
+
+    _precomputed_neighbors = graph
+    _precomputed_version = get_dataset_version()
+    return graph
+
+
 def get_precomputed_neighbors(code: str, code_type: str = "iata") -> list[Airport] | None:
-    if _precomputed_neighbors is None:
+    """
+    Return the precomputed neighbours of an airport, nearest first.
+
+    Returns None when no graph has been precomputed for the currently loaded
+    data (including after a reload or apply_changes).
+    """
+    graph = _current_neighbors()
+    if graph is None:
+        return None
+
+    if code_type == "iata":
+        airport = get_airport_by_iata(code)
+    elif code_type == "icao":
+        airport = get_airport_by_icao(code)
+    else:
+        airport = get_airport_by_iata(code) or get_airport_by_icao(code)
+
+    if airport is None:
+        return None
+
+    row = get_airport_row(airport)
+    if row is None or row >= len(graph):
         return None
 
-    return _precomputed_neighbors.get(code.upper())
+    airports = get_spatial_index().airports
+    return [airports[i] for i in graph.neighbors(row)]
 
 
 def total_airports() -> int:
-    return len(get_all_airports())
+    return get_analytics_snapshot().total
 
 
 def airports_with_scheduled_service() -> int:
-    airports = get_all_airports()
-    return sum(1 for a in airports if a.scheduled_service is True)
+    return get_analytics_snapshot().scheduled
 
 
 def airports_by_type_and_country() -> dict[str, dict[str, int]]:
-    airports = get_all_airports()
-    result = defaultdict(lambda: defaultdict(int))
+    result = defaultdict(dict)
 
-    for airport in airports:
-        if airport.type and airport.iso_country:
-            result[airport.type][airport.iso_country] += 1
+    for (airport_type, country), stats in group_by(("type", "iso_country"), count="count").items():
+        result[airport_type][country] = stats["count"]
 
-    return {k: dict(v) for k, v in result.items()}
+    return dict(result)
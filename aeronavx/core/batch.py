@@ -0,0 +1,118 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+
+from ..core.airports import CodeType, get_many
+from ..core.distance import DistanceModel, airport_distance, distance_arrays
+from ..utils.constants import DEFAULT_CO2_KG_PER_PAX_KM, DEFAULT_CRUISE_SPEED_KTS
+from ..utils.units import DistanceUnit
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+@dataclass(frozen=True, slots=True)
+class PairBatch:
+    """
+    Per-pair results for a batch of (from, to) code pairs.
+
+    values is aligned with the input pairs and holds None for pairs that
+    could not be resolved; errors maps those pair indices to a message.
+    unit is the distance unit for batch_distances, "h" for
+    batch_flight_times and "kg" (CO2 per passenger) for batch_emissions.
+    """
+    values: list[float | None]
+    unit: str
+    model: DistanceModel
+    errors: dict[int, str]
+
+
+def batch_distances(
+    pairs: Sequence[tuple[str, str]],
+    model: DistanceModel = "haversine",
+    unit: DistanceUnit = "km",
+    code_type: CodeType = "auto",
+) -> PairBatch:
+    """
+    Compute distances for many airport code pairs in one call.
+
+    Every distinct code is resolved once, and all resolvable pairs go
+    through one vectorized kernel (with numpy). A pair with an unknown code
+    is reported in errors and does not fail the batch.
+
+    Example:
+        >>> batch = batch_distances([("JFK", "LHR"), ("IST", "XXX")], model="vincenty")
+        >>> batch.errors
+        {1: 'Destination airport not found: XXX'}
+    """
+    origins = get_many([pair[0] for pair in pairs], code_type)
+    destinations = get_many([pair[1] for pair in pairs], code_type)
+
+    errors: dict[int, str] = {}
+    valid: list[int] = []
+    for i, (origin, destination) in enumerate(zip(origins, destinations)):
+        if origin is None:
+            errors[i] = f"Origin airport not found: {pairs[i][0]}"
+        elif destination is None:
+            errors[i] = f"Destination airport not found: {pairs[i][1]}"
+        else:
+            valid.append(i)
+
+    values: list[float | None] = [None] * len(pairs)
+
+    if valid and HAS_NUMPY:
+        coords = np.array(
+            [
+                (origins[i].latitude_deg, origins[i].longitude_deg,
+                 destinations[i].latitude_deg, destinations[i].longitude_deg)
+                for i in valid
+            ],
+            dtype=np.float64,
+        )
+        distances = distance_arrays(
+            coords[:, 0], coords[:, 1], coords[:, 2], coords[:, 3], model, unit
+        )
+        for i, value in zip(valid, distances.tolist()):
+            values[i] = value
+    else:
+        for i in valid:
+            values[i] = airport_distance(origins[i], destinations[i], model=model, unit=unit)
+
+    return PairBatch(values=values, unit=unit, model=model, errors=errors)
+
+
+def _scale(batch: PairBatch, factor: float, unit: str) -> PairBatch:
+    values = [None if v is None else v * factor for v in batch.values]
+    return replace(batch, values=values, unit=unit)
+
+
+def batch_flight_times(
+    pairs: Sequence[tuple[str, str]],
+    speed_kts: float = DEFAULT_CRUISE_SPEED_KTS,
+    model: DistanceModel = "haversine",
+    code_type: CodeType = "auto",
+) -> PairBatch:
+    """
+    Compute flight times in hours for many code pairs; see batch_distances.
+    """
+    if speed_kts <= 0:
+        raise ValueError(f"speed_kts must be positive, got {speed_kts}")
+
+    batch = batch_distances(pairs, model=model, unit="nmi", code_type=code_type)
+    return _scale(batch, 1.0 / speed_kts, "h")
+
+
+def batch_emissions(
+    pairs: Sequence[tuple[str, str]],
+    model: DistanceModel = "haversine",
+    code_type: CodeType = "auto",
+    factor_kg_per_pax_km: float = DEFAULT_CO2_KG_PER_PAX_KM,
+) -> PairBatch:
+    """
+    Compute CO2 kg per passenger for many code pairs; see batch_distances.
+    """
+    batch = batch_distances(pairs, model=model, unit="km", code_type=code_type)
+    return _scale(batch, factor_kg_per_pax_km, "kg")
@@ -1,17 +1,99 @@
 import math
+import sys
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Literal
 
 from ..utils.constants import (
+    EARTH_FLATTENING,
     EARTH_RADIUS_KM,
     EARTH_SEMI_MAJOR_AXIS_M,
     EARTH_SEMI_MINOR_AXIS_M,
-    EARTH_FLATTENING,
 )
-from ..utils.units import convert_distance, DistanceUnit
-from ..utils.validators import validate_coordinates
+from ..utils.units import DistanceUnit, convert_distance
+from ..utils.validators import validate_coordinate_arrays, validate_coordinates
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+DistanceModel = Literal["haversine", "slc", "vincenty", "karney"]
+
+
+@dataclass
+class SolverStats:
+    """
+    Convergence counters of an iterative ellipsoidal solver.
+
+    fallbacks counts solutions that did not converge (Vincenty then falls back
+    to haversine); recent_fallbacks keeps the coordinates of the latest ones.
+    """
+    calls: int = 0
+    iterations: int = 0
+    max_iterations: int = 0
+    fallbacks: int = 0
+    recent_fallbacks: deque = field(default_factory=lambda: deque(maxlen=100))
+
+    @property
+    def mean_iterations(self) -> float:
+        return self.iterations / self.calls if self.calls else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "iterations": self.iterations,
+            "mean_iterations": self.mean_iterations,
+            "max_iterations": self.max_iterations,
+            "fallbacks": self.fallbacks,
+            "recent_fallbacks": list(self.recent_fallbacks),
+        }
+
 
+_solver_stats: dict[str, SolverStats] = {"vincenty": SolverStats(), "karney": SolverStats()}
+_solver_stats_enabled = False
+_solver_stats_lock = threading.Lock()
 
-DistanceModel = Literal["haversine", "slc", "vincenty"]
+
+def enable_solver_stats(enabled: bool = True) -> None:
+    """
+    Turn convergence counters for the Vincenty and Karney solvers on or off.
+
+    Counting is off by default so the hot path only pays for a flag check.
+    """
+    global _solver_stats_enabled
+    _solver_stats_enabled = enabled
+
+
+def get_solver_stats() -> dict[str, dict]:
+    with _solver_stats_lock:
+        return {name: stats.as_dict() for name, stats in _solver_stats.items()}
+
+
+def reset_solver_stats() -> None:
+    with _solver_stats_lock:
+        for name in _solver_stats:
+            _solver_stats[name] = SolverStats()
+
+
+def _record_solver_stats(
+    solver: str,
+    calls: int,
+    iterations: int,
+    max_iterations: int,
+    fallback_pairs: list[tuple[float, float, float, float]]
+) -> None:
+    with _solver_stats_lock:
+        stats = _solver_stats[solver]
+        stats.calls += calls
+        stats.iterations += iterations
+        stats.max_iterations = max(stats.max_iterations, max_iterations)
+        stats.fallbacks += len(fallback_pairs)
+        stats.recent_fallbacks.extend(fallback_pairs)
 
 
 def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -46,6 +128,35 @@ def slc_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return EARTH_RADIUS_KM * angle
 
 
+def haversine_km_arrays(lat1, lon1, lat2, lon2):
+    """
+    Vectorized haversine_km over broadcastable arrays. Requires numpy.
+    """
+    lat1_rad, lat2_rad = np.radians(lat1), np.radians(lat2)
+    delta_lat = lat2_rad - lat1_rad
+    delta_lon = np.radians(np.asarray(lon2, dtype=np.float64) - lon1)
+
+    a = (
+        np.sin(delta_lat / 2) ** 2 +
+        np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(delta_lon / 2) ** 2
+    )
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def slc_km_arrays(lat1, lon1, lat2, lon2):
+    """
+    Vectorized slc_km over broadcastable arrays. Requires numpy.
+    """
+    lat1_rad, lat2_rad = np.radians(lat1), np.radians(lat2)
+    delta_lon = np.radians(np.asarray(lon2, dtype=np.float64) - lon1)
+
+    cos_angle = (
+        np.sin(lat1_rad) * np.sin(lat2_rad) +
+        np.cos(lat1_rad) * np.cos(lat2_rad) * np.cos(delta_lon)
+    )
+    return EARTH_RADIUS_KM * np.arccos(np.clip(cos_angle, -1.0, 1.0))
+
+
 def vincenty_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     if lat1 == lat2 and lon1 == lon2:
         return 0.0
@@ -59,17 +170,17 @@ def vincenty_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     lon1_rad = math.radians(lon1)
     lon2_rad = math.radians(lon2)
 
-    L = lon2_rad - lon1_rad
+    lon_delta = lon2_rad - lon1_rad
 
-    U1 = math.atan((1 - f) * math.tan(lat1_rad))
-    U2 = math.atan((1 - f) * math.tan(lat2_rad))
+    u1 = math.atan((1 - f) * math.tan(lat1_rad))
+    u2 = math.atan((1 - f) * math.tan(lat2_rad))
 
-    sin_U1 = math.sin(U1)
-    cos_U1 = math.cos(U1)
-    sin_U2 = math.sin(U2)
-    cos_U2 = math.cos(U2)
+    sin_u1 = math.sin(u1)
+    cos_u1 = math.cos(u1)
+    sin_u2 = math.sin(u2)
+    cos_u2 = math.cos(u2)
 
-    lambda_val = L
+    lambda_val = lon_delta
     lambda_prev = 0.0
     iteration_limit = 100
     iteration = 0
@@ -79,31 +190,31 @@ def vincenty_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         cos_lambda = math.cos(lambda_val)
 
         sin_sigma = math.sqrt(
-            (cos_U2 * sin_lambda) ** 2 +
-            (cos_U1 * sin_U2 - sin_U1 * cos_U2 * cos_lambda) ** 2
+            (cos_u2 * sin_lambda) ** 2 +
+            (cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lambda) ** 2
         )
 
         if sin_sigma == 0:
             return 0.0
 
-        cos_sigma = sin_U1 * sin_U2 + cos_U1 * cos_U2 * cos_lambda
+        cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lambda
 
         sigma = math.atan2(sin_sigma, cos_sigma)
 
-        sin_alpha = cos_U1 * cos_U2 * sin_lambda / sin_sigma
+        sin_alpha = cos_u1 * cos_u2 * sin_lambda / sin_sigma
         cos_sq_alpha = 1 - sin_alpha ** 2
 
         if cos_sq_alpha == 0:
             cos_2sigma_m = 0
         else:
-            cos_2sigma_m = cos_sigma - 2 * sin_U1 * sin_U2 / cos_sq_alpha
+            cos_2sigma_m = cos_sigma - 2 * sin_u1 * sin_u2 / cos_sq_alpha
 
-        C = f / 16 * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
+        coef_c = f / 16 * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
 
         lambda_prev = lambda_val
-        lambda_val = L + (1 - C) * f * sin_alpha * (
-            sigma + C * sin_sigma * (
-                cos_2sigma_m + C * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+        lambda_val = lon_delta + (1 - coef_c) * f * sin_alpha * (
+            sigma + coef_c * sin_sigma * (
+                cos_2sigma_m + coef_c * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
             )
         )
 
@@ -112,26 +223,1023 @@ def vincenty_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
 
         iteration += 1
 
+    if _solver_stats_enabled:
+        failed = iteration >= iteration_limit
+        _record_solver_stats(
+            "vincenty", 1, min(iteration + 1, iteration_limit), min(iteration + 1, iteration_limit),
+            [(lat1, lon1, lat2, lon2)] if failed else []
+        )
+
     if iteration >= iteration_limit:
         return haversine_km(lat1, lon1, lat2, lon2)
 
     u_sq = cos_sq_alpha * (a ** 2 - b ** 2) / (b ** 2)
 
-    A = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
-    B = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+    coef_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    coef_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
 
-    delta_sigma = B * sin_sigma * (
-        cos_2sigma_m + B / 4 * (
+    delta_sigma = coef_b * sin_sigma * (
+        cos_2sigma_m + coef_b / 4 * (
             cos_sigma * (-1 + 2 * cos_2sigma_m ** 2) -
-            B / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)
+            coef_b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)
         )
     )
 
-    distance_m = b * A * (sigma - delta_sigma)
+    distance_m = b * coef_a * (sigma - delta_sigma)
+
+    return distance_m / 1000.0
+
+
+def vincenty_km_arrays(lat1, lon1, lat2, lon2):
+    """
+    Vectorized vincenty_km over broadcastable arrays. Requires numpy.
+
+    Each pair iterates until it converges, and only unconverged pairs are
+    updated. Pairs that do not converge fall back to haversine, as in
+    vincenty_km.
+
+    Returns:
+        Array of distances in km
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for vincenty_km_arrays")
+
+    lat1, lon1 = validate_coordinate_arrays(lat1, lon1)
+    lat2, lon2 = validate_coordinate_arrays(lat2, lon2)
+    lat1, lon1, lat2, lon2 = np.broadcast_arrays(lat1, lon1, lat2, lon2)
+    shape = lat1.shape
+    lat1, lon1, lat2, lon2 = (np.ravel(c) for c in (lat1, lon1, lat2, lon2))
+
+    a = EARTH_SEMI_MAJOR_AXIS_M
+    b = EARTH_SEMI_MINOR_AXIS_M
+    f = EARTH_FLATTENING
+    iteration_limit = 100
+
+    lon_delta = np.radians(lon2 - lon1)
+    u1 = np.arctan((1 - f) * np.tan(np.radians(lat1)))
+    u2 = np.arctan((1 - f) * np.tan(np.radians(lat2)))
+    sin_u1, cos_u1 = np.sin(u1), np.cos(u1)
+    sin_u2, cos_u2 = np.sin(u2), np.cos(u2)
+
+    n = lon_delta.size
+    lambda_val = lon_delta.copy()
+    sin_sigma = np.zeros(n)
+    cos_sigma = np.ones(n)
+    sigma = np.zeros(n)
+    cos_sq_alpha = np.ones(n)
+    cos_2sigma_m = np.zeros(n)
+    iterations = np.zeros(n, dtype=np.int64)
+    active = np.flatnonzero(~((lat1 == lat2) & (lon1 == lon2)))
+    coincident = np.zeros(n, dtype=bool)
+
+    for _ in range(iteration_limit):
+        if active.size == 0:
+            break
+
+        lam = lambda_val[active]
+        su1, cu1, su2, cu2 = sin_u1[active], cos_u1[active], sin_u2[active], cos_u2[active]
+        sin_lambda, cos_lambda = np.sin(lam), np.cos(lam)
+
+        s_sigma = np.sqrt((cu2 * sin_lambda) ** 2 + (cu1 * su2 - su1 * cu2 * cos_lambda) ** 2)
+        zero = s_sigma == 0
+        coincident[active[zero]] = True
+        safe_s_sigma = np.where(zero, 1.0, s_sigma)
+
+        c_sigma = su1 * su2 + cu1 * cu2 * cos_lambda
+        sig = np.arctan2(s_sigma, c_sigma)
+        sin_alpha = cu1 * cu2 * sin_lambda / safe_s_sigma
+        csa = 1 - sin_alpha ** 2
+        c2sm = np.where(csa == 0, 0.0, c_sigma - 2 * su1 * su2 / np.where(csa == 0, 1.0, csa))
+        coef_c = f / 16 * csa * (4 + f * (4 - 3 * csa))
+
+        new_lambda = lon_delta[active] + (1 - coef_c) * f * sin_alpha * (
+            sig + coef_c * s_sigma * (c2sm + coef_c * c_sigma * (-1 + 2 * c2sm ** 2))
+        )
+
+        sin_sigma[active], cos_sigma[active], sigma[active] = s_sigma, c_sigma, sig
+        cos_sq_alpha[active], cos_2sigma_m[active] = csa, c2sm
+        lambda_val[active] = new_lambda
+        iterations[active] += 1
+
+        converged = zero | (np.abs(new_lambda - lam) < 1e-12)
+        active = active[~converged]
+
+    failed = np.zeros(n, dtype=bool)
+    failed[active] = True
+
+    u_sq = cos_sq_alpha * (a ** 2 - b ** 2) / (b ** 2)
+    coef_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    coef_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+    delta_sigma = coef_b * sin_sigma * (
+        cos_2sigma_m + coef_b / 4 * (
+            cos_sigma * (-1 + 2 * cos_2sigma_m ** 2) -
+            coef_b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)
+        )
+    )
+    distance_km = b * coef_a * (sigma - delta_sigma) / 1000.0
+    distance_km[coincident] = 0.0
+
+    if failed.any():
+        distance_km[failed] = haversine_km_arrays(
+            lat1[failed], lon1[failed], lat2[failed], lon2[failed]
+        )
+
+    if _solver_stats_enabled:
+        counted = iterations > 0
+        _record_solver_stats(
+            "vincenty", int(counted.sum()), int(iterations.sum()),
+            int(iterations.max()) if n else 0,
+            list(zip(lat1[failed].tolist(), lon1[failed].tolist(),
+                     lat2[failed].tolist(), lon2[failed].tolist()))
+        )
+
+    return distance_km.reshape(shape)
+
+
+# Karney (2013), "Algorithms for geodesics": the inverse problem is solved in
+# a canonical configuration (first point south of the equator and at least as
+# far from it as the second, longitude difference in [0, 180]) by Newton's
+# method on the start azimuth, kept inside a bracket of the root. The
+# longitude and distance integrals on the auxiliary sphere are evaluated with
+# sixth-order series in the third flattening n and eps (k^2 = e'^2 cos^2 alpha0).
+
+_KARNEY_A = EARTH_SEMI_MAJOR_AXIS_M
+_KARNEY_F = EARTH_FLATTENING
+_KARNEY_F1 = 1.0 - _KARNEY_F
+_KARNEY_B = _KARNEY_A * _KARNEY_F1
+_KARNEY_EP2 = _KARNEY_F * (2.0 - _KARNEY_F) / _KARNEY_F1 ** 2
+_KARNEY_N = _KARNEY_F / (2.0 - _KARNEY_F)
+
+_TINY = math.sqrt(sys.float_info.min)
+_TOL0 = sys.float_info.epsilon
+_TOL1 = 200.0 * _TOL0
+_TOL2 = math.sqrt(_TOL0)
+_TOLB = _TOL0 * _TOL2
+_XTHRESH = 1000.0 * _TOL2
+_ETOL2 = 0.1 * _TOL2 / math.sqrt(_KARNEY_F * (1.0 - _KARNEY_F / 2.0) / 2.0)
+_KARNEY_NEWTON_ITERATIONS = 20
+_KARNEY_MAX_ITERATIONS = _KARNEY_NEWTON_ITERATIONS + sys.float_info.mant_dig + 10
+
+
+def _polyval(coeffs: Sequence[float], x: float) -> float:
+    # Horner's method, highest power first
+    y = 0.0
+    for c in coeffs:
+        y = y * x + c
+    return y
+
+
+def _scaled_polys(spec: Sequence[Sequence[int]], x: float) -> list[float]:
+    # Each entry is integer coefficients (highest power first) and a divisor
+    return [_polyval(coeffs[:-1], x) / coeffs[-1] for coeffs in spec]
+
+
+# Series coefficients of Karney (2013), eqs. (24) and (25), as polynomials in
+# n (integer coefficients, highest power first, then a divisor)
+_A3_SPEC = ((-3, 128), (-2, -3, 64), (-1, -3, -1, 16), (3, -1, -2, 8), (1, -1, 2), (1, 1))
+_C3_SPEC = (
+    ((3, 128), (2, 5, 128), (-1, 3, 3, 64), (-1, 0, 1, 8), (-1, 1, 4)),
+    ((5, 256), (1, 3, 128), (-3, -2, 3, 64), (1, -3, 2, 32)),
+    ((7, 512), (-10, 9, 384), (5, -9, 5, 192)),
+    ((7, 512), (-14, 7, 512)),
+    ((21, 2560),),
+)
+
+# A3 and C3 depend on n, which is fixed for the ellipsoid: reduce them once
+# to polynomials in eps (highest power first)
+_A3X = _scaled_polys(_A3_SPEC, _KARNEY_N)
+_C3X = [_scaled_polys(spec, _KARNEY_N) for spec in _C3_SPEC]
+
+
+def _a3(eps: float) -> float:
+    return _polyval(_A3X, eps)
+
+
+def _a1m1(eps: float) -> float:
+    eps2 = eps * eps
+    t = eps2 * (eps2 * (eps2 + 4.0) + 64.0) / 256.0
+    return (t + eps) / (1.0 - eps)
+
+
+def _a2m1(eps: float) -> float:
+    eps2 = eps * eps
+    t = eps2 * (eps2 * (-11.0 * eps2 - 28.0) - 192.0) / 256.0
+    return (t - eps) / (1.0 + eps)
+
+
+def _c1(eps: float) -> tuple[float, ...]:
+    # Coefficient l is eps^l times a polynomial in eps^2
+    e2 = eps * eps
+    e3 = e2 * eps
+    return (
+        eps * ((-e2 + 6.0) * e2 - 16.0) / 32.0,
+        e2 * ((-9.0 * e2 + 64.0) * e2 - 128.0) / 2048.0,
+        e3 * (9.0 * e2 - 16.0) / 768.0,
+        e2 * e2 * (3.0 * e2 - 5.0) / 512.0,
+        -7.0 * e3 * e2 / 1280.0,
+        -7.0 * e3 * e3 / 2048.0,
+    )
+
+
+def _c2(eps: float) -> tuple[float, ...]:
+    e2 = eps * eps
+    e3 = e2 * eps
+    return (
+        eps * ((e2 + 2.0) * e2 + 16.0) / 32.0,
+        e2 * ((35.0 * e2 + 64.0) * e2 + 384.0) / 2048.0,
+        e3 * (15.0 * e2 + 80.0) / 768.0,
+        e2 * e2 * (7.0 * e2 + 35.0) / 512.0,
+        63.0 * e3 * e2 / 1280.0,
+        77.0 * e3 * e3 / 2048.0,
+    )
+
+
+def _c3(eps: float) -> list[float]:
+    c = []
+    d = 1.0
+    for coeffs in _C3X:
+        d *= eps
+        y = 0.0
+        for k in coeffs:
+            y = y * eps + k
+        c.append(d * y)
+    return c
+
+
+def _sin_series(sinx: float, cosx: float, c: Sequence[float]) -> float:
+    # sum(c[l - 1] * sin(2 l x), l >= 1) by Clenshaw summation
+    ar = 2.0 * (cosx - sinx) * (cosx + sinx)
+    y0 = y1 = 0.0
+    for k in reversed(c):
+        y0, y1 = ar * y0 - y1 + k, y0
+    return 2.0 * sinx * cosx * y0
+
+
+def _sincosd(x: float) -> tuple[float, float]:
+    # sin and cos of x degrees, exact at multiples of 90
+    r = math.fmod(x, 360.0)
+    q = round(r / 90.0)
+    r = math.radians(r - 90.0 * q)
+    s, c = math.sin(r), math.cos(r)
+    q &= 3
+    if q == 1:
+        s, c = c, -s
+    elif q == 2:
+        s, c = -s, -c
+    elif q == 3:
+        s, c = -c, s
+    return s + 0.0, c + 0.0
+
+
+def _norm(y: float, x: float) -> tuple[float, float]:
+    r = math.hypot(y, x)
+    return y / r, x / r
+
+
+def _distance_b(eps, sig12, ssig1, csig1, ssig2, csig2) -> float:
+    # Distance / b (eq. 7)
+    c1 = _c1(eps)
+    b1 = _sin_series(ssig2, csig2, c1) - _sin_series(ssig1, csig1, c1)
+    return (1.0 + _a1m1(eps)) * (sig12 + b1)
+
+
+def _reduced_length_b(eps, sig12, ssig1, csig1, dn1, ssig2, csig2, dn2) -> float:
+    # Reduced length / b (eq. 38)
+    a1 = 1.0 + _a1m1(eps)
+    a2 = 1.0 + _a2m1(eps)
+    c = [a1 * x - a2 * y for x, y in zip(_c1(eps), _c2(eps))]
+    j12 = (a1 - a2) * sig12 + _sin_series(ssig2, csig2, c) - _sin_series(ssig1, csig1, c)
+    return dn2 * (csig1 * ssig2) - dn1 * (ssig1 * csig2) - csig1 * csig2 * j12
+
+
+def _astroid(x: float, y: float) -> float:
+    # Positive root k of k^4 + 2k^3 - (x^2 + y^2 - 1)k^2 - 2y^2 k - y^2 = 0
+    p = x * x
+    q = y * y
+    r = (p + q - 1.0) / 6.0
+    if q == 0 and r <= 0:
+        return 0.0
+
+    s = p * q / 4.0
+    r2 = r * r
+    r3 = r * r2
+    disc = s * (s + 2.0 * r3)
+    u = r
+    if disc >= 0:
+        t3 = s + r3
+        t3 += -math.sqrt(disc) if t3 < 0 else math.sqrt(disc)
+        t = math.copysign(abs(t3) ** (1.0 / 3.0), t3)
+        u += t + (r2 / t if t != 0 else 0.0)
+    else:
+        ang = math.atan2(math.sqrt(-disc), -(s + r3))
+        u += 2.0 * r * math.cos(ang / 3.0)
+
+    v = math.sqrt(u * u + q)
+    uv = q / (v - u) if u < 0 else u + v
+    w = (uv - q) / (2.0 * v)
+    return uv / (math.sqrt(uv + w * w) + w)
+
+
+def _lambda12(sbet1, cbet1, sbet2, cbet2, salp1, calp1, slam12, clam12):
+    # Hybrid problem: longitude error reached on the second point's parallel
+    # when leaving point 1 at azimuth alp1
+    if sbet1 == 0 and calp1 == 0:
+        calp1 = -_TINY
+
+    salp0 = salp1 * cbet1
+    calp0 = math.hypot(calp1, salp1 * sbet1)
+
+    ssig1, csig1 = _norm(sbet1, calp1 * cbet1)
+    somg1, comg1 = salp0 * sbet1, calp1 * cbet1
+
+    if cbet2 != cbet1 or abs(sbet2) != -sbet1:
+        if cbet1 < -sbet1:
+            dcbet = (cbet2 - cbet1) * (cbet1 + cbet2)
+        else:
+            dcbet = (sbet1 - sbet2) * (sbet1 + sbet2)
+        calp2 = math.sqrt((calp1 * cbet1) ** 2 + dcbet) / cbet2
+    else:
+        calp2 = abs(calp1)
+
+    ssig2, csig2 = _norm(sbet2, calp2 * cbet2)
+    somg2, comg2 = salp0 * sbet2, calp2 * cbet2
+
+    sig12 = math.atan2(max(0.0, csig1 * ssig2 - ssig1 * csig2), csig1 * csig2 + ssig1 * ssig2)
+    somg12 = max(0.0, comg1 * somg2 - somg1 * comg2)
+    comg12 = comg1 * comg2 + somg1 * somg2
+    eta = math.atan2(somg12 * clam12 - comg12 * slam12, comg12 * clam12 + somg12 * slam12)
+
+    k2 = calp0 * calp0 * _KARNEY_EP2
+    eps = k2 / (2.0 * (1.0 + math.sqrt(1.0 + k2)) + k2)
+    c3 = _c3(eps)
+    b312 = _sin_series(ssig2, csig2, c3) - _sin_series(ssig1, csig1, c3)
+    v = eta - _KARNEY_F * _a3(eps) * salp0 * (sig12 + b312)
+
+    return v, calp2, eps, sig12, ssig1, csig1, ssig2, csig2
+
+
+def _inverse_start(sbet1, cbet1, sbet2, cbet2, lam12, slam12, clam12):
+    # Starting azimuth for Newton's method (section 4 of the paper). Returns
+    # sig12 >= 0 and dnm when the line is short enough to need no iteration.
+    sbet12 = sbet2 * cbet1 - cbet2 * sbet1
+    cbet12 = cbet2 * cbet1 + sbet2 * sbet1
+    sbet12a = sbet2 * cbet1 + cbet2 * sbet1
+
+    dnm = math.nan
+    shortline = cbet12 >= 0 and sbet12 < 0.5 and cbet2 * lam12 < 0.5
+    if shortline:
+        sbetm2 = (sbet1 + sbet2) ** 2
+        sbetm2 /= sbetm2 + (cbet1 + cbet2) ** 2
+        dnm = math.sqrt(1.0 + _KARNEY_EP2 * sbetm2)
+        omg12 = lam12 / (_KARNEY_F1 * dnm)
+        somg12, comg12 = math.sin(omg12), math.cos(omg12)
+    else:
+        somg12, comg12 = slam12, clam12
+
+    salp1 = cbet2 * somg12
+    if comg12 >= 0:
+        calp1 = sbet12 + cbet2 * sbet1 * somg12 * somg12 / (1.0 + comg12)
+    else:
+        calp1 = sbet12a - cbet2 * sbet1 * somg12 * somg12 / (1.0 - comg12)
+
+    ssig12 = math.hypot(salp1, calp1)
+    csig12 = sbet1 * sbet2 + cbet1 * cbet2 * comg12
+
+    if shortline and ssig12 < _ETOL2:
+        return math.atan2(ssig12, csig12), dnm, salp1, calp1
+
+    if csig12 < 0 and ssig12 < 6.0 * _KARNEY_N * math.pi * cbet1 * cbet1:
+        # Nearly antipodal: scale to coordinates in which the antipode is at
+        # the origin and estimate the azimuth from the astroid equation
+        lam12x = math.atan2(-slam12, -clam12)
+        k2 = sbet1 * sbet1 * _KARNEY_EP2
+        eps = k2 / (2.0 * (1.0 + math.sqrt(1.0 + k2)) + k2)
+        lamscale = _KARNEY_F * cbet1 * _a3(eps) * math.pi
+        x = lam12x / lamscale
+        y = sbet12a / (lamscale * cbet1)
+
+        if y > -_TOL1 and x > -1.0 - _XTHRESH:
+            salp1 = min(1.0, -x)
+            calp1 = -math.sqrt(1.0 - salp1 * salp1)
+        else:
+            k = _astroid(x, y)
+            omg12a = lamscale * -x * k / (1.0 + k)
+            somg12, comg12 = math.sin(omg12a), -math.cos(omg12a)
+            salp1 = cbet2 * somg12
+            calp1 = sbet12a - cbet2 * sbet1 * somg12 * somg12 / (1.0 - comg12)
+
+    if salp1 > 0:
+        salp1, calp1 = _norm(salp1, calp1)
+    else:
+        salp1, calp1 = 1.0, 0.0
+
+    return -1.0, dnm, salp1, calp1
+
+
+def _karney_inverse(lat1: float, lon1: float, lat2: float, lon2: float) -> tuple[float, int, bool]:
+    # Returns (distance in m, Newton iterations, converged)
+    lon12 = abs(math.remainder(lon2 - lon1, 360.0))
+    lam12 = math.radians(lon12)
+    slam12, clam12 = _sincosd(lon12)
+
+    if abs(lat1) < abs(lat2):
+        lat1, lat2 = lat2, lat1
+    if lat1 > 0:
+        lat1, lat2 = -lat1, -lat2
+
+    sbet1, cbet1 = _sincosd(lat1)
+    sbet1, cbet1 = _norm(_KARNEY_F1 * sbet1, cbet1)
+    cbet1 = max(_TINY, cbet1)
+    sbet2, cbet2 = _sincosd(lat2)
+    sbet2, cbet2 = _norm(_KARNEY_F1 * sbet2, cbet2)
+    cbet2 = max(_TINY, cbet2)
+
+    # Force |bet2| = |bet1| exactly when they differ only by rounding
+    if cbet1 < -sbet1:
+        if cbet2 == cbet1:
+            sbet2 = math.copysign(sbet1, sbet2)
+    elif abs(sbet2) == -sbet1:
+        cbet2 = cbet1
+
+    dn1 = math.sqrt(1.0 + _KARNEY_EP2 * sbet1 * sbet1)
+    dn2 = math.sqrt(1.0 + _KARNEY_EP2 * sbet2 * sbet2)
+
+    if lat1 == -90 or slam12 == 0:
+        # Both points on one meridian (through a pole when lon12 = 180)
+        ssig1, csig1 = sbet1, clam12 * cbet1
+        ssig2, csig2 = sbet2, cbet2
+        sig12 = math.atan2(max(0.0, csig1 * ssig2 - ssig1 * csig2), csig1 * csig2 + ssig1 * ssig2)
+        s12b = _distance_b(_KARNEY_N, sig12, ssig1, csig1, ssig2, csig2)
+        m12b = _reduced_length_b(_KARNEY_N, sig12, ssig1, csig1, dn1, ssig2, csig2, dn2)
+        if sig12 < _TOL2 or m12b >= 0:
+            if sig12 < 3.0 * _TINY or (sig12 < _TOL0 and (s12b < 0 or m12b < 0)):
+                return 0.0, 0, True
+            return s12b * _KARNEY_B, 0, True
+
+    if sbet1 == 0 and 180.0 - lon12 >= _KARNEY_F * 180.0:
+        # Along the equator
+        return _KARNEY_A * lam12, 0, True
+
+    sig12, dnm, salp1, calp1 = _inverse_start(sbet1, cbet1, sbet2, cbet2, lam12, slam12, clam12)
+    if sig12 >= 0:
+        return sig12 * _KARNEY_B * dnm, 0, True
+
+    # Newton's method on alp1; (alp1a, alp1b) brackets the root and the
+    # midpoint is used whenever a Newton step is not usable
+    salp1a, calp1a = _TINY, 1.0
+    salp1b, calp1b = _TINY, -1.0
+    tripn = tripb = False
+    iterations = 0
+
+    while True:
+        v, calp2, eps, sig12, ssig1, csig1, ssig2, csig2 = _lambda12(
+            sbet1, cbet1, sbet2, cbet2, salp1, calp1, slam12, clam12
+        )
+        tol = (8.0 if tripn else 1.0) * _TOL0
+        if tripb or not abs(v) >= tol or iterations == _KARNEY_MAX_ITERATIONS:
+            break
+
+        if v > 0 and (iterations > _KARNEY_NEWTON_ITERATIONS or calp1 / salp1 > calp1b / salp1b):
+            salp1b, calp1b = salp1, calp1
+        elif v < 0 and (iterations > _KARNEY_NEWTON_ITERATIONS or calp1 / salp1 < calp1a / salp1a):
+            salp1a, calp1a = salp1, calp1
+
+        iterations += 1
+        if iterations < _KARNEY_NEWTON_ITERATIONS:
+            # d(lambda12)/d(alp1) from the reduced length (eq. 46)
+            if calp2 == 0:
+                dv = -2.0 * _KARNEY_F1 * dn1 / sbet1
+            else:
+                dv = _reduced_length_b(eps, sig12, ssig1, csig1, dn1, ssig2, csig2, dn2)
+                dv *= _KARNEY_F1 / (calp2 * cbet2)
+        else:
+            dv = 0.0
+
+        if dv > 0:
+            dalp1 = -v / dv
+            if abs(dalp1) < math.pi:
+                sdalp1, cdalp1 = math.sin(dalp1), math.cos(dalp1)
+                nsalp1 = salp1 * cdalp1 + calp1 * sdalp1
+                if nsalp1 > 0:
+                    salp1, calp1 = _norm(nsalp1, calp1 * cdalp1 - salp1 * sdalp1)
+                    tripn = abs(v) <= 16.0 * _TOL0
+                    continue
+
+        salp1, calp1 = _norm((salp1a + salp1b) / 2.0, (calp1a + calp1b) / 2.0)
+        tripn = False
+        tripb = (
+            abs(salp1a - salp1) + (calp1a - calp1) < _TOLB or
+            abs(salp1 - salp1b) + (calp1 - calp1b) < _TOLB
+        )
+
+    converged = iterations < _KARNEY_MAX_ITERATIONS
+    return _distance_b(eps, sig12, ssig1, csig1, ssig2, csig2) * _KARNEY_B, iterations, converged
+
+
+def karney_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Ellipsoidal (WGS-84) distance following Karney (2013); converges for
+    nearly antipodal points, where Vincenty does not.
+    """
+    validate_coordinates(lat1, lon1)
+    validate_coordinates(lat2, lon2)
+
+    distance_m, iterations, converged = _karney_inverse(lat1, lon1, lat2, lon2)
+
+    if _solver_stats_enabled:
+        _record_solver_stats(
+            "karney", 1, iterations, iterations, [] if converged else [(lat1, lon1, lat2, lon2)]
+        )
 
     return distance_m / 1000.0
 
 
+def _sincosd_arrays(x):
+    r = np.fmod(x, 360.0)
+    q = np.round(r / 90.0)
+    r = np.radians(r - 90.0 * q)
+    s, c = np.sin(r), np.cos(r)
+    q = q.astype(np.int64) & 3
+    sin = np.select([q == 1, q == 2, q == 3], [c, -s, -c], s)
+    cos = np.select([q == 1, q == 2, q == 3], [-s, -c, s], c)
+    return sin + 0.0, cos + 0.0
+
+
+def _clamp_zero(x):
+    # max(0, x) without -0.0, which would turn atan2(x, -1) into -pi
+    return np.maximum(0.0, x) + 0.0
+
+
+def _astroid_arrays(x, y):
+    p = x * x
+    q = y * y
+    r = (p + q - 1.0) / 6.0
+
+    s = p * q / 4.0
+    r2 = r * r
+    r3 = r * r2
+    disc = s * (s + 2.0 * r3)
+
+    t3 = s + r3
+    t3 = t3 + np.where(t3 < 0, -np.sqrt(disc), np.sqrt(disc))
+    t = np.cbrt(t3)
+    u_real = r + t + np.where(t != 0, r2 / t, 0.0)
+    ang = np.arctan2(np.sqrt(-disc), -(s + r3))
+    u = np.where(disc >= 0, u_real, r + 2.0 * r * np.cos(ang / 3.0))
+
+    v = np.sqrt(u * u + q)
+    uv = np.where(u < 0, q / (v - u), u + v)
+    w = (uv - q) / (2.0 * v)
+    k = uv / (np.sqrt(uv + w * w) + w)
+
+    return np.where((q == 0) & (r <= 0), 0.0, k)
+
+
+def _lambda12_arrays(sbet1, cbet1, sbet2, cbet2, salp1, calp1, slam12, clam12):
+    calp1 = np.where((sbet1 == 0) & (calp1 == 0), -_TINY, calp1)
+
+    salp0 = salp1 * cbet1
+    calp0 = np.hypot(calp1, salp1 * sbet1)
+
+    ssig1, csig1 = sbet1, calp1 * cbet1
+    norm = np.hypot(ssig1, csig1)
+    ssig1, csig1 = ssig1 / norm, csig1 / norm
+    somg1, comg1 = salp0 * sbet1, calp1 * cbet1
+
+    calp2 = np.where(
+        (cbet2 != cbet1) | (np.abs(sbet2) != -sbet1),
+        np.sqrt(
+            (calp1 * cbet1) ** 2 +
+            np.where(
+                cbet1 < -sbet1,
+                (cbet2 - cbet1) * (cbet1 + cbet2),
+                (sbet1 - sbet2) * (sbet1 + sbet2)
+            )
+        ) / cbet2,
+        np.abs(calp1)
+    )
+
+    ssig2, csig2 = sbet2, calp2 * cbet2
+    norm = np.hypot(ssig2, csig2)
+    ssig2, csig2 = ssig2 / norm, csig2 / norm
+    somg2, comg2 = salp0 * sbet2, calp2 * cbet2
+
+    sig12 = np.arctan2(_clamp_zero(csig1 * ssig2 - ssig1 * csig2), csig1 * csig2 + ssig1 * ssig2)
+    somg12 = _clamp_zero(comg1 * somg2 - somg1 * comg2)
+    comg12 = comg1 * comg2 + somg1 * somg2
+    eta = np.arctan2(somg12 * clam12 - comg12 * slam12, comg12 * clam12 + somg12 * slam12)
+
+    k2 = calp0 * calp0 * _KARNEY_EP2
+    eps = k2 / (2.0 * (1.0 + np.sqrt(1.0 + k2)) + k2)
+    c3 = _c3(eps)
+    b312 = _sin_series(ssig2, csig2, c3) - _sin_series(ssig1, csig1, c3)
+    v = eta - _KARNEY_F * _a3(eps) * salp0 * (sig12 + b312)
+
+    return v, calp2, eps, sig12, ssig1, csig1, ssig2, csig2
+
+
+def _inverse_start_arrays(sbet1, cbet1, sbet2, cbet2, lam12, slam12, clam12):
+    sbet12 = sbet2 * cbet1 - cbet2 * sbet1
+    cbet12 = cbet2 * cbet1 + sbet2 * sbet1
+    sbet12a = sbet2 * cbet1 + cbet2 * sbet1
+
+    shortline = (cbet12 >= 0) & (sbet12 < 0.5) & (cbet2 * lam12 < 0.5)
+    sbetm2 = (sbet1 + sbet2) ** 2
+    sbetm2 = sbetm2 / (sbetm2 + (cbet1 + cbet2) ** 2)
+    dnm = np.sqrt(1.0 + _KARNEY_EP2 * sbetm2)
+    omg12 = lam12 / (_KARNEY_F1 * dnm)
+    somg12 = np.where(shortline, np.sin(omg12), slam12)
+    comg12 = np.where(shortline, np.cos(omg12), clam12)
+
+    salp1 = cbet2 * somg12
+    calp1 = np.where(
+        comg12 >= 0,
+        sbet12 + cbet2 * sbet1 * somg12 ** 2 / (1.0 + comg12),
+        sbet12a - cbet2 * sbet1 * somg12 ** 2 / (1.0 - comg12)
+    )
+
+    ssig12 = np.hypot(salp1, calp1)
+    csig12 = sbet1 * sbet2 + cbet1 * cbet2 * comg12
+    short = shortline & (ssig12 < _ETOL2)
+    sig12 = np.where(short, np.arctan2(ssig12, csig12), -1.0)
+
+    antipodal = ~short & (csig12 < 0) & (ssig12 < 6.0 * _KARNEY_N * math.pi * cbet1 ** 2)
+    if antipodal.any():
+        sb1, cb1, cb2 = sbet1[antipodal], cbet1[antipodal], cbet2[antipodal]
+        lam12x = np.arctan2(-slam12[antipodal], -clam12[antipodal])
+        k2 = sb1 * sb1 * _KARNEY_EP2
+        eps = k2 / (2.0 * (1.0 + np.sqrt(1.0 + k2)) + k2)
+        lamscale = _KARNEY_F * cb1 * _a3(eps) * math.pi
+        x = lam12x / lamscale
+        y = sbet12a[antipodal] / (lamscale * cb1)
+
+        k = _astroid_arrays(x, y)
+        omg12a = lamscale * -x * k / (1.0 + k)
+        somg12a, comg12a = np.sin(omg12a), -np.cos(omg12a)
+        strip = (y > -_TOL1) & (x > -1.0 - _XTHRESH)
+        strip_salp1 = np.minimum(1.0, -x)
+
+        salp1[antipodal] = np.where(strip, strip_salp1, cb2 * somg12a)
+        calp1[antipodal] = np.where(
+            strip,
+            -np.sqrt(1.0 - strip_salp1 ** 2),
+            sbet12a[antipodal] - cb2 * sb1 * somg12a ** 2 / (1.0 - comg12a)
+        )
+
+    valid = salp1 > 0
+    norm = np.hypot(salp1, calp1)
+    salp1 = np.where(valid, salp1 / norm, 1.0)
+    calp1 = np.where(valid, calp1 / norm, 0.0)
+
+    return sig12, dnm, salp1, calp1
+
+
+def _karney_inverse_arrays(lat1, lon1, lat2, lon2):
+    # Vectorized _karney_inverse over flat arrays; Newton iterations only
+    # update the pairs that have not converged yet
+    lon12 = lon2 - lon1
+    lon12 = np.where(lon12 > 180.0, lon12 - 360.0, np.where(lon12 < -180.0, lon12 + 360.0, lon12))
+    lon12 = np.abs(lon12)
+    lam12 = np.radians(lon12)
+    slam12, clam12 = _sincosd_arrays(lon12)
+
+    swap = np.abs(lat1) < np.abs(lat2)
+    lat1, lat2 = np.where(swap, lat2, lat1), np.where(swap, lat1, lat2)
+    flip = lat1 > 0
+    lat1, lat2 = np.where(flip, -lat1, lat1), np.where(flip, -lat2, lat2)
+
+    sbet1, cbet1 = _sincosd_arrays(lat1)
+    sbet1 = _KARNEY_F1 * sbet1
+    norm = np.hypot(sbet1, cbet1)
+    sbet1, cbet1 = sbet1 / norm, np.maximum(_TINY, cbet1 / norm)
+    sbet2, cbet2 = _sincosd_arrays(lat2)
+    sbet2 = _KARNEY_F1 * sbet2
+    norm = np.hypot(sbet2, cbet2)
+    sbet2, cbet2 = sbet2 / norm, np.maximum(_TINY, cbet2 / norm)
+
+    polar_side = cbet1 < -sbet1
+    sbet2 = np.where(polar_side & (cbet2 == cbet1), np.copysign(sbet1, sbet2), sbet2)
+    cbet2 = np.where(~polar_side & (np.abs(sbet2) == -sbet1), cbet1, cbet2)
+
+    dn1 = np.sqrt(1.0 + _KARNEY_EP2 * sbet1 ** 2)
+    dn2 = np.sqrt(1.0 + _KARNEY_EP2 * sbet2 ** 2)
+
+    size = lat1.size
+    distance_m = np.zeros(size)
+    iterations = np.zeros(size, dtype=np.int64)
+    todo = np.ones(size, dtype=bool)
+
+    meridian = np.flatnonzero((lat1 == -90) | (slam12 == 0))
+    if meridian.size:
+        ssig1, csig1 = sbet1[meridian], clam12[meridian] * cbet1[meridian]
+        ssig2, csig2 = sbet2[meridian], cbet2[meridian]
+        d1, d2 = dn1[meridian], dn2[meridian]
+        sig12 = np.arctan2(
+            _clamp_zero(csig1 * ssig2 - ssig1 * csig2), csig1 * csig2 + ssig1 * ssig2
+        )
+        s12b = _distance_b(_KARNEY_N, sig12, ssig1, csig1, ssig2, csig2)
+        m12b = _reduced_length_b(_KARNEY_N, sig12, ssig1, csig1, d1, ssig2, csig2, d2)
+        ok = (sig12 < _TOL2) | (m12b >= 0)
+        zero = (sig12 < 3.0 * _TINY) | ((sig12 < _TOL0) & ((s12b < 0) | (m12b < 0)))
+        distance_m[meridian[ok]] = np.where(zero, 0.0, s12b * _KARNEY_B)[ok]
+        todo[meridian[ok]] = False
+
+    equatorial = todo & (sbet1 == 0) & (180.0 - lon12 >= _KARNEY_F * 180.0)
+    distance_m[equatorial] = _KARNEY_A * lam12[equatorial]
+    todo &= ~equatorial
+
+    rows = np.flatnonzero(todo)
+    sb1, cb1, sb2, cb2 = sbet1[rows], cbet1[rows], sbet2[rows], cbet2[rows]
+    d1, d2, sl, cl = dn1[rows], dn2[rows], slam12[rows], clam12[rows]
+
+    sig12, dnm, salp1, calp1 = _inverse_start_arrays(sb1, cb1, sb2, cb2, lam12[rows], sl, cl)
+    short = sig12 >= 0
+    distance_m[rows[short]] = (sig12 * _KARNEY_B * dnm)[short]
+
+    # Newton's method with the bracket fallback of _karney_inverse, per pair
+    salp1a = np.full(rows.size, _TINY)
+    calp1a = np.ones(rows.size)
+    salp1b = np.full(rows.size, _TINY)
+    calp1b = np.full(rows.size, -1.0)
+    tripn = np.zeros(rows.size, dtype=bool)
+    tripb = np.zeros(rows.size, dtype=bool)
+    count = np.zeros(rows.size, dtype=np.int64)
+    final = np.zeros((6, rows.size))
+
+    active = np.flatnonzero(~short)
+    while active.size:
+        v, calp2, eps, sig, ss1, cs1, ss2, cs2 = _lambda12_arrays(
+            sb1[active], cb1[active], sb2[active], cb2[active],
+            salp1[active], calp1[active], sl[active], cl[active]
+        )
+        final[:, active] = (eps, sig, ss1, cs1, ss2, cs2)
+
+        it = count[active]
+        going = ~(
+            tripb[active] |
+            ~(np.abs(v) >= np.where(tripn[active], 8.0, 1.0) * _TOL0) |
+            (it == _KARNEY_MAX_ITERATIONS)
+        )
+        active, v, calp2, it = active[going], v[going], calp2[going], it[going]
+        eps, sig, ss1, cs1, ss2, cs2 = (x[going] for x in (eps, sig, ss1, cs1, ss2, cs2))
+        if not active.size:
+            break
+
+        s1, c1 = salp1[active], calp1[active]
+        late = it > _KARNEY_NEWTON_ITERATIONS
+        above = (v > 0) & (late | (c1 / s1 > calp1b[active] / salp1b[active]))
+        below = (v < 0) & (late | (c1 / s1 < calp1a[active] / salp1a[active]))
+        salp1b[active] = np.where(above, s1, salp1b[active])
+        calp1b[active] = np.where(above, c1, calp1b[active])
+        salp1a[active] = np.where(below, s1, salp1a[active])
+        calp1a[active] = np.where(below, c1, calp1a[active])
+
+        it += 1
+        count[active] = it
+
+        dv = np.where(
+            calp2 == 0,
+            -2.0 * _KARNEY_F1 * d1[active] / sb1[active],
+            _reduced_length_b(eps, sig, ss1, cs1, d1[active], ss2, cs2, d2[active]) *
+            _KARNEY_F1 / (calp2 * cb2[active])
+        )
+        dv = np.where(it < _KARNEY_NEWTON_ITERATIONS, dv, 0.0)
+
+        dalp1 = -v / dv
+        sdalp1, cdalp1 = np.sin(dalp1), np.cos(dalp1)
+        nsalp1 = s1 * cdalp1 + c1 * sdalp1
+        ncalp1 = c1 * cdalp1 - s1 * sdalp1
+        step = (dv > 0) & (np.abs(dalp1) < math.pi) & (nsalp1 > 0)
+        norm = np.hypot(nsalp1, ncalp1)
+
+        msalp1 = (salp1a[active] + salp1b[active]) / 2.0
+        mcalp1 = (calp1a[active] + calp1b[active]) / 2.0
+        mnorm = np.hypot(msalp1, mcalp1)
+        msalp1, mcalp1 = msalp1 / mnorm, mcalp1 / mnorm
+
+        salp1[active] = np.where(step, nsalp1 / norm, msalp1)
+        calp1[active] = np.where(step, ncalp1 / norm, mcalp1)
+        tripn[active] = step & (np.abs(v) <= 16.0 * _TOL0)
+        tripb[active] = ~step & (
+            (np.abs(salp1a[active] - msalp1) + (calp1a[active] - mcalp1) < _TOLB) |
+            (np.abs(msalp1 - salp1b[active]) + (mcalp1 - calp1b[active]) < _TOLB)
+        )
+
+    newton = ~short
+    eps, sig, ss1, cs1, ss2, cs2 = (x[newton] for x in final)
+    distance_m[rows[newton]] = _distance_b(eps, sig, ss1, cs1, ss2, cs2) * _KARNEY_B
+    iterations[rows] = count
+
+    return distance_m, iterations, iterations < _KARNEY_MAX_ITERATIONS
+
+
+def karney_km_arrays(lat1, lon1, lat2, lon2):
+    """
+    Vectorized karney_km over broadcastable arrays. Requires numpy.
+
+    Runs the same series and Newton iteration as karney_km, and only pairs
+    that have not converged are updated.
+
+    Returns:
+        Array of distances in km
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for karney_km_arrays")
+
+    lat1, lon1 = validate_coordinate_arrays(lat1, lon1)
+    lat2, lon2 = validate_coordinate_arrays(lat2, lon2)
+    lat1, lon1, lat2, lon2 = np.broadcast_arrays(lat1, lon1, lat2, lon2)
+    shape = lat1.shape
+    lat1, lon1, lat2, lon2 = (np.ravel(c) for c in (lat1, lon1, lat2, lon2))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distance_m, iterations, converged = _karney_inverse_arrays(lat1, lon1, lat2, lon2)
+
+    if _solver_stats_enabled:
+        failed = ~converged
+        _record_solver_stats(
+            "karney", lat1.size, int(iterations.sum()),
+            int(iterations.max()) if iterations.size else 0,
+            list(zip(lat1[failed].tolist(), lon1[failed].tolist(),
+                     lat2[failed].tolist(), lon2[failed].tolist()))
+        )
+
+    return (distance_m / 1000.0).reshape(shape)
+
+
+def vincenty_direct(
+    lat: float,
+    lon: float,
+    bearing_deg: float,
+    distance_km: float
+) -> tuple[float, float, float]:
+    """
+    Solve the direct geodesic problem on the WGS-84 ellipsoid (Vincenty).
+
+    Args:
+        lat: Start latitude
+        lon: Start longitude
+        bearing_deg: Initial bearing in degrees
+        distance_km: Distance to travel along the geodesic in km
+
+    Returns:
+        (lat, lon, final_bearing_deg) of the destination
+    """
+    validate_coordinates(lat, lon)
+
+    a = EARTH_SEMI_MAJOR_AXIS_M
+    b = EARTH_SEMI_MINOR_AXIS_M
+    f = EARTH_FLATTENING
+
+    alpha1 = math.radians(bearing_deg)
+    sin_alpha1 = math.sin(alpha1)
+    cos_alpha1 = math.cos(alpha1)
+    s = distance_km * 1000.0
+
+    tan_u1 = (1 - f) * math.tan(math.radians(lat))
+    cos_u1 = 1 / math.sqrt(1 + tan_u1 ** 2)
+    sin_u1 = tan_u1 * cos_u1
+
+    sigma1 = math.atan2(tan_u1, cos_alpha1)
+    sin_alpha = cos_u1 * sin_alpha1
+    cos_sq_alpha = 1 - sin_alpha ** 2
+    u_sq = cos_sq_alpha * (a ** 2 - b ** 2) / (b ** 2)
+
+    coef_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    coef_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+
+    sigma = s / (b * coef_a)
+
+    for _ in range(100):
+        cos_2sigma_m = math.cos(2 * sigma1 + sigma)
+        sin_sigma = math.sin(sigma)
+        cos_sigma = math.cos(sigma)
+
+        delta_sigma = coef_b * sin_sigma * (
+            cos_2sigma_m + coef_b / 4 * (
+                cos_sigma * (-1 + 2 * cos_2sigma_m ** 2) -
+                coef_b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)
+            )
+        )
+
+        sigma_prev = sigma
+        sigma = s / (b * coef_a) + delta_sigma
+
+        if abs(sigma - sigma_prev) < 1e-12:
+            break
+
+    cos_2sigma_m = math.cos(2 * sigma1 + sigma)
+    sin_sigma = math.sin(sigma)
+    cos_sigma = math.cos(sigma)
+
+    x = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1
+    lat2 = math.atan2(
+        sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
+        (1 - f) * math.sqrt(sin_alpha ** 2 + x ** 2)
+    )
+    lambda_val = math.atan2(
+        sin_sigma * sin_alpha1,
+        cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1
+    )
+
+    coef_c = f / 16 * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
+    lon_delta = lambda_val - (1 - coef_c) * f * sin_alpha * (
+        sigma + coef_c * sin_sigma * (
+            cos_2sigma_m + coef_c * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+        )
+    )
+
+    lon2 = (lon + math.degrees(lon_delta) + 540) % 360 - 180
+    final_bearing = (math.degrees(math.atan2(sin_alpha, -x)) + 360) % 360
+
+    return (math.degrees(lat2), lon2, final_bearing)
+
+
+def vincenty_direct_arrays(lat, lon, bearing_deg, distance_km):
+    """
+    Vectorized vincenty_direct over broadcastable arrays. Requires numpy.
+
+    Returns:
+        (lats, lons, final_bearings) arrays
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for vincenty_direct_arrays")
+
+    lat, lon = validate_coordinate_arrays(lat, lon)
+    lat, lon, bearing_deg, distance_km = np.broadcast_arrays(
+        lat, lon,
+        np.asarray(bearing_deg, dtype=np.float64),
+        np.asarray(distance_km, dtype=np.float64)
+    )
+
+    a = EARTH_SEMI_MAJOR_AXIS_M
+    b = EARTH_SEMI_MINOR_AXIS_M
+    f = EARTH_FLATTENING
+
+    alpha1 = np.radians(bearing_deg)
+    sin_alpha1 = np.sin(alpha1)
+    cos_alpha1 = np.cos(alpha1)
+    s = distance_km * 1000.0
+
+    tan_u1 = (1 - f) * np.tan(np.radians(lat))
+    cos_u1 = 1 / np.sqrt(1 + tan_u1 ** 2)
+    sin_u1 = tan_u1 * cos_u1
+
+    sigma1 = np.arctan2(tan_u1, cos_alpha1)
+    sin_alpha = cos_u1 * sin_alpha1
+    cos_sq_alpha = 1 - sin_alpha ** 2
+    u_sq = cos_sq_alpha * (a ** 2 - b ** 2) / (b ** 2)
+
+    coef_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    coef_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+
+    sigma = s / (b * coef_a)
+
+    for _ in range(100):
+        cos_2sigma_m = np.cos(2 * sigma1 + sigma)
+        sin_sigma = np.sin(sigma)
+        cos_sigma = np.cos(sigma)
+
+        delta_sigma = coef_b * sin_sigma * (
+            cos_2sigma_m + coef_b / 4 * (
+                cos_sigma * (-1 + 2 * cos_2sigma_m ** 2) -
+                coef_b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)
+            )
+        )
+
+        sigma_prev = sigma
+        sigma = s / (b * coef_a) + delta_sigma
+
+        if np.all(np.abs(sigma - sigma_prev) < 1e-12):
+            break
+
+    cos_2sigma_m = np.cos(2 * sigma1 + sigma)
+    sin_sigma = np.sin(sigma)
+    cos_sigma = np.cos(sigma)
+
+    x = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1
+    lat2 = np.arctan2(
+        sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
+        (1 - f) * np.sqrt(sin_alpha ** 2 + x ** 2)
+    )
+    lambda_val = np.arctan2(
+        sin_sigma * sin_alpha1,
+        cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1
+    )
+
+    coef_c = f / 16 * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
+    lon_delta = lambda_val - (1 - coef_c) * f * sin_alpha * (
+        sigma + coef_c * sin_sigma * (
+            cos_2sigma_m + coef_c * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+        )
+    )
+
+    lon2 = (lon + np.degrees(lon_delta) + 540) % 360 - 180
+    final_bearing = (np.degrees(np.arctan2(sin_alpha, -x)) + 360) % 360
+
+    return np.degrees(lat2), lon2, final_bearing
+
+
 def distance(
     lat1: float,
     lon1: float,
@@ -149,12 +1257,49 @@ def distance(
         dist_km = slc_km(lat1, lon1, lat2, lon2)
     elif model == "vincenty":
         dist_km = vincenty_km(lat1, lon1, lat2, lon2)
+    elif model == "karney":
+        dist_km = karney_km(lat1, lon1, lat2, lon2)
     else:
         raise ValueError(f"Unknown distance model: {model}")
 
     return convert_distance(dist_km, "km", unit)
 
 
+_ARRAY_KERNELS = {
+    "haversine": haversine_km_arrays,
+    "slc": slc_km_arrays,
+    "vincenty": vincenty_km_arrays,
+    "karney": karney_km_arrays,
+}
+
+
+def distance_arrays(
+    lat1,
+    lon1,
+    lat2,
+    lon2,
+    model: DistanceModel = "haversine",
+    unit: DistanceUnit = "km"
+):
+    """
+    Vectorized distance over broadcastable coordinate arrays. Requires numpy.
+
+    Example:
+        >>> distance_arrays([40.64, 51.47], [-73.78, -0.45], 41.26, 28.74, model="vincenty")
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for distance_arrays")
+    if model not in _ARRAY_KERNELS:
+        raise ValueError(f"Unknown distance model: {model}")
+
+    lat1, lon1 = validate_coordinate_arrays(lat1, lon1)
+    lat2, lon2 = validate_coordinate_arrays(lat2, lon2)
+
+    dist_km = _ARRAY_KERNELS[model](lat1, lon1, lat2, lon2)
+
+    return convert_distance(dist_km, "km", unit)
+
+
 def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return distance(lat1, lon1, lat2, lon2, model="haversine", unit="km")
 
@@ -165,3 +1310,127 @@ def distance_mi(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
 
 def distance_nmi(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return distance(lat1, lon1, lat2, lon2, model="haversine", unit="nmi")
+
+
+DEFAULT_PAIR_CACHE_SIZE = 65536
+
+
+class PairDistanceCache:
+    """
+    Bounded LRU cache of airport-pair distances in km.
+
+    Keys are (row, row, model) with the two loader row ids ordered, so A->B
+    and B->A share an entry. Every model is symmetric, so ordering the pair
+    does not change the result.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_PAIR_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[int, int, str], float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: tuple[int, int, str]) -> float | None:
+        with self._lock:
+            dist_km = self._entries.get(key)
+            if dist_km is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return dist_km
+
+    def put(self, key: tuple[int, int, str], dist_km: float) -> None:
+        with self._lock:
+            self._entries[key] = dist_km
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+_pair_cache = PairDistanceCache()
+
+
+def airport_distance(
+    from_airport,
+    to_airport,
+    model: DistanceModel = "haversine",
+    unit: DistanceUnit = "km"
+) -> float:
+    """
+    Distance between two airports, memoized per airport pair and model.
+
+    Airports that are not part of the loaded dataset (e.g. constructed by
+    hand) are computed directly without touching the cache.
+
+    Example:
+        >>> jfk, lhr = get_airport_by_iata("JFK"), get_airport_by_iata("LHR")
+        >>> d1 = airport_distance(jfk, lhr, model="vincenty")
+        >>> airport_distance(lhr, jfk, model="vincenty") == d1
+        True
+    """
+    from .loader import get_airport_row
+
+    row1 = get_airport_row(from_airport, load=False)
+    row2 = get_airport_row(to_airport, load=False)
+
+    if row1 is None or row2 is None:
+        return distance(
+            from_airport.latitude_deg, from_airport.longitude_deg,
+            to_airport.latitude_deg, to_airport.longitude_deg,
+            model=model, unit=unit
+        )
+
+    key = (row1, row2, model) if row1 <= row2 else (row2, row1, model)
+    dist_km = _pair_cache.get(key)
+
+    if dist_km is None:
+        dist_km = distance(
+            from_airport.latitude_deg, from_airport.longitude_deg,
+            to_airport.latitude_deg, to_airport.longitude_deg,
+            model=model, unit="km"
+        )
+        _pair_cache.put(key, dist_km)
+
+    return convert_distance(dist_km, "km", unit)
+
+
+def get_pair_cache_stats() -> dict[str, int]:
+    return _pair_cache.stats()
+
+
+def clear_pair_cache() -> None:
+    _pair_cache.clear()
+
+
+def set_pair_cache_size(maxsize: int) -> None:
+    _pair_cache.resize(maxsize)
@@ -1,9 +1,9 @@
 from typing import Sequence
 
-from ..models.airport import Airport
+from ..core.distance import airport_distance
 from ..core.loader import get_airport_by_iata, get_airport_by_icao
-from ..core.distance import distance
 from ..exceptions import RoutingError
+from ..models.airport import Airport
 from ..utils.constants import DEFAULT_CO2_KG_PER_PAX_KM
 
 
@@ -13,14 +13,7 @@ def estimate_co2_kg_for_segment(
     model: str = "haversine",
     factor_kg_per_pax_km: float = DEFAULT_CO2_KG_PER_PAX_KM
 ) -> float:
-    dist_km = distance(
-        from_airport.latitude_deg,
-        from_airport.longitude_deg,
-        to_airport.latitude_deg,
-        to_airport.longitude_deg,
-        model=model,
-        unit="km"
-    )
+    dist_km = airport_distance(from_airport, to_airport, model=model, unit="km")
 
     return dist_km * factor_kg_per_pax_km
 
@@ -1,6 +1,18 @@
 import math
+from collections.abc import Iterator, Sequence
+from typing import Literal
 
-from ..utils.validators import validate_coordinates
+from ..utils.constants import EARTH_RADIUS_KM
+from ..utils.validators import validate_coordinate_arrays, validate_coordinates
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+DestinationModel = Literal["spherical", "vincenty"]
 
 
 def initial_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -24,7 +36,21 @@ def initial_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float
 
 
 def final_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    return (initial_bearing(lat2, lon2, lat1, lon1) + 180) % 360
+    validate_coordinates(lat1, lon1)
+    validate_coordinates(lat2, lon2)
+
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lon = math.radians(lon2 - lon1)
+
+    # Reverse bearing from the destination, turned around by 180 degrees
+    y = math.sin(delta_lon) * math.cos(lat1_rad)
+    x = (
+        math.sin(lat2_rad) * math.cos(lat1_rad) * math.cos(delta_lon) -
+        math.cos(lat2_rad) * math.sin(lat1_rad)
+    )
+
+    return (math.degrees(math.atan2(y, x)) + 360) % 360
 
 
 def midpoint(lat1: float, lon1: float, lat2: float, lon2: float) -> tuple[float, float]:
@@ -94,20 +120,589 @@ def intermediate_point(
     return (math.degrees(lat_inter), math.degrees(lon_inter))
 
 
-def great_circle_path(
+def destination_point(
+    lat: float,
+    lon: float,
+    bearing_deg: float,
+    distance_km: float,
+    model: DestinationModel = "spherical"
+) -> tuple[float, float]:
+    """
+    Point reached from a start point after distance_km on an initial bearing.
+
+    Args:
+        lat: Start latitude
+        lon: Start longitude
+        bearing_deg: Initial bearing in degrees
+        distance_km: Distance in km
+        model: "spherical" (great circle) or "vincenty" (WGS-84 ellipsoid)
+
+    Returns:
+        (lat, lon) of the destination
+    """
+    if model == "vincenty":
+        from ..core.distance import vincenty_direct
+
+        lat2, lon2, _ = vincenty_direct(lat, lon, bearing_deg, distance_km)
+        return (lat2, lon2)
+    if model != "spherical":
+        raise ValueError(f"Unknown destination model: {model}")
+
+    validate_coordinates(lat, lon)
+
+    lat1_rad = math.radians(lat)
+    bearing_rad = math.radians(bearing_deg)
+    delta = distance_km / EARTH_RADIUS_KM
+
+    sin_lat2 = (
+        math.sin(lat1_rad) * math.cos(delta) +
+        math.cos(lat1_rad) * math.sin(delta) * math.cos(bearing_rad)
+    )
+    lat2_rad = math.asin(max(-1.0, min(1.0, sin_lat2)))
+    delta_lon = math.atan2(
+        math.sin(bearing_rad) * math.sin(delta) * math.cos(lat1_rad),
+        math.cos(delta) - math.sin(lat1_rad) * sin_lat2
+    )
+
+    return (math.degrees(lat2_rad), (lon + math.degrees(delta_lon) + 540) % 360 - 180)
+
+
+def destination_points(
+    lat,
+    lon,
+    bearing_deg,
+    distance_km,
+    model: DestinationModel = "spherical"
+):
+    """
+    Vectorized destination_point over broadcastable arrays. Requires numpy.
+
+    Returns:
+        (lats, lons) arrays of destinations
+    """
+    if model == "vincenty":
+        from ..core.distance import vincenty_direct_arrays
+
+        lats, lons, _ = vincenty_direct_arrays(lat, lon, bearing_deg, distance_km)
+        return lats, lons
+    if model != "spherical":
+        raise ValueError(f"Unknown destination model: {model}")
+
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for destination_points")
+
+    lat, lon = validate_coordinate_arrays(lat, lon)
+
+    lat1_rad = np.radians(lat)
+    bearing_rad = np.radians(np.asarray(bearing_deg, dtype=np.float64))
+    delta = np.asarray(distance_km, dtype=np.float64) / EARTH_RADIUS_KM
+
+    sin_lat1 = np.sin(lat1_rad)
+    cos_lat1 = np.cos(lat1_rad)
+    sin_delta = np.sin(delta)
+    cos_delta = np.cos(delta)
+
+    sin_lat2 = np.clip(sin_lat1 * cos_delta + cos_lat1 * sin_delta * np.cos(bearing_rad), -1.0, 1.0)
+    delta_lon = np.arctan2(
+        np.sin(bearing_rad) * sin_delta * cos_lat1,
+        cos_delta - sin_lat1 * sin_lat2
+    )
+
+    return np.degrees(np.arcsin(sin_lat2)), (lon + np.degrees(delta_lon) + 540) % 360 - 180
+
+
+def range_ring(
+    lat: float,
+    lon: float,
+    radius_km: float,
+    num_points: int = 72,
+    model: DestinationModel = "spherical"
+) -> list[tuple[float, float]]:
+    """
+    Polygon of points at radius_km from a center, e.g. a fuel-range or ETOPS circle.
+
+    The ring is closed (the last point repeats the first), as GeoJSON expects.
+
+    Examples:
+        >>> from aeronavx.core.geodesy import range_ring
+        >>> ring = range_ring(41.275, 28.752, 1000, num_points=36)
+        >>> len(ring)
+        37
+    """
+    if num_points < 3:
+        raise ValueError(f"num_points must be at least 3, got {num_points}")
+
+    bearings = [360.0 * i / num_points for i in range(num_points)]
+
+    if HAS_NUMPY:
+        lats, lons = destination_points(lat, lon, bearings, radius_km, model=model)
+        ring = list(zip(lats.tolist(), lons.tolist()))
+    else:
+        ring = [destination_point(lat, lon, b, radius_km, model=model) for b in bearings]
+
+    ring.append(ring[0])
+    return ring
+
+
+def range_rings(
+    lats,
+    lons,
+    radius_km,
+    num_points: int = 72,
+    model: DestinationModel = "spherical"
+):
+    """
+    Range rings around many centers in one vectorized pass. Requires numpy.
+
+    Args:
+        lats: Center latitudes, shape (N,)
+        lons: Center longitudes, shape (N,)
+        radius_km: Radius in km, scalar or shape (N,)
+        num_points: Distinct points per ring
+        model: "spherical" or "vincenty"
+
+    Returns:
+        (ring_lats, ring_lons) arrays of shape (N, num_points + 1), each ring closed
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for range_rings")
+    if num_points < 3:
+        raise ValueError(f"num_points must be at least 3, got {num_points}")
+
+    lats = np.asarray(lats, dtype=np.float64).reshape(-1, 1)
+    lons = np.asarray(lons, dtype=np.float64).reshape(-1, 1)
+    radius_km = np.asarray(radius_km, dtype=np.float64)
+    if radius_km.ndim:
+        radius_km = radius_km.reshape(-1, 1)
+
+    bearings = np.arange(num_points + 1) * (360.0 / num_points)
+    bearings[-1] = 0.0
+
+    return destination_points(lats, lons, bearings[None, :], radius_km, model=model)
+
+
+def _angular_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    a = (
+        math.sin((lat2_rad - lat1_rad) / 2) ** 2 +
+        math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def _track_geometry(
+    lat: float,
+    lon: float,
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float
+) -> tuple[float, float, float]:
+    # Angular (cross-track, along-track, path length) of a point relative to
+    # the great circle from point 1 to point 2.
+    validate_coordinates(lat, lon)
+    validate_coordinates(lat1, lon1)
+    validate_coordinates(lat2, lon2)
+
+    d13 = _angular_distance(lat1, lon1, lat, lon)
+    d12 = _angular_distance(lat1, lon1, lat2, lon2)
+    theta13 = math.radians(initial_bearing(lat1, lon1, lat, lon))
+    theta12 = math.radians(initial_bearing(lat1, lon1, lat2, lon2))
+
+    dxt = math.asin(max(-1.0, min(1.0, math.sin(d13) * math.sin(theta13 - theta12))))
+    cos_ratio = math.cos(d13) / math.cos(dxt) if math.cos(dxt) != 0 else 1.0
+    dat = math.acos(max(-1.0, min(1.0, cos_ratio)))
+    if math.cos(theta13 - theta12) < 0:
+        dat = -dat
+
+    return dxt, dat, d12
+
+
+def cross_track_distance_km(
+    lat: float,
+    lon: float,
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float
+) -> float:
+    """
+    Signed distance from a point to the great circle through points 1 and 2.
+
+    Positive when the point is to the right of the path from 1 to 2.
+    """
+    dxt, _, _ = _track_geometry(lat, lon, lat1, lon1, lat2, lon2)
+    return dxt * EARTH_RADIUS_KM
+
+
+def along_track_distance_km(
+    lat: float,
+    lon: float,
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float
+) -> float:
+    """
+    Distance from point 1 along the great circle towards point 2 to the point
+    closest to the given point. Negative when the closest point lies behind point 1.
+    """
+    _, dat, _ = _track_geometry(lat, lon, lat1, lon1, lat2, lon2)
+    return dat * EARTH_RADIUS_KM
+
+
+def distance_to_segment_km(
+    lat: float,
+    lon: float,
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float
+) -> tuple[float, float]:
+    """
+    Closest approach of a point to the great-circle segment from 1 to 2.
+
+    Returns:
+        (distance_km, fraction) where fraction in [0, 1] locates the closest
+        point along the segment
+    """
+    dxt, dat, d12 = _track_geometry(lat, lon, lat1, lon1, lat2, lon2)
+
+    if d12 > 0 and 0.0 <= dat <= d12:
+        return (abs(dxt) * EARTH_RADIUS_KM, dat / d12)
+
+    to_start = _angular_distance(lat, lon, lat1, lon1)
+    to_end = _angular_distance(lat, lon, lat2, lon2)
+    if to_start <= to_end or d12 == 0:
+        return (to_start * EARTH_RADIUS_KM, 0.0)
+    return (to_end * EARTH_RADIUS_KM, 1.0)
+
+
+def _batch_terms(lat1, lon1, lat2, lon2) -> dict:
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for batch geodesy functions")
+
+    lat1, lon1 = validate_coordinate_arrays(lat1, lon1)
+    lat2, lon2 = validate_coordinate_arrays(lat2, lon2)
+    lat1, lon1, lat2, lon2 = np.broadcast_arrays(lat1, lon1, lat2, lon2)
+
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    delta_lon = np.radians(lon2 - lon1)
+
+    return {
+        "lon1_rad": np.radians(lon1),
+        "sin_lat1": np.sin(lat1_rad),
+        "cos_lat1": np.cos(lat1_rad),
+        "sin_lat2": np.sin(lat2_rad),
+        "cos_lat2": np.cos(lat2_rad),
+        "sin_dlon": np.sin(delta_lon),
+        "cos_dlon": np.cos(delta_lon),
+    }
+
+
+def _initial_bearings_from_terms(t: dict):
+    y = t["sin_dlon"] * t["cos_lat2"]
+    x = t["cos_lat1"] * t["sin_lat2"] - t["sin_lat1"] * t["cos_lat2"] * t["cos_dlon"]
+    return (np.degrees(np.arctan2(y, x)) + 360) % 360
+
+
+def _final_bearings_from_terms(t: dict):
+    y = t["sin_dlon"] * t["cos_lat1"]
+    x = t["sin_lat2"] * t["cos_lat1"] * t["cos_dlon"] - t["cos_lat2"] * t["sin_lat1"]
+    return (np.degrees(np.arctan2(y, x)) + 360) % 360
+
+
+def initial_bearings(lat1, lon1, lat2, lon2):
+    """
+    Vectorized initial_bearing over arrays of coordinates.
+
+    Inputs broadcast against each other like NumPy operands and are validated
+    once up front. Requires numpy.
+
+    Returns:
+        Array of bearings in degrees [0, 360)
+    """
+    return _initial_bearings_from_terms(_batch_terms(lat1, lon1, lat2, lon2))
+
+
+def final_bearings(lat1, lon1, lat2, lon2):
+    """
+    Vectorized final_bearing over arrays of coordinates. Requires numpy.
+    """
+    return _final_bearings_from_terms(_batch_terms(lat1, lon1, lat2, lon2))
+
+
+def initial_and_final_bearings(lat1, lon1, lat2, lon2):
+    """
+    Compute initial and final bearings of many legs from one shared set of
+    trigonometric terms. Requires numpy.
+
+    Returns:
+        (initial, final) arrays of bearings in degrees [0, 360)
+    """
+    terms = _batch_terms(lat1, lon1, lat2, lon2)
+    return _initial_bearings_from_terms(terms), _final_bearings_from_terms(terms)
+
+
+def midpoints(lat1, lon1, lat2, lon2):
+    """
+    Vectorized midpoint over arrays of coordinates. Requires numpy.
+
+    Returns:
+        (lats, lons) arrays in degrees
+    """
+    t = _batch_terms(lat1, lon1, lat2, lon2)
+
+    bx = t["cos_lat2"] * t["cos_dlon"]
+    by = t["cos_lat2"] * t["sin_dlon"]
+
+    lat_mid = np.arctan2(t["sin_lat1"] + t["sin_lat2"], np.hypot(t["cos_lat1"] + bx, by))
+    lon_mid = t["lon1_rad"] + np.arctan2(by, t["cos_lat1"] + bx)
+
+    return np.degrees(lat_mid), np.degrees(lon_mid)
+
+
+def intermediate_points(lat1, lon1, lat2, lon2, fraction):
+    """
+    Vectorized intermediate_point over arrays of coordinates and fractions.
+
+    Fractions 0 and 1 return the endpoints exactly, matching intermediate_point.
+    Interior points between antipodal endpoints are undefined and come back
+    as NaN. Requires numpy.
+
+    Returns:
+        (lats, lons) arrays in degrees
+    """
+    t = _batch_terms(lat1, lon1, lat2, lon2)
+
+    fraction = np.asarray(fraction, dtype=np.float64)
+    if (~((fraction >= 0.0) & (fraction <= 1.0))).any():
+        raise ValueError("Fraction must be in [0, 1]")
+
+    lat1, lon1, lat2, lon2, fraction = np.broadcast_arrays(
+        *(np.asarray(c, dtype=np.float64) for c in (lat1, lon1, lat2, lon2)), fraction
+    )
+
+    lon2_rad = np.radians(lon2)
+    cos_lon1 = np.cos(t["lon1_rad"])
+    sin_lon1 = np.sin(t["lon1_rad"])
+    cos_lon2 = np.cos(lon2_rad)
+    sin_lon2 = np.sin(lon2_rad)
+
+    ax, ay, az = t["cos_lat1"] * cos_lon1, t["cos_lat1"] * sin_lon1, t["sin_lat1"]
+    bx, by, bz = t["cos_lat2"] * cos_lon2, t["cos_lat2"] * sin_lon2, t["sin_lat2"]
+
+    delta = np.arctan2(
+        np.sqrt((ay * bz - az * by) ** 2 + (az * bx - ax * bz) ** 2 + (ax * by - ay * bx) ** 2),
+        ax * bx + ay * by + az * bz
+    )
+    sin_delta = np.sin(delta)
+    degenerate = sin_delta < 1e-12
+    safe_sin = np.where(degenerate, 1.0, sin_delta)
+
+    a_frac = np.where(degenerate, 1.0 - fraction, np.sin((1 - fraction) * delta) / safe_sin)
+    b_frac = np.where(degenerate, fraction, np.sin(fraction * delta) / safe_sin)
+
+    x = a_frac * ax + b_frac * bx
+    y = a_frac * ay + b_frac * by
+    z = a_frac * az + b_frac * bz
+
+    lats = np.degrees(np.arctan2(z, np.hypot(x, y)))
+    lons = np.degrees(np.arctan2(y, x))
+
+    antipodal = degenerate & (delta > 1.0)
+    lats = np.where(antipodal, np.nan, lats)
+    lons = np.where(antipodal, np.nan, lons)
+
+    at_start = fraction == 0.0
+    at_end = fraction == 1.0
+    lats = np.where(at_start, lat1, np.where(at_end, lat2, lats))
+    lons = np.where(at_start, lon1, np.where(at_end, lon2, lons))
+
+    return lats, lons
+
+
+Vector3 = tuple[float, float, float]
+
+
+def _unit_vector(lat: float, lon: float) -> Vector3:
+    lat_rad = math.radians(lat)
+    lon_rad = math.radians(lon)
+    cos_lat = math.cos(lat_rad)
+    return (cos_lat * math.cos(lon_rad), cos_lat * math.sin(lon_rad), math.sin(lat_rad))
+
+
+def _cross(u: Vector3, v: Vector3) -> Vector3:
+    return (u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0])
+
+
+def _dot(u: Vector3, v: Vector3) -> float:
+    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+
+
+def _angle_between(u: Vector3, v: Vector3) -> float:
+    # atan2 of |u x v| and u . v stays accurate for nearly parallel vectors
+    w = _cross(u, v)
+    return math.atan2(math.sqrt(_dot(w, w)), _dot(u, v))
+
+
+def _slerp_setup(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float
+) -> tuple[Vector3, Vector3, float]:
+    validate_coordinates(lat1, lon1)
+    validate_coordinates(lat2, lon2)
+
+    a = _unit_vector(lat1, lon1)
+    b = _unit_vector(lat2, lon2)
+    delta = _angle_between(a, b)
+
+    if delta > 0 and math.sin(delta) < 1e-12:
+        raise ValueError("Great circle path between antipodal points is undefined")
+
+    return a, b, delta
+
+
+def iter_great_circle_path(
     lat1: float,
     lon1: float,
     lat2: float,
     lon2: float,
     num_points: int = 100
-) -> list[tuple[float, float]]:
+) -> Iterator[tuple[float, float]]:
+    """
+    Yield num_points evenly spaced points along the great circle, endpoints included.
+
+    Endpoint vectors and the angular distance are computed once up front, so
+    each point costs one slerp step; nothing is materialized.
+    """
     if num_points < 2:
         raise ValueError(f"num_points must be at least 2, got {num_points}")
 
-    path = []
-    for i in range(num_points):
+    a, b, delta = _slerp_setup(lat1, lon1, lat2, lon2)
+    sin_delta = math.sin(delta)
+
+    yield (lat1, lon1)
+
+    for i in range(1, num_points - 1):
         fraction = i / (num_points - 1)
-        point = intermediate_point(lat1, lon1, lat2, lon2, fraction)
-        path.append(point)
+        if sin_delta == 0:
+            yield (lat1, lon1)
+            continue
+
+        a_frac = math.sin((1 - fraction) * delta) / sin_delta
+        b_frac = math.sin(fraction * delta) / sin_delta
+
+        x = a_frac * a[0] + b_frac * b[0]
+        y = a_frac * a[1] + b_frac * b[1]
+        z = a_frac * a[2] + b_frac * b[2]
+
+        lat = math.degrees(math.atan2(z, math.sqrt(x ** 2 + y ** 2)))
+        yield (lat, math.degrees(math.atan2(y, x)))
+
+    yield (lat2, lon2)
+
+
+def great_circle_path_arrays(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+    num_points: int = 100
+):
+    """
+    Return (lats, lons) NumPy arrays of num_points points along the great circle.
+
+    All points come from a single vectorized slerp between the endpoint vectors.
+    Requires numpy.
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for great_circle_path_arrays")
+
+    if num_points < 2:
+        raise ValueError(f"num_points must be at least 2, got {num_points}")
+
+    a, b, delta = _slerp_setup(lat1, lon1, lat2, lon2)
+
+    sin_delta = math.sin(delta)
+
+    if sin_delta == 0:
+        return np.full(num_points, float(lat1)), np.full(num_points, float(lon1))
+
+    fractions = np.linspace(0.0, 1.0, num_points)
+    a_frac = np.sin((1 - fractions) * delta) / sin_delta
+    b_frac = np.sin(fractions * delta) / sin_delta
+
+    x = a_frac * a[0] + b_frac * b[0]
+    y = a_frac * a[1] + b_frac * b[1]
+    z = a_frac * a[2] + b_frac * b[2]
+
+    lats = np.degrees(np.arctan2(z, np.hypot(x, y)))
+    lons = np.degrees(np.arctan2(y, x))
+
+    lats[0], lons[0] = lat1, lon1
+    lats[-1], lons[-1] = lat2, lon2
+
+    return lats, lons
+
+
+def great_circle_path(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+    num_points: int = 100
+) -> list[tuple[float, float]]:
+    if HAS_NUMPY:
+        lats, lons = great_circle_path_arrays(lat1, lon1, lat2, lon2, num_points)
+        return list(zip(lats.tolist(), lons.tolist()))
+
+    return list(iter_great_circle_path(lat1, lon1, lat2, lon2, num_points))
+
+
+def densify(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+    max_segment_km: float
+) -> list[tuple[float, float]]:
+    """
+    Return the great-circle path with the fewest points such that no segment
+    is longer than max_segment_km.
+
+    Examples:
+        >>> from aeronavx.core.geodesy import densify
+        >>> path = densify(41.275, 28.752, 40.640, -73.779, max_segment_km=100)
+        >>> len(path)
+        82
+    """
+    if max_segment_km <= 0:
+        raise ValueError(f"max_segment_km must be positive, got {max_segment_km}")
+
+    _, _, delta = _slerp_setup(lat1, lon1, lat2, lon2)
+    num_points = max(2, math.ceil(delta * EARTH_RADIUS_KM / max_segment_km) + 1)
+
+    return great_circle_path(lat1, lon1, lat2, lon2, num_points)
+
+
+def densify_route(
+    waypoints: Sequence[tuple[float, float]],
+    max_segment_km: float
+) -> list[tuple[float, float]]:
+    """
+    Densify a multi-leg route given as (lat, lon) waypoints, flying great
+    circles between consecutive waypoints. Shared waypoints appear once.
+    """
+    if len(waypoints) < 2:
+        raise ValueError(f"A route needs at least 2 waypoints, got {len(waypoints)}")
+
+    path = [tuple(waypoints[0])]
+    for (lat1, lon1), (lat2, lon2) in zip(waypoints, waypoints[1:]):
+        path.extend(densify(lat1, lon1, lat2, lon2, max_segment_km)[1:])
 
     return path
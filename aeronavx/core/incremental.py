@@ -0,0 +1,141 @@
+import math
+import threading
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from ..core.loader import DatasetDelta, get_all_airports, get_dataset_version, subscribe
+from ..models.airport import Airport
+
+
+@dataclass(frozen=True, slots=True)
+class AnalyticsSnapshot:
+    """
+    Immutable view of the maintained aggregates at one dataset version.
+    """
+    version: int
+    total: int
+    scheduled: int
+    per_country: Mapping[str, int]
+    per_continent: Mapping[str, int]
+    per_type: Mapping[str, int]
+    country_centroids: Mapping[str, tuple[float, float]]
+
+
+class IncrementalAnalytics:
+    """
+    Dataset aggregates maintained from row-level deltas.
+
+    Counts and per-country unit-vector sums (for spherical-mean centroids) are
+    adjusted for every added or removed airport, so a reload that changes a
+    handful of rows costs a handful of updates. Snapshots are built once per
+    version and shared by all readers until the next change.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version: int | None = None
+        self._snapshot: AnalyticsSnapshot | None = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._total = 0
+        self._scheduled = 0
+        self._per_country: Counter[str] = Counter()
+        self._per_continent: Counter[str] = Counter()
+        self._per_type: Counter[str] = Counter()
+        self._country_vectors: dict[str, list[float]] = {}
+
+    def rebuild(self, airports: Iterable[Airport], version: int) -> None:
+        with self._lock:
+            self._reset()
+            self._apply(airports, 1)
+            self._version = version
+            self._snapshot = None
+
+    def on_delta(self, delta: DatasetDelta) -> None:
+        with self._lock:
+            # Not initialized yet, or a delta was missed: rebuild lazily on next read
+            if self._version is None or self._version != delta.previous_version:
+                self._version = None
+                self._snapshot = None
+                return
+
+            self._apply(delta.removed, -1)
+            self._apply(delta.added, 1)
+            self._version = delta.version
+            self._snapshot = None
+
+    def snapshot(self) -> AnalyticsSnapshot:
+        while True:
+            snapshot = self._snapshot
+            if snapshot is not None:
+                return snapshot
+
+            if self._version is None:
+                # Outside the lock: loading the data publishes a delta to on_delta
+                version = get_dataset_version()
+                self.rebuild(get_all_airports(), version)
+                if get_dataset_version() != version:
+                    self._version = None
+                continue
+
+            with self._lock:
+                if self._version is not None and self._snapshot is None:
+                    self._snapshot = AnalyticsSnapshot(
+                        version=self._version,
+                        total=self._total,
+                        scheduled=self._scheduled,
+                        per_country=MappingProxyType(dict(self._per_country)),
+                        per_continent=MappingProxyType(dict(self._per_continent)),
+                        per_type=MappingProxyType(dict(self._per_type)),
+                        country_centroids=MappingProxyType(self._centroids()),
+                    )
+
+    def _apply(self, airports: Iterable[Airport], sign: int) -> None:
+        for airport in airports:
+            self._total += sign
+            if airport.scheduled_service is True:
+                self._scheduled += sign
+
+            for counts, key in (
+                (self._per_country, airport.iso_country),
+                (self._per_continent, airport.continent),
+                (self._per_type, airport.type),
+            ):
+                if key:
+                    counts[key] += sign
+                    if counts[key] <= 0:
+                        del counts[key]
+
+            if airport.iso_country:
+                lat = math.radians(airport.latitude_deg)
+                lon = math.radians(airport.longitude_deg)
+                vector = self._country_vectors.setdefault(airport.iso_country, [0.0, 0.0, 0.0])
+                vector[0] += sign * math.cos(lat) * math.cos(lon)
+                vector[1] += sign * math.cos(lat) * math.sin(lon)
+                vector[2] += sign * math.sin(lat)
+                if airport.iso_country not in self._per_country:
+                    del self._country_vectors[airport.iso_country]
+
+    def _centroids(self) -> dict[str, tuple[float, float]]:
+        centroids = {}
+        for country, (x, y, z) in self._country_vectors.items():
+            if math.sqrt(x * x + y * y + z * z) >= 1e-9:
+                centroids[country] = (
+                    math.degrees(math.atan2(z, math.hypot(x, y))),
+                    math.degrees(math.atan2(y, x)),
+                )
+        return centroids
+
+
+_analytics = IncrementalAnalytics()
+subscribe(_analytics.on_delta)
+
+
+def get_analytics_snapshot() -> AnalyticsSnapshot:
+    """
+    Return the current aggregates; O(1) unless the data changed since the last call.
+    """
+    return _analytics.snapshot()
@@ -1,22 +1,45 @@
 import csv
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from ..core.distance import clear_pair_cache
+from ..exceptions import AirportNotFoundError, DataLoadError
 from ..models.airport import Airport
-from ..exceptions import DataLoadError
 from ..utils.logging import get_logger
+from ..utils.result_cache import dataset_fingerprint
 from ..utils.validators import normalize_airport_code
 
-
 logger = get_logger()
 
 _airports: list[Airport] = []
 _iata_index: dict[str, Airport] = {}
 _icao_index: dict[str, Airport] = {}
 _id_index: dict[int, Airport] = {}
+_row_index: dict[int, int] = {}
+_fingerprint: str | None = None
+_version = 0
 _loaded = False
 
 
+@dataclass(frozen=True, slots=True)
+class DatasetDelta:
+    """
+    Row-level change to the loaded airport data, from previous_version to version.
+
+    An updated airport appears as its old value in removed and new value in added.
+    """
+    version: int
+    previous_version: int
+    added: tuple[Airport, ...]
+    removed: tuple[Airport, ...]
+
+
+_listeners: list[Callable[[DatasetDelta], None]] = []
+
+
 def _find_data_file() -> Path:
     possible_paths = [
         Path(__file__).parent.parent / "data" / "airports.csv",  # aeronavx/data/airports.csv
@@ -90,7 +113,7 @@ def load_airports(
         # Load specific countries
         airports = load_airports(countries=['US', 'GB', 'TR'])
     """
-    global _airports, _iata_index, _icao_index, _id_index, _loaded
+    global _airports, _iata_index, _icao_index, _id_index, _row_index, _loaded
 
     if _loaded and not force_reload:
         return _airports
@@ -194,23 +217,35 @@ def load_airports(
     except Exception as e:
         raise DataLoadError(f"Failed to load airports: {e}")
 
+    previous = _airports if _loaded else []
+    previous_version = _version
+
     _airports = airports
     _build_indices()
     _loaded = True
 
     logger.info(f"Loaded {len(_airports)} airports (skipped {skipped})")
 
+    if _listeners:
+        added = Counter(airports)
+        added.subtract(previous)
+        _publish(previous_version, +added, -added)
+
     return _airports
 
 
 def _build_indices() -> None:
-    global _iata_index, _icao_index, _id_index
+    global _iata_index, _icao_index, _id_index, _row_index, _fingerprint, _version
 
     _iata_index.clear()
     _icao_index.clear()
     _id_index.clear()
+    _row_index.clear()
+    _fingerprint = None
+    _version += 1
+    clear_pair_cache()
 
-    for airport in _airports:
+    for row, airport in enumerate(_airports):
         if airport.iata_code:
             code = normalize_airport_code(airport.iata_code)
             if code not in _iata_index:
@@ -223,6 +258,77 @@ def _build_indices() -> None:
 
         if airport.id is not None:
             _id_index[airport.id] = airport
+            _row_index.setdefault(airport.id, row)
+
+
+def subscribe(listener: Callable[[DatasetDelta], None]) -> None:
+    """
+    Call listener with a DatasetDelta after every change to the loaded data.
+
+    Reloads are diffed against the previous data, so unchanged airports do
+    not appear in the delta.
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def unsubscribe(listener: Callable[[DatasetDelta], None]) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def _publish(previous_version: int, added: Counter, removed: Counter) -> None:
+    delta = DatasetDelta(
+        version=_version,
+        previous_version=previous_version,
+        added=tuple(added.elements()),
+        removed=tuple(removed.elements()),
+    )
+
+    for listener in list(_listeners):
+        listener(delta)
+
+
+def apply_changes(
+    added: Iterable[Airport] = (),
+    removed: Iterable[Airport] = (),
+) -> int:
+    """
+    Add and remove airports in the loaded data without reloading the file.
+
+    Removed airports are matched by identity (use objects obtained from the
+    loader); an airport listed twice is removed once. Update an airport by
+    removing the old object and adding the new one in the same call. Row ids
+    of the remaining airports may change.
+
+    Returns:
+        The new dataset version
+
+    Raises:
+        AirportNotFoundError: If a removed airport is not in the loaded data.
+    """
+    global _airports
+
+    if not _loaded:
+        load_airports()
+
+    added = list(added)
+    removed = list({id(a): a for a in removed}.values())
+    removed_ids = {id(a) for a in removed}
+
+    remaining = [a for a in _airports if id(a) not in removed_ids]
+    if len(remaining) != len(_airports) - len(removed_ids):
+        raise AirportNotFoundError("Removed airport is not part of the loaded data")
+
+    previous_version = _version
+
+    _airports = remaining + added
+    _build_indices()
+
+    if _listeners:
+        _publish(previous_version, Counter(added), Counter(removed))
+
+    return _version
 
 
 def get_airport_by_iata(code: str) -> Airport | None:
@@ -248,6 +354,54 @@ def get_airport_by_id(airport_id: int) -> Airport | None:
     return _id_index.get(airport_id)
 
 
+def get_airport_row(airport: Airport, load: bool = True) -> int | None:
+    """
+    Return the row id of an airport: its position in get_all_airports().
+
+    With load=False a missing dataset is not loaded and None is returned.
+    """
+    if not _loaded:
+        if not load:
+            return None
+        load_airports()
+
+    if airport.id is None:
+        return None
+
+    row = _row_index.get(airport.id)
+    if row is None or _airports[row] is not airport:
+        return None
+
+    return row
+
+
+def get_dataset_version() -> int:
+    """
+    Return a counter that changes whenever the loaded airport data changes.
+
+    Cheap to call; use it to key in-memory caches of derived results.
+    """
+    if not _loaded:
+        load_airports()
+
+    return _version
+
+
+def get_dataset_fingerprint() -> str:
+    """
+    Return the SHA-256 fingerprint of the loaded airport data, in row order.
+    """
+    global _fingerprint
+
+    if not _loaded:
+        load_airports()
+
+    if _fingerprint is None:
+        _fingerprint = dataset_fingerprint(_airports)
+
+    return _fingerprint
+
+
 def get_all_airports() -> list[Airport]:
     if not _loaded:
         load_airports()
@@ -270,12 +424,23 @@ def get_airports_df():
 
 
 def clear_cache() -> None:
-    global _airports, _iata_index, _icao_index, _id_index, _loaded
+    global _airports, _iata_index, _icao_index, _id_index, _row_index, _fingerprint
+    global _version, _loaded
 
-    _airports.clear()
+    previous = _airports if _loaded else []
+    previous_version = _version
+
+    _airports = []
     _iata_index.clear()
     _icao_index.clear()
     _id_index.clear()
+    _row_index.clear()
+    _fingerprint = None
+    _version += 1
+    clear_pair_cache()
     _loaded = False
 
     logger.info("Cleared airport data cache")
+
+    if _listeners and previous:
+        _publish(previous_version, Counter(), Counter(previous))
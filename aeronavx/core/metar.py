@@ -0,0 +1,291 @@
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any, Literal
+
+from ..utils.cache import BoundedCache
+from ..utils.constants import MI_TO_KM
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+FlightCategory = Literal["VFR", "MVFR", "IFR", "LIFR"]
+
+SM_TO_M = MI_TO_KM * 1000.0
+INHG_TO_HPA = 33.8639
+
+_WIND_TO_KT = {"KT": 1.0, "MPS": 1.943844, "KMH": 0.539957}
+
+# FAA limits in ft and statute miles: below for LIFR/IFR, at or below for MVFR
+_LIFR_LIMITS = (500.0, 1.0)
+_IFR_LIMITS = (1000.0, 3.0)
+_MVFR_LIMITS = (3000.0, 5.0)
+
+# Separates reports in a batch; str.isspace() is true for it, so token
+# boundaries ((?<!\S) / (?!\S)) hold across reports. Whitespace inside a
+# report is matched with [^\S\x1e] so no group runs into the next report.
+_SEP = "\x1e"
+
+# One alternation for every group the decoder understands. A batch of reports
+# is joined into one string and scanned once; `start` marks each report,
+# `skip` swallows remarks and TAF change groups up to the next report.
+_TOKEN_RE = re.compile(r"""
+    (?P<start>\x1e(?:(?:METAR|SPECI|TAF|AMD|COR)[^\S\x1e]+)*(?:(?P<station>[A-Z][A-Z0-9]{3})(?!\S))?)
+  | (?<!\S)(?:
+        (?P<skip>(?:RMK|TEMPO|BECMG|INTER|FM\d{6}|PROB\d{2})(?!\S)[^\x1e]*)
+      | (?P<wind>(?P<wdir>\d{3}|VRB)(?P<wspd>\d{2,3})(?:G(?P<gust>\d{2,3}))?(?P<wunit>KT|MPS|KMH))
+      | (?P<cavok>CAVOK)
+      | (?P<vis_sm>(?P<vis_pm>[PM])?(?:(?P<vis_whole>\d{1,2})[^\S\x1e])?
+            (?:(?P<vis_num>\d{1,2})/(?P<vis_den>\d{1,2})|(?P<vis_int>\d{1,2}))SM)
+      | (?P<vis_m>\d{4})(?:NDV)?
+      | (?P<cloud>(?:BKN|OVC|VV)(?P<height>\d{3}))(?:CB|TCU|///)?
+      | (?P<temp>(?P<t>M?\d{2})/(?P<d>M?\d{2})?)
+      | (?P<alt>(?P<alt_unit>[QA])(?P<alt_value>\d{4}))
+    )(?!\S)
+""", re.VERBOSE)
+
+_COLUMNS = (
+    "station",
+    "wind_direction_deg",
+    "wind_speed_kt",
+    "wind_gust_kt",
+    "visibility_m",
+    "ceiling_ft",
+    "temperature_c",
+    "dewpoint_c",
+    "altimeter_hpa",
+)
+
+_decoded = BoundedCache(maxsize=16384)
+
+
+@dataclass(frozen=True, slots=True)
+class DecodedReport:
+    """
+    Main conditions of a METAR, or of a TAF's prevailing (initial) group.
+
+    wind_direction_deg is None for variable wind; ceiling_ft is the lowest
+    broken, overcast or vertical-visibility layer, None when there is none.
+    """
+    raw: str
+    station: str | None
+    wind_direction_deg: int | None
+    wind_speed_kt: float | None
+    wind_gust_kt: float | None
+    visibility_m: float | None
+    ceiling_ft: int | None
+    temperature_c: int | None
+    dewpoint_c: int | None
+    altimeter_hpa: float | None
+    flight_category: FlightCategory | None
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def flight_category(visibility_m: float | None, ceiling_ft: float | None) -> FlightCategory | None:
+    """
+    Return the FAA flight category for a visibility and ceiling.
+
+    A missing ceiling counts as unlimited; without visibility or ceiling the
+    category is unknown (None).
+    """
+    if visibility_m is None and ceiling_ft is None:
+        return None
+
+    visibility_sm = float("inf") if visibility_m is None else visibility_m / SM_TO_M
+    ceiling = float("inf") if ceiling_ft is None else ceiling_ft
+
+    if ceiling < _LIFR_LIMITS[0] or visibility_sm < _LIFR_LIMITS[1]:
+        return "LIFR"
+    if ceiling < _IFR_LIMITS[0] or visibility_sm < _IFR_LIMITS[1]:
+        return "IFR"
+    if ceiling <= _MVFR_LIMITS[0] or visibility_sm <= _MVFR_LIMITS[1]:
+        return "MVFR"
+
+    return "VFR"
+
+
+def _temperature(value: str) -> int:
+    return -int(value[1:]) if value[0] == "M" else int(value)
+
+
+def _decode_columns(reports: Sequence[str]) -> dict[str, list]:
+    """
+    Decode reports in a single regex pass over the joined batch.
+
+    Returns one list per field in _COLUMNS, aligned with reports.
+    """
+    n = len(reports)
+    columns: dict[str, list] = {name: [None] * n for name in _COLUMNS}
+    (
+        station, wind_dir, wind_speed, wind_gust, visibility,
+        ceiling, temperature, dewpoint, altimeter,
+    ) = (columns[name] for name in _COLUMNS)
+
+    text = _SEP + _SEP.join(report.replace(_SEP, " ").strip() for report in reports)
+    i = -1
+
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+
+        if kind == "start":
+            i += 1
+            station[i] = match.group("station")
+
+        elif kind == "skip":
+            continue
+
+        elif kind == "wind":
+            if wind_speed[i] is None:
+                factor = _WIND_TO_KT[match.group("wunit")]
+                direction = match.group("wdir")
+                gust = match.group("gust")
+                wind_dir[i] = None if direction == "VRB" else int(direction)
+                wind_speed[i] = int(match.group("wspd")) * factor
+                wind_gust[i] = None if gust is None else int(gust) * factor
+
+        elif kind == "cloud":
+            height = int(match.group("height")) * 100
+            if ceiling[i] is None or height < ceiling[i]:
+                ceiling[i] = height
+
+        elif visibility[i] is None and kind in ("vis_m", "vis_sm", "cavok"):
+            if kind == "vis_m":
+                meters = int(match.group("vis_m"))
+                visibility[i] = 10000.0 if meters == 9999 else float(meters)
+            elif kind == "cavok":
+                visibility[i] = 10000.0
+            else:
+                if match.group("vis_int") is not None:
+                    miles = float(match.group("vis_int"))
+                else:
+                    miles = int(match.group("vis_num")) / int(match.group("vis_den"))
+                if match.group("vis_whole") is not None:
+                    miles += int(match.group("vis_whole"))
+                visibility[i] = miles * SM_TO_M
+
+        elif kind == "temp":
+            if temperature[i] is None:
+                temperature[i] = _temperature(match.group("t"))
+                dew = match.group("d")
+                dewpoint[i] = None if dew is None else _temperature(dew)
+
+        elif kind == "alt":
+            if altimeter[i] is None:
+                value = int(match.group("alt_value"))
+                if match.group("alt_unit") == "Q":
+                    altimeter[i] = float(value)
+                else:
+                    altimeter[i] = value / 100 * INHG_TO_HPA
+
+    if i != n - 1:
+        raise ValueError(f"Decoded {i + 1} reports from a batch of {n}")
+
+    return columns
+
+
+def decode_reports(reports: Iterable[str | None]) -> list[DecodedReport | None]:
+    """
+    Decode many METAR/TAF reports; None entries stay None.
+
+    Decoded reports are cached by their raw text, so a report seen before
+    (e.g. served again from the weather cache) is not parsed twice. The rest
+    are decoded together in one pass.
+
+    Example:
+        >>> decode_reports(["EGLL 191220Z 24015G25KT 9999 BKN012 12/10 Q1003"])[0].flight_category
+        'MVFR'
+    """
+    reports = list(reports)
+    results: list[DecodedReport | None] = [None] * len(reports)
+    pending: dict[str, list[int]] = {}
+
+    for i, raw in enumerate(reports):
+        if raw is None:
+            continue
+        cached = _decoded.get(raw)
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.setdefault(raw, []).append(i)
+
+    if pending:
+        raws = list(pending)
+        columns = _decode_columns(raws)
+
+        for j, raw in enumerate(raws):
+            values = {name: columns[name][j] for name in _COLUMNS}
+            decoded = DecodedReport(
+                raw=raw,
+                flight_category=flight_category(values["visibility_m"], values["ceiling_ft"]),
+                **values,
+            )
+            _decoded.set(raw, decoded)
+            for i in pending[raw]:
+                results[i] = decoded
+
+    return results
+
+
+def decode_report(raw: str) -> DecodedReport:
+    return decode_reports([raw])[0]
+
+
+def decode_columns(reports: Sequence[str]) -> dict[str, Any]:
+    """
+    Decode reports into columns: numeric fields as float arrays (NaN when
+    missing) with numpy, plus station and flight_category lists.
+
+    Suited to thousands of reports at once: there is one regex pass over
+    the batch and flight categories are computed on whole arrays.
+    """
+    columns: dict[str, Any] = _decode_columns(reports)
+
+    if not HAS_NUMPY:
+        columns["flight_category"] = [
+            flight_category(v, c) for v, c in zip(columns["visibility_m"], columns["ceiling_ft"])
+        ]
+        return columns
+
+    for name in _COLUMNS[1:]:
+        columns[name] = np.array(
+            [np.nan if v is None else v for v in columns[name]], dtype=np.float64
+        )
+
+    columns["flight_category"] = flight_categories(columns["visibility_m"], columns["ceiling_ft"])
+    return columns
+
+
+def flight_categories(visibility_m: Any, ceiling_ft: Any) -> list[FlightCategory | None]:
+    """
+    Vectorized flight_category over arrays (NaN meaning missing).
+    """
+    visibility_sm = np.asarray(visibility_m, dtype=np.float64) / SM_TO_M
+    ceiling = np.asarray(ceiling_ft, dtype=np.float64)
+
+    unknown = np.isnan(visibility_sm) & np.isnan(ceiling)
+    visibility_sm = np.where(np.isnan(visibility_sm), np.inf, visibility_sm)
+    ceiling = np.where(np.isnan(ceiling), np.inf, ceiling)
+
+    labels = np.select(
+        [
+            unknown,
+            (ceiling < _LIFR_LIMITS[0]) | (visibility_sm < _LIFR_LIMITS[1]),
+            (ceiling < _IFR_LIMITS[0]) | (visibility_sm < _IFR_LIMITS[1]),
+            (ceiling <= _MVFR_LIMITS[0]) | (visibility_sm <= _MVFR_LIMITS[1]),
+        ],
+        ["", "LIFR", "IFR", "MVFR"],
+        default="VFR",
+    )
+
+    return [label or None for label in labels.tolist()]
+
+
+def clear_decoded_cache() -> None:
+    _decoded.clear()
@@ -1,15 +1,14 @@
 import heapq
 from typing import Sequence
 
-from ..models.airport import Airport
+from ..core.distance import airport_distance, distance
 from ..core.loader import get_airport_by_iata, get_airport_by_icao, get_all_airports
-from ..core.distance import distance
 from ..core.search import filter_airports
 from ..exceptions import RoutingError
+from ..models.airport import Airport
 from ..utils.constants import DEFAULT_CRUISE_SPEED_KTS, DEFAULT_MAX_LEG_KM
-from ..utils.units import DistanceUnit, convert_distance
 from ..utils.logging import get_logger
-
+from ..utils.units import DistanceUnit, convert_distance
 
 logger = get_logger()
 
@@ -20,14 +19,7 @@ def estimate_flight_time_hours(
     speed_kts: float = DEFAULT_CRUISE_SPEED_KTS,
     model: str = "haversine",
 ) -> float:
-    dist_nmi = distance(
-        from_airport.latitude_deg,
-        from_airport.longitude_deg,
-        to_airport.latitude_deg,
-        to_airport.longitude_deg,
-        model=model,
-        unit="nmi"
-    )
+    dist_nmi = airport_distance(from_airport, to_airport, model=model, unit="nmi")
 
     return dist_nmi / speed_kts
 
@@ -59,14 +51,7 @@ def route_distance(
         a1 = airports[i]
         a2 = airports[i + 1]
 
-        dist_km = distance(
-            a1.latitude_deg,
-            a1.longitude_deg,
-            a2.latitude_deg,
-            a2.longitude_deg,
-            model=model,
-            unit="km"
-        )
+        dist_km = airport_distance(a1, a2, model=model, unit="km")
 
         total_dist_km += dist_km
 
@@ -1,14 +1,32 @@
-from typing import Sequence
-
+import bisect
+import heapq
+from collections.abc import Callable, Sequence
+
+from ..core.loader import (
+    get_airport_by_iata,
+    get_airport_by_icao,
+    get_all_airports,
+    get_dataset_version,
+)
 from ..models.airport import Airport
-from ..core.loader import get_all_airports, get_airport_by_iata, get_airport_by_icao
-from ..utils.spatial_index import build_spatial_index
 from ..utils.logging import get_logger
-
+from ..utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    encode_cursor,
+    validate_page_size,
+)
+from ..utils.spatial_index import NearbyAirport, SpatialIndex, TrackProximity, build_spatial_index
 
 logger = get_logger()
 
+# Derived from the loaded data; rebuilt when get_dataset_version() changes
 _spatial_index = None
+_spatial_index_version: int | None = None
+_id_order: list[Airport] | None = None
+_id_order_keys: list[tuple[int, str]] | None = None
+_id_order_version: int | None = None
 
 
 try:
@@ -19,15 +37,37 @@ except ImportError:
 
 
 def _get_spatial_index():
-    global _spatial_index
+    global _spatial_index, _spatial_index_version
 
-    if _spatial_index is None:
+    version = get_dataset_version()
+    if _spatial_index is None or _spatial_index_version != version:
         airports = get_all_airports()
         _spatial_index = build_spatial_index(airports)
+        _spatial_index_version = version
 
     return _spatial_index
 
 
+def get_spatial_index() -> SpatialIndex:
+    return _get_spatial_index()
+
+
+def _id_key(airport: Airport) -> tuple[int, str]:
+    return (airport.id if airport.id is not None else -1, airport.name)
+
+
+def _get_id_order() -> tuple[list[Airport], list[tuple[int, str]]]:
+    global _id_order, _id_order_keys, _id_order_version
+
+    version = get_dataset_version()
+    if _id_order is None or _id_order_version != version:
+        _id_order = sorted(get_all_airports(), key=_id_key)
+        _id_order_keys = [_id_key(a) for a in _id_order]
+        _id_order_version = version
+
+    return _id_order, _id_order_keys
+
+
 def search_airports_by_name(query: str, limit: int = 20) -> list[Airport]:
     airports = get_all_airports()
 
@@ -65,6 +105,36 @@ def search_airports_by_name(query: str, limit: int = 20) -> list[Airport]:
         return results[:limit]
 
 
+def _airport_predicate(
+    country: str | None = None,
+    region: str | None = None,
+    municipality: str | None = None,
+    types: Sequence[str] | None = None,
+    scheduled_only: bool | None = None,
+) -> Callable[[Airport], bool]:
+    country_upper = country.upper() if country else None
+    region_upper = region.upper() if region else None
+    municipality_lower = municipality.lower() if municipality else None
+    types_set = set(types) if types else None
+
+    def predicate(a: Airport) -> bool:
+        if country_upper and a.iso_country != country_upper:
+            return False
+        if region_upper and a.iso_region != region_upper:
+            return False
+        if municipality_lower and not (
+            a.municipality and municipality_lower in a.municipality.lower()
+        ):
+            return False
+        if types_set and a.type not in types_set:
+            return False
+        if scheduled_only is True and a.scheduled_service is not True:
+            return False
+        return True
+
+    return predicate
+
+
 def filter_airports(
     country: str | None = None,
     region: str | None = None,
@@ -72,32 +142,54 @@ def filter_airports(
     types: Sequence[str] | None = None,
     scheduled_only: bool | None = None,
 ) -> list[Airport]:
-    airports = get_all_airports()
-    results = airports
+    predicate = _airport_predicate(country, region, municipality, types, scheduled_only)
+    return [a for a in get_all_airports() if predicate(a)]
 
-    if country:
-        country_upper = country.upper()
-        results = [a for a in results if a.iso_country == country_upper]
 
-    if region:
-        region_upper = region.upper()
-        results = [a for a in results if a.iso_region == region_upper]
+def filter_airports_page(
+    country: str | None = None,
+    region: str | None = None,
+    municipality: str | None = None,
+    types: Sequence[str] | None = None,
+    scheduled_only: bool | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Page[Airport]:
+    """
+    Return one page of filter_airports results ordered by airport id.
+
+    Pages are addressed with keyset cursors: the scan resumes right after the
+    last airport of the previous page and stops as soon as the page is full,
+    so the full result set is never materialized.
+
+    Args:
+        country, region, municipality, types, scheduled_only: Same as filter_airports
+        limit: Maximum number of airports on the page
+        cursor: next_cursor of the previous page, or None for the first page
 
-    if municipality:
-        municipality_lower = municipality.lower()
-        results = [
-            a for a in results
-            if a.municipality and municipality_lower in a.municipality.lower()
-        ]
+    Returns:
+        Page with the matching airports and the cursor of the next page
+        (None on the last page)
+    """
+    validate_page_size(limit)
+    predicate = _airport_predicate(country, region, municipality, types, scheduled_only)
+    ordered, keys = _get_id_order()
 
-    if types:
-        types_set = set(types)
-        results = [a for a in results if a.type in types_set]
+    start = 0
+    if cursor is not None:
+        after = decode_cursor(cursor, (int, str))
+        start = bisect.bisect_right(keys, after)
 
-    if scheduled_only is True:
-        results = [a for a in results if a.scheduled_service is True]
+    items: list[Airport] = []
+    for i in range(start, len(ordered)):
+        airport = ordered[i]
+        if not predicate(airport):
+            continue
+        if len(items) == limit:
+            return Page(items, encode_cursor(_id_key(items[-1])))
+        items.append(airport)
 
-    return results
+    return Page(items, None)
 
 
 def airports_in_country(country_code: str) -> list[Airport]:
@@ -118,9 +210,155 @@ def nearest_airports(
     return index.nearest(lat, lon, n, max_distance_km)
 
 
-def airports_within_radius(lat: float, lon: float, radius_km: float) -> list[Airport]:
+def nearest_airports_with_distance(
+    lat: float,
+    lon: float,
+    n: int = 1,
+    max_distance_km: float | None = None,
+    with_bearing: bool = False
+) -> list[NearbyAirport]:
+    index = _get_spatial_index()
+    return index.nearest_with_distance(lat, lon, n, max_distance_km, with_bearing)
+
+
+def airports_within_radius(
+    lat: float,
+    lon: float,
+    radius_km: float,
+    limit: int | None = None
+) -> list[Airport]:
     index = _get_spatial_index()
-    return index.within_radius(lat, lon, radius_km)
+    return index.within_radius(lat, lon, radius_km, limit)
+
+
+def airports_within_radius_with_distance(
+    lat: float,
+    lon: float,
+    radius_km: float,
+    limit: int | None = None,
+    with_bearing: bool = False
+) -> list[NearbyAirport]:
+    index = _get_spatial_index()
+    return index.within_radius_with_distance(lat, lon, radius_km, limit, with_bearing)
+
+
+def airports_in_bbox(
+    min_lat: float,
+    min_lon: float,
+    max_lat: float,
+    max_lon: float
+) -> list[Airport]:
+    """
+    Find airports inside a latitude/longitude bounding box.
+
+    Pass min_lon > max_lon for a box that crosses the antimeridian.
+
+    Examples:
+        >>> from aeronavx.core.search import airports_in_bbox
+        >>> airports = airports_in_bbox(36.0, 26.0, 42.0, 45.0)  # Turkey viewport
+    """
+    index = _get_spatial_index()
+    return index.within_bbox(min_lat, min_lon, max_lat, max_lon)
+
+
+def airports_in_polygon(vertices: Sequence[tuple[float, float]]) -> list[Airport]:
+    """
+    Find airports inside a polygon (e.g. an FIR boundary) of (lat, lon) vertices.
+    """
+    index = _get_spatial_index()
+    return index.within_polygon(vertices)
+
+
+def airports_along_route(
+    waypoints: Sequence[tuple[float, float]],
+    width_km: float
+) -> list[NearbyAirport]:
+    """
+    Find airports within width_km of a great-circle route through the waypoints.
+
+    Examples:
+        >>> from aeronavx.core.search import airports_along_route
+        >>> from aeronavx.utils.units import nmi_to_km
+        >>> route = [(41.275, 28.752), (51.4775, -0.4614)]  # IST -> LHR
+        >>> nearby = airports_along_route(route, nmi_to_km(50))
+    """
+    index = _get_spatial_index()
+    return index.within_corridor(waypoints, width_km)
+
+
+def airports_near_track(
+    lats: Sequence[float],
+    lons: Sequence[float],
+    max_distance_km: float
+) -> list[TrackProximity]:
+    """
+    Find airports a flight track passed within max_distance_km of.
+
+    Returns:
+        TrackProximity results with the closest distance and the fraction of
+        the track length where it occurs, in track order
+    """
+    index = _get_spatial_index()
+    return index.near_trajectory(lats, lons, max_distance_km)
+
+
+def airports_within_radius_page(
+    lat: float,
+    lon: float,
+    radius_km: float,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Page[NearbyAirport]:
+    """
+    Return one page of airports within a radius, nearest first.
+
+    Results are ordered by (distance, airport id) so that the order is stable
+    across requests. Each page resumes from the cursor distance and fetches
+    only the next limit + 1 neighbours, so the cost of a page does not grow
+    with its depth.
+
+    Args:
+        lat: Latitude of the center
+        lon: Longitude of the center
+        radius_km: Search radius in km
+        limit: Maximum number of airports on the page
+        cursor: next_cursor of the previous page, or None for the first page
+
+    Returns:
+        Page of distance-annotated airports and the cursor of the next page
+        (None on the last page)
+    """
+    validate_page_size(limit)
+
+    after = decode_cursor(cursor, (float, int, str)) if cursor is not None else None
+    index = _get_spatial_index()
+    n = limit + 1
+
+    while True:
+        results = index.nearest_beyond(lat, lon, after[0] if after else 0.0, n, radius_km)
+        keyed = []
+        for result in results:
+            key = (result.distance_km, *_id_key(result.airport))
+            if after is None or key > after:
+                keyed.append((key, result))
+
+        if len(results) < n:
+            break
+
+        # Airports tied with the last neighbour may be missing from results;
+        # only keys strictly closer than it are known to be complete.
+        complete = [item for item in keyed if item[0][0] < results[-1].distance_km]
+        if len(complete) > limit:
+            keyed = complete
+            break
+        n *= 2
+
+    selected = heapq.nsmallest(limit + 1, keyed, key=lambda x: x[0])
+    has_more = len(selected) > limit
+    selected = selected[:limit]
+
+    next_cursor = encode_cursor(selected[-1][0]) if has_more else None
+    return Page([r for _, r in selected], next_cursor)
 
 
 def nearest_airport(lat: float, lon: float, max_distance_km: float | None = None) -> Airport | None:
@@ -164,10 +402,14 @@ def nearest_airport_to_airport(code: str, n: int = 1, code_type: str = "iata") -
 
     all_nearest = nearest_airports(airport.latitude_deg, airport.longitude_deg, n + 1)
 
-    return [a for a in all_nearest if a.name != airport.name][:n]
+    return [a for a in all_nearest if a is not airport][:n]
 
 
 def clear_spatial_index() -> None:
-    global _spatial_index
+    global _spatial_index, _spatial_index_version, _id_order, _id_order_keys, _id_order_version
     _spatial_index = None
+    _spatial_index_version = None
+    _id_order = None
+    _id_order_keys = None
+    _id_order_version = None
     logger.info("Cleared spatial index cache")
@@ -0,0 +1,160 @@
+import math
+import threading
+from collections import OrderedDict
+
+from ..core.distance import haversine_km
+from ..core.search import get_spatial_index
+from ..utils.spatial_index import NearbyAirport
+from ..utils.validators import validate_coordinates
+
+MAX_MERCATOR_LAT = 85.05112878
+
+
+def tile_for_point(lat: float, lon: float, zoom: int) -> tuple[int, int]:
+    """
+    Return the (x, y) web-mercator (slippy map) tile containing a point.
+    """
+    validate_coordinates(lat, lon)
+
+    n = 2 ** zoom
+    lat = max(-MAX_MERCATOR_LAT, min(MAX_MERCATOR_LAT, lat))
+    lat_rad = math.radians(lat)
+
+    x = int((lon + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+
+    return (min(x, n - 1), min(max(y, 0), n - 1))
+
+
+def tile_bounds(x: int, y: int, zoom: int) -> tuple[float, float, float, float]:
+    """
+    Return (min_lat, min_lon, max_lat, max_lon) of a web-mercator tile.
+    """
+    n = 2 ** zoom
+
+    def tile_lat(ty: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * ty / n))))
+
+    return (tile_lat(y + 1), x / n * 360.0 - 180.0, tile_lat(y), (x + 1) / n * 360.0 - 180.0)
+
+
+class TileNearestCache:
+    """
+    Nearest-airport lookups answered from per-tile candidate sets.
+
+    For each web-mercator tile at `zoom`, the cache stores every airport that
+    can be among the k nearest to some point of the tile: if the k-th nearest
+    airport to the tile center is d away and the tile corners are at most r
+    from the center, no point of the tile has its k nearest farther than
+    d + 2r from the center. Candidate sets are built on first use and the
+    number of cached tiles is bounded by an LRU.
+
+    Example:
+        >>> cache = TileNearestCache(zoom=8, k=5)
+        >>> results = cache.nearest(41.0, 29.0, n=3)
+        >>> cache.stats()["hits"]
+        0
+    """
+
+    def __init__(self, zoom: int = 8, k: int = 5, maxsize: int = 4096):
+        if not 0 <= zoom <= 22:
+            raise ValueError(f"zoom must be in range [0, 22], got {zoom}")
+        if k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+        self.zoom = zoom
+        self.k = k
+        self.maxsize = maxsize
+
+        self._tiles: OrderedDict[tuple[int, int], list] = OrderedDict()
+        self._index = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def nearest(self, lat: float, lon: float, n: int | None = None) -> list[NearbyAirport]:
+        """
+        Find the n (at most k) nearest airports to a point, nearest first.
+        """
+        n = self.k if n is None else n
+        if not 1 <= n <= self.k:
+            raise ValueError(f"n must be in range [1, {self.k}], got {n}")
+
+        validate_coordinates(lat, lon)
+
+        if abs(lat) > MAX_MERCATOR_LAT:
+            return get_spatial_index().nearest_with_distance(lat, lon, n)
+
+        candidates = self.candidates(*tile_for_point(lat, lon, self.zoom))
+
+        scored = sorted(
+            (haversine_km(lat, lon, a.latitude_deg, a.longitude_deg), i, a)
+            for i, a in enumerate(candidates)
+        )
+        return [NearbyAirport(a, d) for d, _, a in scored[:n]]
+
+    def candidates(self, x: int, y: int) -> list:
+        """
+        Return the candidate airports of tile (x, y), building them if needed.
+        """
+        index = get_spatial_index()
+        key = (x, y)
+
+        with self._lock:
+            if self._index is not index:
+                self._tiles.clear()
+                self._index = index
+
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                self._hits += 1
+                return tile
+
+            self._misses += 1
+
+        tile = self._build(index, x, y)
+
+        with self._lock:
+            if self._index is index:
+                self._tiles[key] = tile
+                self._tiles.move_to_end(key)
+                while len(self._tiles) > self.maxsize:
+                    self._tiles.popitem(last=False)
+
+        return tile
+
+    def _build(self, index, x: int, y: int) -> list:
+        min_lat, min_lon, max_lat, max_lon = tile_bounds(x, y, self.zoom)
+        center_lat = (min_lat + max_lat) / 2.0
+        center_lon = (min_lon + max_lon) / 2.0
+
+        corner_km = max(
+            haversine_km(center_lat, center_lon, lat, lon)
+            for lat in (min_lat, max_lat)
+            for lon in (min_lon, max_lon)
+        )
+
+        nearest = index.nearest_with_distance(center_lat, center_lon, self.k)
+        if not nearest:
+            return []
+
+        radius_km = nearest[-1].distance_km + 2.0 * corner_km
+        return index.within_radius(center_lat, center_lon, radius_km)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tiles.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "tiles": len(self._tiles),
+                "maxsize": self.maxsize,
+            }
@@ -1,40 +1,246 @@
-from datetime import datetime
-from typing import Optional
+import functools
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from typing import Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from ..core.loader import (
+    get_airport_by_iata,
+    get_airport_by_icao,
+    get_airport_row,
+    get_all_airports,
+    get_dataset_fingerprint,
+    get_dataset_version,
+)
 from ..models.airport import Airport
-from ..core.loader import get_airport_by_iata, get_airport_by_icao
+from ..utils.cache import memoize
 from ..utils.logging import get_logger
-
+from ..utils.result_cache import Codec, get_result_cache
 
 logger = get_logger()
 
 
 try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+try:
+    import timezonefinder
     from timezonefinder import TimezoneFinder
+
     _tz_finder = TimezoneFinder()
+    _tz_finder_version = getattr(timezonefinder, "__version__", "")
     HAS_TIMEZONEFINDER = True
 except ImportError:
     _tz_finder = None
+    _tz_finder_version = None
     HAS_TIMEZONEFINDER = False
     logger.warning("timezonefinder not installed, timezone functionality will be limited")
 
 
-def get_timezone_for_airport(airport: Airport) -> str | None:
-    if not HAS_TIMEZONEFINDER:
-        return None
+_UNRESOLVED = -2
+_NO_TIMEZONE = -1
+
+
+@memoize(maxsize=65536)
+def _timezone_at(lat: float, lon: float) -> str | None:
+    return _tz_finder.timezone_at(lat=lat, lng=lon)
+
 
+def _lookup(airport: Airport) -> str | None:
     try:
-        tz_name = _tz_finder.timezone_at(
-            lat=airport.latitude_deg,
-            lng=airport.longitude_deg
-        )
-        return tz_name
+        return _timezone_at(airport.latitude_deg, airport.longitude_deg)
     except Exception as e:
         logger.debug(f"Could not determine timezone for {airport.name}: {e}")
         return None
 
 
+class TimezoneColumn:
+    """
+    Timezone of every loaded airport, by row id, as an interned tzid column.
+
+    Each row holds an int16 code into `names` (-1: no timezone, -2: not
+    resolved yet). Rows are resolved on first access or all at once with
+    resolve_all(), so each airport costs at most one polygon lookup per
+    dataset version.
+    """
+
+    def __init__(self, airports: list[Airport], version: int):
+        self.airports = airports
+        self.version = version
+        self.names: list[str] = []
+        self.codes = array("h", [_UNRESOLVED]) * len(airports)
+        self._name_codes: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, row: int) -> str | None:
+        code = self.codes[row]
+        if code == _UNRESOLVED:
+            code = self._resolve(row)
+        return None if code == _NO_TIMEZONE else self.names[code]
+
+    def resolve_all(self) -> int:
+        resolved = 0
+        for row, code in enumerate(self.codes):
+            if code == _UNRESOLVED:
+                self._resolve(row)
+                resolved += 1
+        return resolved
+
+    @property
+    def complete(self) -> bool:
+        return _UNRESOLVED not in self.codes
+
+    def seed(self, other: "TimezoneColumn") -> None:
+        # Reuse resolved rows of a previous version for airports at the same position
+        known = {
+            (a.latitude_deg, a.longitude_deg): other.codes[row]
+            for row, a in enumerate(other.airports)
+            if other.codes[row] != _UNRESOLVED
+        }
+        for row, airport in enumerate(self.airports):
+            code = known.get((airport.latitude_deg, airport.longitude_deg))
+            if code is not None:
+                self.codes[row] = self._intern(None if code == _NO_TIMEZONE else other.names[code])
+
+    def _resolve(self, row: int) -> int:
+        code = self._intern(_lookup(self.airports[row]))
+        self.codes[row] = code
+        return code
+
+    def _intern(self, name: str | None) -> int:
+        if name is None:
+            return _NO_TIMEZONE
+
+        code = self._name_codes.get(name)
+        if code is None:
+            with self._lock:
+                code = self._name_codes.get(name)
+                if code is None:
+                    code = len(self.names)
+                    self.names.append(name)
+                    self._name_codes[name] = code
+        return code
+
+
+_COLUMN_HEADER = struct.Struct("<qq")
+
+
+def _encode_column(column: tuple[list[str], array]) -> bytes:
+    names, codes = column
+    codes = array("h", codes)
+    if sys.byteorder != "little":
+        codes.byteswap()
+    names = "\0".join(names).encode("utf-8")
+    return _COLUMN_HEADER.pack(len(names), len(codes)) + names + codes.tobytes()
+
+
+def _decode_column(data: bytes) -> tuple[list[str], array]:
+    names_length, rows = _COLUMN_HEADER.unpack_from(data)
+    offset = _COLUMN_HEADER.size
+    names_blob = data[offset : offset + names_length].decode("utf-8")
+    codes = array("h")
+    codes.frombytes(data[offset + names_length :])
+    if len(codes) != rows:
+        raise ValueError("Truncated timezone column")
+    if sys.byteorder != "little":
+        codes.byteswap()
+    return (names_blob.split("\0") if names_blob else []), codes
+
+
+TIMEZONE_COLUMN_CODEC = Codec("timezone_column", _encode_column, _decode_column)
+
+_column: TimezoneColumn | None = None
+_column_lock = threading.Lock()
+
+
+def _column_cache_key(cache) -> str:
+    # The column depends on the data and on the timezonefinder release
+    params = {"timezonefinder": _tz_finder_version}
+    return cache.key(get_dataset_fingerprint(), "timezone.timezone_column", params)
+
+
+def get_timezone_column() -> TimezoneColumn:
+    """
+    Return the timezone column of the loaded data, creating it for a new dataset version.
+
+    If the on-disk result cache holds a complete column for this dataset, it
+    is loaded instead of resolving airports again.
+    """
+    global _column
+
+    version = get_dataset_version()
+    column = _column
+    if column is not None and column.version == version:
+        return column
+
+    with _column_lock:
+        if _column is not None and _column.version == version:
+            return _column
+
+        column = TimezoneColumn(get_all_airports(), version)
+        cache = get_result_cache()
+
+        if cache is not None:
+            key = _column_cache_key(cache)
+            stored = cache.get(key, TIMEZONE_COLUMN_CODEC)
+            if stored is not None and len(stored[1]) == len(column.codes):
+                column.names, column.codes = stored
+                column._name_codes = {name: code for code, name in enumerate(column.names)}
+
+        if _column is not None and not column.complete:
+            column.seed(_column)
+
+        _column = column
+        return column
+
+
+def precompute_timezones() -> TimezoneColumn:
+    """
+    Resolve the timezone of every loaded airport in one batch pass.
+
+    With the on-disk result cache enabled the finished column is stored, so
+    later processes over the same data skip the lookups entirely.
+    """
+    column = get_timezone_column()
+    if not HAS_TIMEZONEFINDER:
+        return column
+
+    if column.resolve_all():
+        cache = get_result_cache()
+        if cache is not None:
+            key = _column_cache_key(cache)
+            try:
+                cache.put(key, (column.names, column.codes), TIMEZONE_COLUMN_CODEC)
+            except OSError as e:
+                logger.warning(f"Could not store timezone column: {e}")
+
+    return column
+
+
+def get_timezone_for_airport(airport: Airport) -> str | None:
+    if not HAS_TIMEZONEFINDER:
+        return None
+
+    row = get_airport_row(airport, load=False)
+    if row is None:
+        return _lookup(airport)
+
+    column = get_timezone_column()
+    if row >= len(column.codes) or column.airports[row] is not airport:
+        return _lookup(airport)
+
+    return column.get(row)
+
+
 def get_timezone_for_code(code: str, code_type: str = "iata") -> str | None:
     if code_type == "iata":
         airport = get_airport_by_iata(code)
@@ -49,37 +255,40 @@ def get_timezone_for_code(code: str, code_type: str = "iata") -> str | None:
     return get_timezone_for_airport(airport)
 
 
-def local_time_for_airport(
-    airport: Airport,
-    dt_utc: Optional[datetime] = None
-) -> datetime | None:
+@functools.cache
+def _zone(tz_name: str) -> ZoneInfo | None:
+    try:
+        return ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.debug(f"Timezone {tz_name} not found")
+        return None
+
+
+def local_time_for_airport(airport: Airport, dt_utc: datetime | None = None) -> datetime | None:
     tz_name = get_timezone_for_airport(airport)
 
     if tz_name is None:
         return None
 
     if dt_utc is None:
-        dt_utc = datetime.utcnow()
+        dt_utc = datetime.now(timezone.utc)
 
     if dt_utc.tzinfo is None:
-        dt_utc = dt_utc.replace(tzinfo=ZoneInfo("UTC"))
+        dt_utc = dt_utc.replace(tzinfo=timezone.utc)
 
-    try:
-        tz = ZoneInfo(tz_name)
-        local_dt = dt_utc.astimezone(tz)
-        return local_dt
-    except ZoneInfoNotFoundError:
-        logger.debug(f"Timezone {tz_name} not found")
+    tz = _zone(tz_name)
+    if tz is None:
         return None
+
+    try:
+        return dt_utc.astimezone(tz)
     except Exception as e:
         logger.debug(f"Error converting to local time: {e}")
         return None
 
 
 def local_time_for_code(
-    code: str,
-    code_type: str = "iata",
-    dt_utc: Optional[datetime] = None
+    code: str, code_type: str = "iata", dt_utc: datetime | None = None
 ) -> datetime | None:
     if code_type == "iata":
         airport = get_airport_by_iata(code)
@@ -92,3 +301,167 @@ def local_time_for_code(
         return None
 
     return local_time_for_airport(airport, dt_utc)
+
+
+_DAY = 86400
+_offset_tables: dict[str, tuple[Any, Any, int, int]] = {}
+_offset_tables_lock = threading.Lock()
+
+
+def _offset_at(zone: ZoneInfo, ts: int) -> int:
+    return int(
+        datetime.fromtimestamp(ts, timezone.utc).astimezone(zone).utcoffset().total_seconds()
+    )
+
+
+def _build_offset_table(zone: ZoneInfo, start: int, end: int) -> tuple[Any, Any]:
+    # Sample daily and bisect every change down to the second. Zones do not
+    # change offset twice within a day, so no transition is missed.
+    samples = list(range(start, end, _DAY)) + [end]
+    times = [start]
+    offsets = [_offset_at(zone, start)]
+
+    for lo, hi in zip(samples, samples[1:]):
+        hi_offset = _offset_at(zone, hi)
+        if hi_offset == offsets[-1]:
+            continue
+
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if _offset_at(zone, mid) == offsets[-1]:
+                lo = mid
+            else:
+                hi = mid
+
+        times.append(hi)
+        offsets.append(hi_offset)
+
+    return np.array(times, dtype=np.int64), np.array(offsets, dtype=np.int64)
+
+
+def _offset_table(tz_name: str, zone: ZoneInfo, start: int, end: int) -> tuple[Any, Any]:
+    """
+    Return the (transition_times, offsets) table of a zone covering [start, end].
+
+    Tables are cached per zone and widened when a batch falls outside them.
+    """
+    start = start // _DAY * _DAY - _DAY
+    end = end // _DAY * _DAY + 2 * _DAY
+
+    with _offset_tables_lock:
+        cached = _offset_tables.get(tz_name)
+        if cached is not None and cached[2] <= start and end <= cached[3]:
+            return cached[0], cached[1]
+        if cached is not None:
+            start, end = min(start, cached[2]), max(end, cached[3])
+
+    times, offsets = _build_offset_table(zone, start, end)
+
+    with _offset_tables_lock:
+        _offset_tables[tz_name] = (times, offsets, start, end)
+
+    return times, offsets
+
+
+def _epoch_seconds(instants: Any) -> Any:
+    if isinstance(instants, datetime):
+        instants = [instants]
+
+    if isinstance(instants, np.ndarray) and np.issubdtype(instants.dtype, np.datetime64):
+        return instants.astype("datetime64[s]").astype(np.int64)
+
+    values = list(instants) if not isinstance(instants, np.ndarray) else instants
+    if len(values) and isinstance(values[0], datetime):
+        return np.array(
+            [
+                int((dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp())
+                for dt in values
+            ],
+            dtype=np.int64,
+        )
+
+    return np.asarray(values, dtype=np.float64).astype(np.int64)
+
+
+def utc_offsets(airports: Sequence[Airport], instants: Any) -> Any:
+    """
+    UTC offsets in seconds of many (airport, instant) pairs.
+
+    Pairs are grouped by timezone and each group is answered from a cached
+    transition table with one searchsorted call, instead of a ZoneInfo
+    conversion per pair. Requires numpy.
+
+    Args:
+        airports: Airports, one per pair
+        instants: UTC instants, one per pair or a single one for all: datetimes
+            (naive ones are taken as UTC), numpy datetime64 or epoch seconds
+
+    Returns:
+        float64 array of offsets in seconds; NaN where the timezone is unknown
+
+    Example:
+        >>> utc_offsets([jfk, ist], datetime(2024, 7, 1, 12))
+        array([-14400., 10800.])
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for utc_offsets")
+
+    seconds = np.broadcast_to(_epoch_seconds(instants), (len(airports),))
+    offsets = np.full(len(airports), np.nan)
+
+    # Resolve each distinct airport once and give each timezone a small code
+    zone_codes: dict[str, int] = {}
+    airport_codes: dict[int, int] = {}
+
+    def code_of(airport: Airport) -> int:
+        code = airport_codes.get(id(airport))
+        if code is None:
+            tz_name = get_timezone_for_airport(airport)
+            code = -1 if tz_name is None else zone_codes.setdefault(tz_name, len(zone_codes))
+            airport_codes[id(airport)] = code
+        return code
+
+    codes = np.fromiter((code_of(a) for a in airports), dtype=np.int64, count=len(airports))
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(zone_codes) + 1))
+
+    for tz_name, code in zone_codes.items():
+        zone = _zone(tz_name)
+        if zone is None:
+            continue
+
+        members = order[bounds[code] : bounds[code + 1]]
+        group_seconds = seconds[members]
+        times, table = _offset_table(
+            tz_name, zone, int(group_seconds.min()), int(group_seconds.max())
+        )
+        offsets[members] = table[np.searchsorted(times, group_seconds, side="right") - 1]
+
+    return offsets
+
+
+def local_times(airports: Sequence[Airport], instants: Any) -> Any:
+    """
+    Local wall-clock times of many (airport, UTC instant) pairs.
+
+    Same inputs as utc_offsets. Requires numpy.
+
+    Returns:
+        Naive datetime64[s] array of local times; NaT where the timezone is unknown
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for local_times")
+
+    seconds = np.broadcast_to(_epoch_seconds(instants), (len(airports),))
+    offsets = utc_offsets(airports, seconds)
+
+    known = ~np.isnan(offsets)
+    local = np.full(len(airports), np.datetime64("NaT"), dtype="datetime64[s]")
+    local[known] = (seconds[known] + offsets[known].astype(np.int64)).astype("datetime64[s]")
+
+    return local
+
+
+def clear_offset_tables() -> None:
+    with _offset_tables_lock:
+        _offset_tables.clear()
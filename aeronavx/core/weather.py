@@ -1,10 +1,25 @@
+import asyncio
+import os
 import re
-from typing import Optional
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal, Optional, TypeVar
 
 from ..exceptions import WeatherDataError
+from ..utils.cache import BoundedCache
 from ..utils.logging import get_logger
 from ..utils.validators import is_valid_icao
+from .metar import DecodedReport, decode_reports
 
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
 
 try:
     import requests
@@ -13,11 +28,35 @@ except ImportError:
     HAS_REQUESTS = False
 
 
+T = TypeVar('T')
+
+Product = Literal["metar", "taf"]
+
 logger = get_logger()
 
 
-METAR_URL_TEMPLATE = "https://tgftp.nws.noaa.gov/data/observations/metar/stations/{icao}.TXT"
-TAF_URL_TEMPLATE = "https://tgftp.nws.noaa.gov/data/forecasts/taf/stations/{icao}.TXT"
+DEFAULT_BASE_URL = "https://tgftp.nws.noaa.gov/data"
+
+_PRODUCT_PATHS = {
+    "metar": "observations/metar/stations/{icao}.TXT",
+    "taf": "forecasts/taf/stations/{icao}.TXT",
+}
+
+# Hourly bundles with every report issued in that cycle
+_CYCLE_PATHS = {
+    "metar": "observations/metar/cycles/{hour:02d}Z.TXT",
+    "taf": "forecasts/taf/cycles/{hour:02d}Z.TXT",
+}
+
+# Seconds a report is served without asking upstream again
+DEFAULT_TTLS = {"metar": 300.0, "taf": 1800.0}
+DEFAULT_NEGATIVE_TTL = 900.0
+DEFAULT_STALE_TTL = 3600.0
+
+METAR_URL_TEMPLATE = f"{DEFAULT_BASE_URL}/{_PRODUCT_PATHS['metar']}"
+TAF_URL_TEMPLATE = f"{DEFAULT_BASE_URL}/{_PRODUCT_PATHS['taf']}"
+
+_base_url = DEFAULT_BASE_URL
 
 
 def _sanitize_icao(icao: str) -> str:
@@ -29,69 +68,716 @@ def _sanitize_icao(icao: str) -> str:
     return icao_clean
 
 
-def get_metar(icao: str, timeout: float = 5.0) -> str | None:
-    if not HAS_REQUESTS:
-        logger.warning("requests library not installed, cannot fetch METAR data")
+def _product_url(base_url: str, product: Product, icao: str) -> str:
+    if product not in _PRODUCT_PATHS:
+        raise ValueError(f"Unknown weather product: {product}")
+
+    return f"{base_url.rstrip('/')}/{_PRODUCT_PATHS[product].format(icao=icao)}"
+
+
+def cycle_url(product: Product, hour: int, base_url: str | None = None) -> str:
+    """
+    Return the URL of the cycle file for a product and UTC hour (0-23).
+    """
+    if product not in _CYCLE_PATHS:
+        raise ValueError(f"Unknown weather product: {product}")
+    if not 0 <= hour <= 23:
+        raise ValueError(f"hour must be between 0 and 23, got {hour}")
+
+    return f"{(base_url or _base_url).rstrip('/')}/{_CYCLE_PATHS[product].format(hour=hour)}"
+
+
+def _parse_report(product: Product, text: str) -> str:
+    # Station files start with an observation timestamp line
+    lines = text.strip().split('\n')
+
+    if len(lines) < 2:
+        return text.strip()
+
+    if product == "metar":
+        return lines[1].strip()
+
+    return '\n'.join(lines[1:]).strip()
+
+
+def set_weather_base_url(base_url: str | None) -> None:
+    """
+    Fetch reports from another server laid out like the NWS one, or reset with None.
+
+    The path below base_url is observations/metar/stations/<ICAO>.TXT for
+    METARs and forecasts/taf/stations/<ICAO>.TXT for TAFs.
+    """
+    global _base_url
+
+    _base_url = DEFAULT_BASE_URL if base_url is None else base_url
+    _runner.reset()
+
+
+def get_weather_base_url() -> str:
+    return _base_url
+
+
+@dataclass(frozen=True, slots=True)
+class WeatherCacheStats:
+    hits: int
+    stale_hits: int
+    negative_hits: int
+    misses: int
+    coalesced: int
+    table_hits: int
+    refreshes: int
+    errors: int
+    currsize: int
+
+
+class _CachedReport:
+    __slots__ = ("report", "fetched_at")
+
+    def __init__(self, report: str | None, fetched_at: float):
+        self.report = report
+        self.fetched_at = fetched_at
+
+
+class WeatherCache:
+    """
+    Report cache with per-product TTLs, stale-while-revalidate and negative entries.
+
+    A report younger than its product TTL is fresh and served directly. Once
+    expired it stays servable for stale_ttl more seconds while the client
+    refreshes it in the background. The requests fallback used without httpx
+    has no background loop: it refetches a stale entry in line and serves it
+    only if that request fails. Stations without a report (404) are
+    remembered for negative_ttl so they are not asked for again on every
+    call; failed requests are never cached.
+
+    Keys are (base_url, product, icao), so clients pointed at different
+    servers do not share entries.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        stale_ttl: float = DEFAULT_STALE_TTL,
+        maxsize: int = 8192,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self._timer = timer
+        self._entries = BoundedCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+
+    def set_ttl(self, product: Product, ttl: float) -> None:
+        if product not in _PRODUCT_PATHS:
+            raise ValueError(f"Unknown weather product: {product}")
+        if ttl < 0:
+            raise ValueError(f"TTL must be non-negative, got {ttl}")
+
+        self.ttls[product] = ttl
+
+    def lookup(
+        self, key: tuple[str, Product, str]
+    ) -> tuple[Literal["fresh", "stale", "miss"], str | None]:
+        """
+        Return (state, report): "fresh" and "stale" entries carry the cached
+        report (None for a station known to have none), "miss" means fetch.
+        """
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            age = self._timer() - entry.fetched_at
+
+            if entry.report is None:
+                if age < self.negative_ttl:
+                    self.record("negative_hits")
+                    return "fresh", None
+            else:
+                ttl = self.ttls[key[1]]
+                if age < ttl:
+                    self.record("hits")
+                    return "fresh", entry.report
+                if age < ttl + self.stale_ttl:
+                    self.record("stale_hits")
+                    return "stale", entry.report
+
+        self.record("misses")
+        return "miss", None
+
+    def store(self, key: tuple[str, Product, str], report: str | None) -> None:
+        self._entries.set(key, _CachedReport(report, self._timer()))
+
+    def record(self, event: str) -> None:
+        with self._lock:
+            self._counts[event] += 1
+
+    def stats(self) -> WeatherCacheStats:
+        with self._lock:
+            counts = dict(self._counts)
+
+        return WeatherCacheStats(
+            hits=counts.get("hits", 0),
+            stale_hits=counts.get("stale_hits", 0),
+            negative_hits=counts.get("negative_hits", 0),
+            misses=counts.get("misses", 0),
+            coalesced=counts.get("coalesced", 0),
+            table_hits=counts.get("table_hits", 0),
+            refreshes=counts.get("refreshes", 0),
+            errors=counts.get("errors", 0),
+            currsize=len(self._entries),
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+        with self._lock:
+            self._counts.clear()
+
+
+_cache = WeatherCache()
+
+
+def get_weather_cache() -> WeatherCache:
+    return _cache
+
+
+def get_weather_cache_stats() -> WeatherCacheStats:
+    return _cache.stats()
+
+
+def clear_weather_cache() -> None:
+    _cache.clear()
+
+
+_TIMESTAMP_RE = re.compile(r"^\d{4}/\d{2}/\d{2} \d{2}:\d{2}$")
+_REPORT_PREFIXES = frozenset({"METAR", "SPECI", "TAF", "AMD", "COR"})
+
+
+class _CycleParser:
+    """
+    Incremental parser for cycle files: blocks of a timestamp line followed
+    by one report, separated by blank lines. Lines are fed one at a time so
+    a bundle is never held in memory as a whole.
+    """
+
+    def __init__(self, product: Product):
+        self.product = product
+        self._timestamp: str | None = None
+        self._lines: list[str] = []
+
+    def feed(self, line: str) -> tuple[str, str, str] | None:
+        """Consume one line; return (icao, timestamp, report) when a block ends."""
+        line = line.rstrip("\r\n")
+
+        if _TIMESTAMP_RE.match(line):
+            done = self.finish()
+            self._timestamp = line
+            return done
+
+        if not line.strip():
+            return self.finish()
+
+        if self._timestamp is not None:
+            self._lines.append(line)
+
         return None
 
-    try:
-        icao_clean = _sanitize_icao(icao)
-        url = METAR_URL_TEMPLATE.format(icao=icao_clean)
+    def finish(self) -> tuple[str, str, str] | None:
+        timestamp, lines = self._timestamp, self._lines
+        self._timestamp, self._lines = None, []
 
-        response = requests.get(url, timeout=timeout)
+        if timestamp is None or not lines:
+            return None
 
-        if response.status_code == 404:
-            logger.debug(f"METAR not found for {icao_clean}")
+        if self.product == "metar":
+            report = " ".join(line.strip() for line in lines)
+        else:
+            report = "\n".join(lines).strip()
+
+        station = next((t for t in report.split() if t not in _REPORT_PREFIXES), "")
+        if not is_valid_icao(station):
             return None
 
-        response.raise_for_status()
+        return station, timestamp, report
 
-        lines = response.text.strip().split('\n')
 
-        if len(lines) >= 2:
-            return lines[1].strip()
+class StationReportTable:
+    """
+    In-memory station -> latest report table filled from cycle files.
 
-        return response.text.strip()
+    Ingesting one bundle replaces thousands of per-station requests; while
+    an entry is younger than its product TTL, WeatherClient and the sync
+    get_* functions answer from it without touching the network. When a
+    station appears more than once, the report with the latest timestamp
+    wins, so re-ingesting an older cycle never overwrites newer data.
+    """
 
-    except WeatherDataError:
-        raise
+    def __init__(self, timer: Callable[[], float] = time.monotonic):
+        self._timer = timer
+        self._lock = threading.Lock()
+        # product -> icao -> (timestamp, report, loaded_at)
+        self._reports: dict[str, dict[str, tuple[str, str, float]]] = {
+            product: {} for product in _PRODUCT_PATHS
+        }
+
+    def __len__(self) -> int:
+        return sum(len(reports) for reports in self._reports.values())
+
+    def ingest(self, lines: Iterable[str], product: Product = "metar") -> int:
+        """
+        Parse cycle-file lines into the table.
+
+        Returns:
+            Number of station reports added or updated
+        """
+        parser = self.parser(product)
+        updated = 0
+
+        for line in lines:
+            updated += self.add(parser.feed(line), product)
+
+        return updated + self.add(parser.finish(), product)
+
+    def parser(self, product: Product) -> _CycleParser:
+        if product not in _PRODUCT_PATHS:
+            raise ValueError(f"Unknown weather product: {product}")
+
+        return _CycleParser(product)
+
+    def add(self, parsed: tuple[str, str, str] | None, product: Product) -> int:
+        if parsed is None:
+            return 0
+
+        icao, timestamp, report = parsed
+        reports = self._reports[product]
+
+        with self._lock:
+            current = reports.get(icao)
+            if current is not None and current[0] > timestamp:
+                return 0
+            reports[icao] = (timestamp, report, self._timer())
+
+        return 1
+
+    def get(self, product: Product, icao: str, max_age: float) -> str | None:
+        entry = self._reports[product].get(icao)
+
+        if entry is None or self._timer() - entry[2] >= max_age:
+            return None
+
+        return entry[1]
+
+    def stations(self, product: Product = "metar") -> list[str]:
+        return list(self._reports[product])
+
+    def clear(self) -> None:
+        with self._lock:
+            for reports in self._reports.values():
+                reports.clear()
+
+
+_stations = StationReportTable()
+
+
+def get_station_table() -> StationReportTable:
+    return _stations
+
+
+def _is_url(source: str | Path) -> bool:
+    return isinstance(source, str) and source.startswith(("http://", "https://"))
+
+
+def _iter_url_lines(url: str, timeout: float) -> Iterator[str]:
+    if HAS_HTTPX:
+        with httpx.stream("GET", url, timeout=timeout) as response:
+            response.raise_for_status()
+            yield from response.iter_lines()
+    elif HAS_REQUESTS:
+        with requests.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            response.encoding = response.encoding or "ascii"
+            yield from response.iter_lines(decode_unicode=True)
+    else:
+        raise WeatherDataError("httpx or requests is required to download cycle files")
+
+
+def ingest_cycle(source: str | Path, product: Product = "metar", timeout: float = 30.0) -> int:
+    """
+    Load a METAR or TAF cycle file into the station table.
+
+    The file is parsed line by line as it is read or downloaded. Later
+    get_metar/get_taf calls (sync or through WeatherClient) for stations in
+    the bundle are answered from memory until the product TTL passes.
+
+    Args:
+        source: Local path or http(s) URL of the cycle file (see cycle_url)
+        product: "metar" or "taf"
+        timeout: Download timeout in seconds for URLs
+
+    Returns:
+        Number of station reports added or updated
+
+    Example:
+        >>> ingest_cycle(cycle_url("metar", 12))
+        4711
+    """
+    try:
+        if _is_url(source):
+            return _stations.ingest(_iter_url_lines(source, timeout), product)
+
+        with open(os.fspath(source), encoding="ascii", errors="replace") as f:
+            return _stations.ingest(f, product)
+
+    except OSError as e:
+        raise WeatherDataError(f"Failed to read cycle file {source}: {e}")
     except Exception as e:
-        if HAS_REQUESTS and hasattr(e, '__module__') and 'requests' in e.__module__:
-            logger.debug(f"Failed to fetch METAR for {icao}: {e}")
-        else:
-            logger.debug(f"Unexpected error fetching METAR: {e}")
-        return None
+        if HAS_HTTPX and isinstance(e, httpx.HTTPError):
+            raise WeatherDataError(f"Failed to download cycle file {source}: {e}")
+        if HAS_REQUESTS and isinstance(e, requests.RequestException):
+            raise WeatherDataError(f"Failed to download cycle file {source}: {e}")
+        raise
 
 
-def get_taf(icao: str, timeout: float = 5.0) -> str | None:
+def clear_station_table() -> None:
+    _stations.clear()
+
+
+class WeatherClient:
+    """
+    Asyncio weather client with a pooled keep-alive connection set.
+
+    One httpx.AsyncClient is shared by all requests, and at most
+    max_concurrency of them are in flight at once, so batch fetches of many
+    stations reuse a few connections instead of opening one per station.
+    Reports go through a WeatherCache (the shared one unless another is
+    given, none with use_cache=False), and concurrent requests for the same
+    station share a single upstream fetch. A missing report (404) or a
+    failed request yields None.
+
+    Example:
+        >>> async with WeatherClient() as client:
+        ...     reports = await client.get_metars(["LTFM", "EGLL", "KJFK"])
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float = 5.0,
+        max_concurrency: int = 16,
+        max_connections: int = 16,
+        transport: Any = None,
+        cache: WeatherCache | None = None,
+        use_cache: bool = True,
+    ):
+        if not HAS_HTTPX:
+            raise ImportError("httpx is required for WeatherClient: pip install httpx")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        self.base_url = base_url or _base_url
+        self.timeout = timeout
+        self.cache = (cache or _cache) if use_cache else None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._refreshes: set[asyncio.Task] = set()
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "WeatherClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        for task in list(self._refreshes):
+            task.cancel()
+        await self._client.aclose()
+
+    async def fetch(self, product: Product, icao: str, timeout: float | None = None) -> str | None:
+        icao_clean = _sanitize_icao(icao)
+        url = _product_url(self.base_url, product, icao_clean)
+        key = (self.base_url, product, icao_clean)
+
+        if self.cache is not None:
+            report = _stations.get(product, icao_clean, self.cache.ttls[product])
+            if report is not None:
+                self.cache.record("table_hits")
+                return report
+
+            state, report = self.cache.lookup(key)
+
+            if state == "fresh":
+                return report
+
+            if state == "stale":
+                if key not in self._inflight:
+                    self.cache.record("refreshes")
+                    task = asyncio.create_task(self._load(key, url, timeout))
+                    self._refreshes.add(task)
+                    task.add_done_callback(self._refreshes.discard)
+                return report
+
+        return await self._load(key, url, timeout)
+
+    async def ingest_cycle(self, url: str, product: Product = "metar") -> int:
+        """
+        Stream a cycle file into the station table; see the module-level ingest_cycle.
+        """
+        parser = _stations.parser(product)
+        updated = 0
+
+        try:
+            async with self._client.stream("GET", url, timeout=max(self.timeout, 30.0)) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    updated += _stations.add(parser.feed(line), product)
+        except httpx.HTTPError as e:
+            raise WeatherDataError(f"Failed to download cycle file {url}: {e}")
+
+        return updated + _stations.add(parser.finish(), product)
+
+    async def _load(
+        self, key: tuple[str, Product, str], url: str, timeout: float | None
+    ) -> str | None:
+        future = self._inflight.get(key)
+        if future is not None:
+            if self.cache is not None:
+                self.cache.record("coalesced")
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            report, cacheable = await self._download(key[1], key[2], url, timeout)
+            if cacheable and self.cache is not None:
+                self.cache.store(key, report)
+            future.set_result(report)
+            return report
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _download(
+        self, product: Product, icao: str, url: str, timeout: float | None
+    ) -> tuple[str | None, bool]:
+        """Return (report, cacheable): a 404 is a cacheable None, a failure is not."""
+        try:
+            async with self._semaphore:
+                response = await self._client.get(url, timeout=timeout or self.timeout)
+
+            if response.status_code == 404:
+                logger.debug(f"{product.upper()} not found for {icao}")
+                return None, True
+
+            response.raise_for_status()
+            return _parse_report(product, response.text), True
+
+        except httpx.HTTPError as e:
+            logger.debug(f"Failed to fetch {product.upper()} for {icao}: {e}")
+            if self.cache is not None:
+                self.cache.record("errors")
+            return None, False
+
+    async def fetch_many(
+        self,
+        product: Product,
+        icaos: Iterable[str],
+        timeout: float | None = None,
+    ) -> dict[str, str | None]:
+        # Validate everything before sending anything; duplicates are fetched once
+        codes = list(dict.fromkeys(_sanitize_icao(icao) for icao in icaos))
+        reports = await asyncio.gather(*(self.fetch(product, code, timeout) for code in codes))
+        return dict(zip(codes, reports))
+
+    async def get_metar(self, icao: str, timeout: float | None = None) -> str | None:
+        return await self.fetch("metar", icao, timeout)
+
+    async def get_taf(self, icao: str, timeout: float | None = None) -> str | None:
+        return await self.fetch("taf", icao, timeout)
+
+    async def get_metars(
+        self, icaos: Iterable[str], timeout: float | None = None
+    ) -> dict[str, str | None]:
+        """
+        Fetch the METARs of several stations concurrently.
+
+        Returns:
+            Mapping of normalized ICAO code to report (None if unavailable)
+        """
+        return await self.fetch_many("metar", icaos, timeout)
+
+    async def get_tafs(
+        self, icaos: Iterable[str], timeout: float | None = None
+    ) -> dict[str, str | None]:
+        return await self.fetch_many("taf", icaos, timeout)
+
+    async def get_decoded_metars(
+        self, icaos: Iterable[str], timeout: float | None = None
+    ) -> dict[str, DecodedReport | None]:
+        reports = await self.get_metars(icaos, timeout)
+        return dict(zip(reports, decode_reports(reports.values())))
+
+
+class _SyncRunner:
+    """
+    Background event loop owning the WeatherClient used by the sync API.
+
+    Keeping the loop (and thus the client's pool) alive between calls lets
+    blocking callers reuse connections, and works whether or not the caller
+    is itself running inside an event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: WeatherClient | None = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="aeronavx-weather", daemon=True
+                )
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    async def _get_client(self) -> WeatherClient:
+        # Runs on the background loop, so no other coroutine interleaves here
+        if self._client is None:
+            self._client = WeatherClient()
+        return self._client
+
+    def run(self, call: Callable[[WeatherClient], Coroutine[Any, Any, T]]) -> T:
+        async def invoke():
+            return await call(await self._get_client())
+
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(invoke(), loop).result()
+
+    def reset(self) -> None:
+        """Drop the shared client so the next call picks up the current settings."""
+        with self._lock:
+            loop, client = self._loop, self._client
+            self._client = None
+
+        if loop is not None and client is not None:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+
+
+_runner = _SyncRunner()
+
+_session: Optional["requests.Session"] = None
+
+
+def _fetch_blocking(product: Product, icao: str, timeout: float) -> str | None:
+    # Fallback without httpx: a shared requests session still keeps connections
+    # alive, but there is no event loop for background refreshes or coalescing
+    # of concurrent requests, so stale entries are refetched in line
+    global _session
+
     if not HAS_REQUESTS:
-        logger.warning("requests library not installed, cannot fetch TAF data")
+        logger.warning(f"httpx or requests is required to fetch {product.upper()} data")
         return None
 
-    try:
-        icao_clean = _sanitize_icao(icao)
-        url = TAF_URL_TEMPLATE.format(icao=icao_clean)
+    icao_clean = _sanitize_icao(icao)
+    url = _product_url(_base_url, product, icao_clean)
+    key = (_base_url, product, icao_clean)
+
+    report = _stations.get(product, icao_clean, _cache.ttls[product])
+    if report is not None:
+        _cache.record("table_hits")
+        return report
 
-        response = requests.get(url, timeout=timeout)
+    state, report = _cache.lookup(key)
+    if state == "fresh":
+        return report
+
+    if _session is None:
+        _session = requests.Session()
+
+    try:
+        response = _session.get(url, timeout=timeout)
 
         if response.status_code == 404:
-            logger.debug(f"TAF not found for {icao_clean}")
+            logger.debug(f"{product.upper()} not found for {icao_clean}")
+            _cache.store(key, None)
             return None
 
         response.raise_for_status()
+        report = _parse_report(product, response.text)
+        _cache.store(key, report)
+        return report
 
-        lines = response.text.strip().split('\n')
+    except requests.RequestException as e:
+        logger.debug(f"Failed to fetch {product.upper()} for {icao_clean}: {e}")
+        _cache.record("errors")
+        # Stale report if there was one, else None
+        return report
 
-        if len(lines) >= 2:
-            return '\n'.join(lines[1:]).strip()
 
-        return response.text.strip()
+def _fetch(product: Product, icao: str, timeout: float) -> str | None:
+    if HAS_HTTPX:
+        return _runner.run(lambda client: client.fetch(product, icao, timeout))
 
-    except WeatherDataError:
-        raise
-    except Exception as e:
-        if HAS_REQUESTS and hasattr(e, '__module__') and 'requests' in e.__module__:
-            logger.debug(f"Failed to fetch TAF for {icao}: {e}")
-        else:
-            logger.debug(f"Unexpected error fetching TAF: {e}")
-        return None
+    return _fetch_blocking(product, icao, timeout)
+
+
+def _fetch_many(product: Product, icaos: Iterable[str], timeout: float) -> dict[str, str | None]:
+    if HAS_HTTPX:
+        codes = list(icaos)
+        return _runner.run(lambda client: client.fetch_many(product, codes, timeout))
+
+    codes = list(dict.fromkeys(_sanitize_icao(icao) for icao in icaos))
+    return {code: _fetch_blocking(product, code, timeout) for code in codes}
+
+
+def get_metar(icao: str, timeout: float = 5.0) -> str | None:
+    return _fetch("metar", icao, timeout)
+
+
+def get_taf(icao: str, timeout: float = 5.0) -> str | None:
+    return _fetch("taf", icao, timeout)
+
+
+def get_metars(icaos: Iterable[str], timeout: float = 5.0) -> dict[str, str | None]:
+    """
+    Fetch the METARs of several stations concurrently (blocking).
+
+    Async code should use WeatherClient.get_metars instead.
+
+    Returns:
+        Mapping of normalized ICAO code to report (None if unavailable)
+    """
+    return _fetch_many("metar", icaos, timeout)
+
+
+def get_tafs(icaos: Iterable[str], timeout: float = 5.0) -> dict[str, str | None]:
+    return _fetch_many("taf", icaos, timeout)
+
+
+def get_decoded_metar(icao: str, timeout: float = 5.0) -> DecodedReport | None:
+    report = get_metar(icao, timeout)
+    return None if report is None else decode_reports([report])[0]
+
+
+def get_decoded_metars(
+    icaos: Iterable[str], timeout: float = 5.0
+) -> dict[str, DecodedReport | None]:
+    """
+    Fetch and decode the METARs of several stations; see core.metar.decode_reports.
+    """
+    reports = get_metars(icaos, timeout)
+    return dict(zip(reports, decode_reports(reports.values())))
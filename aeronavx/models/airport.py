@@ -30,15 +30,8 @@ class Airport:
         return asdict(self)
 
     def distance_to(self, other: "Airport", model: str = "haversine") -> float:
-        from ..core.distance import distance as calc_distance
-        return calc_distance(
-            self.latitude_deg,
-            self.longitude_deg,
-            other.latitude_deg,
-            other.longitude_deg,
-            model=model,
-            unit="km"
-        )
+        from ..core.distance import airport_distance
+        return airport_distance(self, other, model=model, unit="km")
 
     def bearing_to(self, other: "Airport") -> float:
         from ..core.geodesy import initial_bearing
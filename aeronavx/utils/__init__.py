@@ -1,32 +1,46 @@
-from .cache import memoize, simple_cache
+from .cache import BoundedCache, CacheInfo, memoize, simple_cache
 from .constants import (
-    EARTH_RADIUS_KM,
-    DEFAULT_CRUISE_SPEED_KTS,
     DEFAULT_CO2_KG_PER_PAX_KM,
+    DEFAULT_CRUISE_SPEED_KTS,
     DEFAULT_MAX_LEG_KM,
+    EARTH_RADIUS_KM,
 )
 from .logging import get_logger, set_log_level
-from .spatial_index import SpatialIndex, build_spatial_index
+from .neighbor_graph import NeighborGraph
+from .pagination import Page, decode_cursor, encode_cursor
+from .result_cache import (
+    JSON_CODEC,
+    NEIGHBOR_GRAPH_CODEC,
+    Codec,
+    ResultCache,
+    dataset_fingerprint,
+    get_result_cache,
+    set_result_cache_dir,
+)
+from .spatial_index import NearbyAirport, SpatialIndex, TrackProximity, build_spatial_index
 from .units import (
+    DistanceUnit,
+    ElevationUnit,
     convert_distance,
     convert_elevation,
+    ft_to_m,
     km_to_mi,
     km_to_nmi,
+    m_to_ft,
     mi_to_km,
     nmi_to_km,
-    ft_to_m,
-    m_to_ft,
-    DistanceUnit,
-    ElevationUnit,
 )
 from .validators import (
     is_valid_iata,
     is_valid_icao,
     normalize_airport_code,
+    validate_coordinate_arrays,
     validate_coordinates,
 )
 
 __all__ = [
+    "BoundedCache",
+    "CacheInfo",
     "memoize",
     "simple_cache",
     "EARTH_RADIUS_KM",
@@ -35,7 +49,20 @@ __all__ = [
     "DEFAULT_MAX_LEG_KM",
     "get_logger",
     "set_log_level",
+    "NeighborGraph",
+    "Codec",
+    "JSON_CODEC",
+    "NEIGHBOR_GRAPH_CODEC",
+    "ResultCache",
+    "dataset_fingerprint",
+    "get_result_cache",
+    "set_result_cache_dir",
+    "Page",
+    "encode_cursor",
+    "decode_cursor",
+    "NearbyAirport",
     "SpatialIndex",
+    "TrackProximity",
     "build_spatial_index",
     "convert_distance",
     "convert_elevation",
@@ -51,4 +78,5 @@ __all__ = [
     "is_valid_icao",
     "normalize_airport_code",
     "validate_coordinates",
+    "validate_coordinate_arrays",
 ]
@@ -1,27 +1,355 @@
+import asyncio
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
 from functools import lru_cache, wraps
-from typing import Any, Callable, TypeVar
-
+from typing import Any, Literal, TypeVar
 
 T = TypeVar('T')
 
+EvictionPolicy = Literal["lru", "lfu"]
 
-def simple_cache(maxsize: int = 128) -> Callable[[Callable[..., T]], Callable[..., T]]:
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        return lru_cache(maxsize=maxsize)(func)
-    return decorator
+DEFAULT_MAXSIZE = 1024
+
+_MISSING = object()
+_KWARGS_MARK = object()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    currsize: int
+    maxsize: int
+    ttl: float | None
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "count")
+
+    def __init__(self, value: Any, expires_at: float | None):
+        self.value = value
+        self.expires_at = expires_at
+        self.count = 1
+
+
+class BoundedCache:
+    """
+    Size-bounded, thread-safe key/value cache with optional TTL.
+
+    Eviction is least-recently-used ("lru") or least-frequently-used ("lfu",
+    ties broken by recency). LFU keeps one recency-ordered bucket per use
+    count, so both policies evict in O(1). Expired entries are dropped when
+    they are looked up or by purge_expired(); until then they count towards
+    maxsize.
+
+    Example:
+        >>> cache = BoundedCache(maxsize=2, ttl=60.0)
+        >>> cache.set("IST", 1)
+        >>> cache.get("IST")
+        1
+        >>> cache.info().hits
+        1
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float | None = None,
+        policy: EvictionPolicy = "lru",
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"Unknown eviction policy: {policy}")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.policy = policy
+        self._timer = timer
+
+        self._entries: dict[Hashable, _Entry] = {}
+        # LRU: a single bucket; LFU: use count -> keys in recency order
+        self._buckets: dict[int, OrderedDict[Hashable, None]] = {}
+        self._min_count = 1
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self.lookup(key)
+        return default if value is _MISSING else value
+
+    def lookup(self, key: Hashable) -> Any:
+        # Like get(), but returns the _MISSING sentinel so None can be cached
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and self._expired(entry):
+                self._remove(key, entry)
+                self._expirations += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return _MISSING
+
+            self._hits += 1
+            self._touch(key, entry)
+            return entry.value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            expires_at = None if self.ttl is None else self._timer() + self.ttl
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.value = value
+                entry.expires_at = expires_at
+                self._touch(key, entry)
+                return
+
+            while len(self._entries) >= self.maxsize:
+                self._evict()
+
+            self._entries[key] = _Entry(value, expires_at)
+            self._buckets.setdefault(1, OrderedDict())[key] = None
+            self._min_count = 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            self._remove(key, entry)
+            return default if self._expired(entry) else entry.value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self._min_count = 1
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                currsize=len(self._entries),
+                maxsize=self.maxsize,
+                ttl=self.ttl,
+            )
 
+    def purge_expired(self) -> int:
+        """
+        Drop every expired entry now instead of waiting for lookups to hit them.
+        """
+        if self.ttl is None:
+            return 0
 
-def memoize(func: Callable[..., T]) -> Callable[..., T]:
-    cache: dict[tuple[Any, ...], T] = {}
+        with self._lock:
+            now = self._timer()
+            expired = [k for k, e in self._entries.items() if e.expires_at <= now]
+            for key in expired:
+                self._remove(key, self._entries[key])
+            self._expirations += len(expired)
+            return len(expired)
 
-    @wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> T:
-        cache_key = (args, tuple(sorted(kwargs.items())))
-        if cache_key not in cache:
-            cache[cache_key] = func(*args, **kwargs)
-        return cache[cache_key]
+    def _expired(self, entry: _Entry) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= self._timer()
 
-    wrapper.cache_clear = lambda: cache.clear()
-    wrapper.cache_info = lambda: f"Cache size: {len(cache)}"
+    def _bucket_of(self, entry: _Entry) -> int:
+        return entry.count if self.policy == "lfu" else 1
+
+    def _touch(self, key: Hashable, entry: _Entry) -> None:
+        if self.policy == "lru":
+            self._buckets[1].move_to_end(key)
+            return
+
+        bucket = self._buckets[entry.count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[entry.count]
+            if self._min_count == entry.count:
+                self._min_count += 1
+
+        entry.count += 1
+        self._buckets.setdefault(entry.count, OrderedDict())[key] = None
+
+    def _remove(self, key: Hashable, entry: _Entry) -> None:
+        count = self._bucket_of(entry)
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._buckets and count == self._min_count:
+                self._min_count = min(self._buckets)
+        del self._entries[key]
+
+    def _evict(self) -> None:
+        bucket = self._buckets[self._min_count if self.policy == "lfu" else 1]
+        key = next(iter(bucket))
+        self._remove(key, self._entries[key])
+        self._evictions += 1
+
+
+class _Call:
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+def _make_key(args: tuple, kwargs: dict) -> Hashable:
+    if not kwargs:
+        return args[0] if len(args) == 1 and type(args[0]) in (str, int) else args
+    return args + (_KWARGS_MARK,) + tuple(kwargs.items())
+
+
+def memoize(
+    func: Callable[..., T] | None = None,
+    *,
+    maxsize: int = DEFAULT_MAXSIZE,
+    ttl: float | None = None,
+    policy: EvictionPolicy = "lru",
+) -> Any:
+    """
+    Memoize a function in a BoundedCache.
+
+    Can be used bare (@memoize) or with options (@memoize(maxsize=..., ttl=...)).
+    Concurrent misses on the same key are single-flight: one caller computes,
+    the others wait for its result. Exceptions are not cached. Coroutine
+    functions are supported; their results (not the coroutines) are cached.
+
+    The wrapper exposes cache_info() -> CacheInfo, cache_clear() and
+    cache_invalidate(*args, **kwargs).
+
+    Example:
+        >>> @memoize(maxsize=10_000, ttl=300)
+        ... def timezone_at(lat, lon): ...
+    """
+    if func is None:
+        return lambda f: memoize(f, maxsize=maxsize, ttl=ttl, policy=policy)
+
+    cache = BoundedCache(maxsize=maxsize, ttl=ttl, policy=policy)
+    lock = threading.Lock()
+
+    if inspect.iscoroutinefunction(func):
+        pending: dict[Hashable, tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+            key = _make_key(args, kwargs)
+            value = cache.lookup(key)
+            if value is not _MISSING:
+                return value
+
+            loop = asyncio.get_running_loop()
+            with lock:
+                inflight = pending.get(key)
+                leader = inflight is None or inflight[0] is not loop
+                if leader:
+                    future = loop.create_future()
+                    pending[key] = (loop, future)
+
+            if not leader:
+                return await asyncio.shield(inflight[1])
+
+            try:
+                value = await func(*args, **kwargs)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except BaseException as e:
+                future.set_exception(e)
+                # Mark retrieved so an unawaited failure is not logged
+                future.exception()
+                raise
+            else:
+                cache.set(key, value)
+                future.set_result(value)
+                return value
+            finally:
+                with lock:
+                    if pending.get(key, (None, None))[1] is future:
+                        del pending[key]
+
+        wrapper = async_wrapper
+    else:
+        calls: dict[Hashable, _Call] = {}
+
+        @wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> T:
+            key = _make_key(args, kwargs)
+            value = cache.lookup(key)
+            if value is not _MISSING:
+                return value
+
+            with lock:
+                call = calls.get(key)
+                leader = call is None
+                if leader:
+                    call = calls[key] = _Call()
+
+            if not leader:
+                call.event.wait()
+                if call.error is not None:
+                    raise call.error
+                return call.value
+
+            try:
+                call.value = func(*args, **kwargs)
+                cache.set(key, call.value)
+                return call.value
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with lock:
+                    del calls[key]
+                call.event.set()
+
+        wrapper = sync_wrapper
+
+    wrapper.cache = cache
+    wrapper.cache_info = cache.info
+    wrapper.cache_clear = cache.clear
+    wrapper.cache_invalidate = lambda *args, **kwargs: (
+        cache.pop(_make_key(args, kwargs), _MISSING) is not _MISSING
+    )
 
     return wrapper
+
+
+def simple_cache(maxsize: int = 128) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        return lru_cache(maxsize=maxsize)(func)
+    return decorator
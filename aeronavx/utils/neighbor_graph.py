@@ -0,0 +1,89 @@
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+_MAGIC = b"ANXKNN01"
+_HEADER = struct.Struct("<8sqqq")
+
+
+class NeighborGraph:
+    """
+    k-nearest-neighbour graph in CSR form, keyed by row id.
+
+    Row ids are positions in the airport list the graph was built from. The
+    neighbours of row r are indices[indptr[r]:indptr[r + 1]] (int32), sorted by
+    distance, with their great-circle distances in the matching slice of
+    distances_km (float32).
+    """
+
+    __slots__ = ("k", "indptr", "indices", "distances_km")
+
+    def __init__(self, k: int, indptr: array, indices: array, distances_km: array):
+        if indptr.typecode != "q" or indices.typecode != "i" or distances_km.typecode != "f":
+            raise ValueError("NeighborGraph expects int64 indptr, int32 indices, float32 distances")
+        if len(indices) != len(distances_km) or indptr[-1] != len(indices):
+            raise ValueError("Inconsistent NeighborGraph arrays")
+
+        self.k = k
+        self.indptr = indptr
+        self.indices = indices
+        self.distances_km = distances_km
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def neighbors(self, row: int) -> array:
+        return self.indices[self.indptr[row]:self.indptr[row + 1]]
+
+    def neighbor_distances(self, row: int) -> array:
+        return self.distances_km[self.indptr[row]:self.indptr[row + 1]]
+
+    def to_bytes(self) -> bytes:
+        arrays = [self.indptr, self.indices, self.distances_km]
+        if sys.byteorder != "little":
+            arrays = [array(a.typecode, a) for a in arrays]
+            for a in arrays:
+                a.byteswap()
+
+        header = _HEADER.pack(_MAGIC, self.k, len(self), len(self.indices))
+        return header + b"".join(a.tobytes() for a in arrays)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "NeighborGraph":
+        if len(data) < _HEADER.size:
+            raise ValueError("Not a neighbour graph")
+
+        magic, k, rows, nnz = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Not a neighbour graph")
+
+        arrays = []
+        offset = _HEADER.size
+        for typecode, length in (("q", rows + 1), ("i", nnz), ("f", nnz)):
+            a = array(typecode)
+            end = offset + length * a.itemsize
+            if end > len(data):
+                raise ValueError("Truncated neighbour graph")
+            a.frombytes(data[offset:end])
+            offset = end
+            arrays.append(a)
+
+        if sys.byteorder != "little":
+            for a in arrays:
+                a.byteswap()
+
+        return cls(k, *arrays)
+
+    def save(self, path: Path | str) -> None:
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(self.to_bytes())
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "NeighborGraph":
+        try:
+            return cls.from_bytes(Path(path).read_bytes())
+        except ValueError as e:
+            raise ValueError(f"{e}: {path}") from None
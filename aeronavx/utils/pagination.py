@@ -0,0 +1,63 @@
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar('T')
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(key: tuple[Any, ...]) -> str:
+    """
+    Encode the sort key of the last item on a page as an opaque cursor.
+
+    The key must only contain JSON-serializable scalars (str, int, float, None).
+    """
+    raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, types: tuple[type, ...]) -> tuple[Any, ...]:
+    """
+    Decode a cursor produced by encode_cursor back into its sort key.
+
+    Args:
+        cursor: Cursor string
+        types: Expected type of each key component (int is accepted for float)
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the expected key shape.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+    if not isinstance(key, list) or len(key) != len(types):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+    for value, expected in zip(key, types):
+        if expected is float and isinstance(value, int) and not isinstance(value, bool):
+            continue
+        if not isinstance(value, expected) or isinstance(value, bool):
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+
+    return tuple(key)
+
+
+def validate_page_size(limit: int) -> None:
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be in range [1, {MAX_PAGE_SIZE}], got {limit}")
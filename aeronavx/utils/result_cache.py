@@ -0,0 +1,196 @@
+import hashlib
+import json
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .logging import get_logger
+from .neighbor_graph import NeighborGraph
+
+T = TypeVar('T')
+
+CACHE_DIR_ENV = "AERONAVX_CACHE_DIR"
+
+_MISSING = object()
+
+_MAGIC = b"ANXRC001"
+# magic, codec name, cache key digest, payload length, payload crc32
+_HEADER = struct.Struct("<8s16s32sqI")
+
+logger = get_logger()
+
+
+@dataclass(frozen=True, slots=True)
+class Codec:
+    name: str
+    encode: Callable[[Any], bytes]
+    decode: Callable[[bytes], Any]
+
+
+JSON_CODEC = Codec(
+    "json",
+    lambda value: zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8")),
+    lambda data: json.loads(zlib.decompress(data)),
+)
+
+NEIGHBOR_GRAPH_CODEC = Codec(
+    "neighbor_graph",
+    lambda graph: graph.to_bytes(),
+    NeighborGraph.from_bytes,
+)
+
+
+def dataset_fingerprint(airports: Iterable[Any]) -> str:
+    """
+    Return a SHA-256 fingerprint of an airport list, in order.
+
+    Every field takes part, so any edit, filter or reordering of the loaded
+    data yields a different fingerprint (and thus different cache keys).
+    """
+    digest = hashlib.sha256()
+    for airport in airports:
+        digest.update(repr(airport.as_dict()).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache for derived datasets.
+
+    An entry is addressed by the SHA-256 of (dataset fingerprint, function
+    name, parameters) and stored as <key[:2]>/<key>.anx: a fixed header
+    (magic, codec, key, length, CRC32) followed by the codec payload. Writes
+    go to a temporary file that is atomically renamed into place, so readers
+    never see partial entries and concurrent writers of the same key are
+    harmless. Unreadable or corrupt entries are treated as misses.
+
+    Example:
+        >>> cache = ResultCache("~/.cache/aeronavx")
+        >>> centroids = cache.get_or_compute(
+        ...     fingerprint, "country_centroids", {}, compute_centroids, JSON_CODEC
+        ... )
+    """
+
+    def __init__(self, directory: Path | str):
+        self.directory = Path(directory).expanduser()
+
+    def key(self, fingerprint: str, function: str, params: dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"dataset": fingerprint, "function": function, "params": params},
+            sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.anx"
+
+    def get(self, key: str, codec: Codec, default: Any = None) -> Any:
+        value = self.lookup(key, codec)
+        return default if value is _MISSING else value
+
+    def lookup(self, key: str, codec: Codec) -> Any:
+        # Like get(), but returns the _MISSING sentinel so None can be cached
+        path = self.path_for(key)
+
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return _MISSING
+        except OSError as e:
+            logger.debug(f"Could not read cache entry {path}: {e}")
+            return _MISSING
+
+        try:
+            if len(data) < _HEADER.size:
+                raise ValueError("truncated header")
+
+            magic, codec_name, digest, length, crc = _HEADER.unpack_from(data)
+            payload = data[_HEADER.size:]
+
+            if magic != _MAGIC or digest != bytes.fromhex(key):
+                raise ValueError("header mismatch")
+            if codec_name.rstrip(b"\0").decode("ascii") != codec.name:
+                raise ValueError(f"stored with codec {codec_name!r}")
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                raise ValueError("corrupt payload")
+
+            return codec.decode(payload)
+        except (ValueError, zlib.error) as e:
+            logger.debug(f"Ignoring cache entry {path}: {e}")
+            return _MISSING
+
+    def put(self, key: str, value: Any, codec: Codec) -> Path:
+        payload = codec.encode(value)
+        header = _HEADER.pack(
+            _MAGIC, codec.name.encode("ascii"), bytes.fromhex(key),
+            len(payload), zlib.crc32(payload)
+        )
+
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                f.write(payload)
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        return path
+
+    def get_or_compute(
+        self,
+        fingerprint: str,
+        function: str,
+        params: dict[str, Any],
+        compute: Callable[[], T],
+        codec: Codec,
+    ) -> T:
+        key = self.key(fingerprint, function, params)
+
+        value = self.lookup(key, codec)
+        if value is not _MISSING:
+            return value
+
+        value = compute()
+
+        try:
+            self.put(key, value, codec)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry for {function}: {e}")
+
+        return value
+
+    def clear(self) -> int:
+        removed = 0
+        for path in self.directory.glob("*/*.anx"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+_result_cache: ResultCache | None = (
+    ResultCache(os.environ[CACHE_DIR_ENV]) if os.environ.get(CACHE_DIR_ENV) else None
+)
+
+
+def set_result_cache_dir(directory: Path | str | None) -> None:
+    """
+    Enable the on-disk result cache in directory, or disable it with None.
+
+    The cache starts enabled if the AERONAVX_CACHE_DIR environment variable is set.
+    """
+    global _result_cache
+    _result_cache = None if directory is None else ResultCache(directory)
+
+
+def get_result_cache() -> ResultCache | None:
+    return _result_cache
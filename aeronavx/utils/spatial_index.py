@@ -1,29 +1,154 @@
-from typing import TYPE_CHECKING, Sequence
+import math
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..models.airport import Airport
 
 try:
+    import numpy as np
     from scipy.spatial import KDTree as ScipyKDTree
     HAS_SCIPY = True
 except ImportError:
     HAS_SCIPY = False
 
+from ..core.geodesy import Vector3, _angle_between, _cross, _dot, _unit_vector
 from ..utils.constants import EARTH_RADIUS_KM
-import math
+from ..utils.neighbor_graph import NeighborGraph
+from ..utils.validators import validate_coordinates
+
+
+@dataclass(frozen=True, slots=True)
+class NearbyAirport:
+    airport: "Airport"
+    distance_km: float
+    bearing_deg: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TrackProximity:
+    airport: "Airport"
+    distance_km: float
+    fraction: float
+
+
+def _chord_for_km(distance_km: float) -> float:
+    # Straight-line distance between two points on the unit sphere separated
+    # by the given great-circle distance.
+    angle = distance_km / EARTH_RADIUS_KM
+    if angle >= math.pi:
+        return 2.0
+    return 2.0 * math.sin(angle / 2.0)
+
+
+def _arc_distance(p: Vector3, a: Vector3, b: Vector3) -> tuple[float, float]:
+    """
+    Angular distance from p to the minor great-circle arc a-b, and the
+    fraction along the arc of the closest point.
+    """
+    normal = _cross(a, b)
+    norm = math.sqrt(_dot(normal, normal))
+    arc_angle = _angle_between(a, b)
+
+    if norm < 1e-15:
+        return (_angle_between(p, a), 0.0)
+
+    normal = (normal[0] / norm, normal[1] / norm, normal[2] / norm)
+    sin_xt = max(-1.0, min(1.0, _dot(p, normal)))
+    foot = (p[0] - sin_xt * normal[0], p[1] - sin_xt * normal[1], p[2] - sin_xt * normal[2])
+
+    if _dot(_cross(a, foot), normal) >= 0 and _dot(_cross(foot, b), normal) >= 0:
+        return (abs(math.asin(sin_xt)), _angle_between(a, foot) / arc_angle)
+
+    to_a = _angle_between(p, a)
+    to_b = _angle_between(p, b)
+    return (to_a, 0.0) if to_a <= to_b else (to_b, 1.0)
+
+
+def _segments_distance(points, starts, ends):
+    """
+    Angular distance from each point to each great-circle segment, and the
+    angle from the segment start to the closest point (NumPy, K x S).
+    """
+    normals = np.cross(starts, ends)
+    norms = np.linalg.norm(normals, axis=1)
+    degenerate = norms < 1e-15
+    normals = normals / np.where(degenerate, 1.0, norms)[:, None]
+
+    def angle(u, v):
+        return np.arctan2(np.linalg.norm(np.cross(u, v), axis=-1), np.sum(u * v, axis=-1))
+
+    p = points[:, None, :]
+    sin_xt = np.clip(points @ normals.T, -1.0, 1.0)
+    foot = p - sin_xt[:, :, None] * normals[None, :, :]
+
+    on_arc = (
+        (np.sum(np.cross(starts[None, :, :], foot) * normals[None, :, :], axis=-1) >= 0)
+        & (np.sum(np.cross(foot, ends[None, :, :]) * normals[None, :, :], axis=-1) >= 0)
+        & ~degenerate[None, :]
+    )
+
+    to_start = angle(p, starts[None, :, :])
+    to_end = angle(p, ends[None, :, :])
+    seg_len = angle(starts, ends)[None, :]
+
+    distance = np.where(on_arc, np.abs(np.arcsin(sin_xt)), np.minimum(to_start, to_end))
+    along = np.where(
+        on_arc,
+        angle(starts[None, :, :], foot),
+        np.where(to_start <= to_end, 0.0, seg_len)
+    )
+
+    return distance, along
+
+
+def _lon_in_range(lon: float, min_lon: float, max_lon: float) -> bool:
+    if min_lon <= max_lon:
+        return min_lon <= lon <= max_lon
+    return lon >= min_lon or lon <= max_lon
+
+
+def _normalize_lon(lon: float) -> float:
+    return (lon + 180.0) % 360.0 - 180.0
+
+
+def _point_in_ring(x: float, y: float, ring: list[tuple[float, float]]) -> bool:
+    inside = False
+    x1, y1 = ring[-1]
+    for x2, y2 in ring:
+        if (y1 > y) != (y2 > y):
+            if x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+        x1, y1 = x2, y2
+    return inside
 
 
 class SpatialIndex:
+    """
+    Nearest-neighbour index over airport coordinates.
+
+    With scipy installed (and more than 100 airports) the index is a KD-tree
+    over unit vectors on the sphere, so the chord distances it returns convert
+    exactly to great-circle distances. Otherwise queries fall back to a linear
+    haversine scan.
+    """
+
     def __init__(self, airports: Sequence["Airport"]):
         self.airports = list(airports)
         self._use_scipy = HAS_SCIPY and len(self.airports) > 100
 
         if self._use_scipy:
-            coords_rad = [
-                (math.radians(a.latitude_deg), math.radians(a.longitude_deg))
-                for a in self.airports
-            ]
-            self._tree = ScipyKDTree(coords_rad)
+            self._lat_rad = np.radians([a.latitude_deg for a in self.airports])
+            self._lon_rad = np.radians([a.longitude_deg for a in self.airports])
+            cos_lat = np.cos(self._lat_rad)
+            self._xyz = np.column_stack((
+                cos_lat * np.cos(self._lon_rad),
+                cos_lat * np.sin(self._lon_rad),
+                np.sin(self._lat_rad),
+            ))
+            self._tree = ScipyKDTree(self._xyz)
         else:
             self._tree = None
 
@@ -34,82 +159,627 @@ class SpatialIndex:
         n: int = 1,
         max_distance_km: float | None = None
     ) -> list["Airport"]:
+        return [r.airport for r in self.nearest_with_distance(lat, lon, n, max_distance_km)]
+
+    def nearest_with_distance(
+        self,
+        lat: float,
+        lon: float,
+        n: int = 1,
+        max_distance_km: float | None = None,
+        with_bearing: bool = False
+    ) -> list[NearbyAirport]:
+        """
+        Find the n nearest airports, annotated with their great-circle distance.
+
+        Args:
+            lat: Latitude of the query point
+            lon: Longitude of the query point
+            n: Number of airports to return
+            max_distance_km: Only return airports within this distance
+            with_bearing: Also compute the initial bearing from the query point
+
+        Returns:
+            NearbyAirport results sorted by distance
+        """
+        if n < 1 or not self.airports:
+            return []
+
         if self._use_scipy:
-            return self._nearest_scipy(lat, lon, n, max_distance_km)
+            indices, distances_km = self._query_scipy(lat, lon, n, max_distance_km)
         else:
-            return self._nearest_linear(lat, lon, n, max_distance_km)
+            indices, distances_km = self._query_linear(lat, lon, n, max_distance_km)
+
+        return self._annotate(lat, lon, indices, distances_km, with_bearing)
 
-    def _nearest_scipy(
+    def within_radius(
         self,
         lat: float,
         lon: float,
-        n: int,
-        max_distance_km: float | None
+        radius_km: float,
+        limit: int | None = None
     ) -> list["Airport"]:
-        lat_rad = math.radians(lat)
-        lon_rad = math.radians(lon)
+        return [r.airport for r in self.within_radius_with_distance(lat, lon, radius_km, limit)]
 
-        if max_distance_km is not None:
-            max_distance_rad = max_distance_km / EARTH_RADIUS_KM
-            distances, indices = self._tree.query(
-                [lat_rad, lon_rad],
-                k=min(n, len(self.airports)),
-                distance_upper_bound=max_distance_rad
+    def within_radius_with_distance(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        limit: int | None = None,
+        with_bearing: bool = False
+    ) -> list[NearbyAirport]:
+        """
+        Find all airports within a radius, nearest first.
+
+        Args:
+            lat: Latitude of the center
+            lon: Longitude of the center
+            radius_km: Search radius in km
+            limit: Return at most this many airports; the tree search stops
+                once the nearest `limit` airports are known
+            with_bearing: Also compute the initial bearing from the center
+
+        Returns:
+            NearbyAirport results sorted by distance
+        """
+        if limit is not None:
+            return self.nearest_with_distance(lat, lon, limit, radius_km, with_bearing)
+
+        if not self.airports:
+            return []
+
+        if self._use_scipy:
+            query = np.array(_unit_vector(lat, lon))
+            indices = np.asarray(
+                self._tree.query_ball_point(query, _chord_for_km(radius_km) * (1 + 1e-12)),
+                dtype=np.intp
             )
+            chords = np.linalg.norm(self._xyz[indices] - query, axis=1)
+            order = np.argsort(chords, kind="stable")
+            distances_km = self._chord_to_km(chords[order])
+            keep = distances_km <= radius_km
+            indices = indices[order][keep]
+            distances_km = distances_km[keep]
         else:
-            distances, indices = self._tree.query(
-                [lat_rad, lon_rad],
-                k=min(n, len(self.airports))
+            indices, distances_km = self._query_linear(lat, lon, len(self.airports), radius_km)
+
+        return self._annotate(lat, lon, indices, distances_km, with_bearing)
+
+    def nearest_beyond(
+        self,
+        lat: float,
+        lon: float,
+        min_distance_km: float,
+        n: int,
+        max_distance_km: float | None = None
+    ) -> list[NearbyAirport]:
+        """
+        Find the n nearest airports at least min_distance_km away, nearest first.
+
+        With scipy the airports closer than min_distance_km are only counted,
+        and the tree query returns the next n neighbours by rank, so the cost
+        depends on n rather than on how far out the search resumes. Airports
+        tied with the last result may be cut off, as with nearest_with_distance.
+        """
+        if n < 1 or not self.airports:
+            return []
+
+        if not self._use_scipy:
+            indices, distances_km = self._query_linear(
+                lat, lon, len(self.airports), max_distance_km
+            )
+            kept = [(i, d) for i, d in zip(indices, distances_km) if d >= min_distance_km][:n]
+            return self._annotate(lat, lon, [i for i, _ in kept], [d for _, d in kept], False)
+
+        query = _unit_vector(lat, lon)
+        skip = 0
+        if min_distance_km > 0:
+            # Padded below the bound so every airport counted is strictly closer
+            skip = int(self._tree.query_ball_point(
+                query, _chord_for_km(min_distance_km) * (1 - 1e-9), return_length=True
+            ))
+
+        bound = np.inf if max_distance_km is None else _chord_for_km(max_distance_km) * (1 + 1e-12)
+        window = n
+
+        while True:
+            last = min(skip + window, len(self.airports))
+            if last <= skip:
+                return []
+
+            chords, indices = self._tree.query(
+                query, k=list(range(skip + 1, last + 1)), distance_upper_bound=bound
             )
+            found = np.isfinite(chords)
+            distances_km = self._chord_to_km(chords[found])
+            indices = indices[found]
+
+            keep = distances_km >= min_distance_km
+            if max_distance_km is not None:
+                keep &= distances_km <= max_distance_km
+
+            # Airports just inside the padding were not counted as closer but
+            # are dropped here; widen the window until n remain or none are left.
+            if keep.sum() >= n or not found.all() or last == len(self.airports):
+                break
+            window *= 2
+
+        return self._annotate(lat, lon, indices[keep][:n], distances_km[keep][:n], False)
+
+    def knn_graph(self, k: int, workers: int = -1) -> NeighborGraph:
+        """
+        Build the k-nearest-neighbour graph of all indexed airports.
+
+        With scipy this is a single batched tree query over every point, run
+        on `workers` threads (-1 uses all cores). Each airport's own row is
+        excluded from its neighbours by row id, so distinct airports sharing a
+        name or coordinates are kept.
+
+        Args:
+            k: Number of neighbours per airport
+            workers: Number of threads for the tree query
+
+        Returns:
+            NeighborGraph keyed by position in self.airports
+        """
+        if k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+
+        rows = len(self.airports)
+        k = min(k, max(rows - 1, 0))
+
+        if not self._use_scipy:
+            indptr = array("q", [0])
+            indices = array("i")
+            distances = array("f")
+            for row, airport in enumerate(self.airports):
+                found, found_km = self._query_linear(
+                    airport.latitude_deg, airport.longitude_deg, k + 1, None
+                )
+                kept = [(i, d) for i, d in zip(found, found_km) if i != row][:k]
+                indices.extend(i for i, _ in kept)
+                distances.extend(d for _, d in kept)
+                indptr.append(len(indices))
+            return NeighborGraph(k, indptr, indices, distances)
+
+        chords, found = self._tree.query(self._xyz, k=k + 1, workers=workers)
+        chords = chords.reshape(rows, k + 1)
+        found = found.reshape(rows, k + 1)
+
+        # Drop each row's own entry; when duplicates tie at distance zero the
+        # row may be missing from its own result, so keep the first k others.
+        keep = found != np.arange(rows)[:, None]
+        keep &= np.cumsum(keep, axis=1) <= k
+
+        counts = keep.sum(axis=1)
+        indptr = np.zeros(rows + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        return NeighborGraph(
+            k,
+            array("q", indptr.tobytes()),
+            array("i", found[keep].astype(np.int32).tobytes()),
+            array("f", self._chord_to_km(chords[keep]).astype(np.float32).tobytes()),
+        )
+
+    def within_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float
+    ) -> list["Airport"]:
+        """
+        Find all airports inside a latitude/longitude box.
+
+        A box with min_lon greater than max_lon crosses the antimeridian, e.g.
+        (-20, 170, 10, -170) spans 20 degrees of longitude around 180.
+
+        Returns:
+            Airports inside the box, in index order
+        """
+        validate_coordinates(min_lat, min_lon)
+        validate_coordinates(max_lat, max_lon)
+
+        if min_lat > max_lat:
+            raise ValueError(f"min_lat must not exceed max_lat, got {min_lat} > {max_lat}")
+
+        candidates = self._bbox_candidates(min_lat, min_lon, max_lat, max_lon)
+
+        return [
+            self.airports[i] for i in candidates
+            if min_lat <= self.airports[i].latitude_deg <= max_lat
+            and _lon_in_range(self.airports[i].longitude_deg, min_lon, max_lon)
+        ]
+
+    def within_polygon(self, vertices: Sequence[tuple[float, float]]) -> list["Airport"]:
+        """
+        Find all airports inside a polygon given as (lat, lon) vertices.
+
+        Edges are treated as straight lines in latitude/longitude, which is how
+        FIR and airspace boundaries are usually published. Polygons may cross
+        the antimeridian but must not enclose a pole.
+
+        Returns:
+            Airports inside the polygon, in index order
+        """
+        if len(vertices) < 3:
+            raise ValueError(f"A polygon needs at least 3 vertices, got {len(vertices)}")
+
+        for lat, lon in vertices:
+            validate_coordinates(lat, lon)
+
+        # Unwrap longitudes so consecutive vertices never jump across the antimeridian
+        ring = [(vertices[0][1], vertices[0][0])]
+        for lat, lon in vertices[1:]:
+            prev_lon = ring[-1][0]
+            ring.append((prev_lon + _normalize_lon(lon - prev_lon), lat))
 
-        if n == 1:
-            distances = [distances]
-            indices = [indices]
+        # A ring around a pole winds 360 degrees of longitude and does not close
+        closing_lon = ring[-1][0] + _normalize_lon(ring[0][0] - ring[-1][0])
+        if abs(closing_lon - ring[0][0]) > 1e-9:
+            raise ValueError("Polygons enclosing a pole are not supported")
+
+        xs = [x for x, _ in ring]
+        west = min(xs)
+
+        min_lat = min(lat for _, lat in ring)
+        max_lat = max(lat for _, lat in ring)
+        candidates = self._bbox_candidates(
+            min_lat, _normalize_lon(west), max_lat, _normalize_lon(max(xs))
+        )
 
         result = []
-        for dist, idx in zip(distances, indices):
-            if idx < len(self.airports) and not math.isinf(dist):
-                result.append(self.airports[idx])
+        for i in candidates:
+            airport = self.airports[i]
+            x = west + (airport.longitude_deg - west) % 360.0
+            if _point_in_ring(x, airport.latitude_deg, ring):
+                result.append(airport)
 
         return result
 
-    def _nearest_linear(
+    def within_corridor(
+        self,
+        waypoints: Sequence[tuple[float, float]],
+        width_km: float
+    ) -> list[NearbyAirport]:
+        """
+        Find all airports within width_km of a route flown along great circles.
+
+        Args:
+            waypoints: Route as (lat, lon) points; each leg is a great-circle arc
+            width_km: Maximum cross-route distance (half the corridor width)
+
+        Returns:
+            NearbyAirport results sorted by distance to the route
+        """
+        if len(waypoints) < 2:
+            raise ValueError(f"A route needs at least 2 waypoints, got {len(waypoints)}")
+        if width_km < 0:
+            raise ValueError(f"width_km must be non-negative, got {width_km}")
+
+        for lat, lon in waypoints:
+            validate_coordinates(lat, lon)
+
+        vectors = [_unit_vector(lat, lon) for lat, lon in waypoints]
+        max_angle = width_km / EARTH_RADIUS_KM
+
+        candidates = self._corridor_candidates(waypoints, width_km)
+
+        found = []
+        for i in candidates:
+            airport = self.airports[i]
+            p = _unit_vector(airport.latitude_deg, airport.longitude_deg)
+            angle = min(
+                _arc_distance(p, vectors[j], vectors[j + 1])[0]
+                for j in range(len(vectors) - 1)
+            )
+            if angle <= max_angle:
+                found.append(NearbyAirport(airport, angle * EARTH_RADIUS_KM))
+
+        found.sort(key=lambda r: r.distance_km)
+        return found
+
+    def near_trajectory(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        max_distance_km: float,
+        chunk_size: int = 256
+    ) -> list[TrackProximity]:
+        """
+        Find airports a flight track passed within max_distance_km of.
+
+        The track is a polyline of great-circle segments between consecutive
+        points. It is walked in chunks of chunk_size points; each chunk is
+        bounded by a spherical cap, and only airports inside a cap widened by
+        max_distance_km are checked against the chunk's segments.
+
+        Args:
+            lats: Track latitudes
+            lons: Track longitudes
+            max_distance_km: Proximity threshold
+            chunk_size: Track points per pruning cap
+
+        Returns:
+            TrackProximity results (closest distance and the fraction of the
+            track length at which it occurs), ordered by fraction
+        """
+        if max_distance_km < 0:
+            raise ValueError(f"max_distance_km must be non-negative, got {max_distance_km}")
+        if chunk_size < 2:
+            raise ValueError(f"chunk_size must be at least 2, got {chunk_size}")
+
+        if not self._use_scipy:
+            return self._near_trajectory_linear(lats, lons, max_distance_km)
+
+        from ..utils.validators import validate_coordinate_arrays
+
+        lats, lons = validate_coordinate_arrays(lats, lons)
+        if lats.ndim != 1 or lats.shape != lons.shape or len(lats) < 2:
+            raise ValueError("A track needs matching 1-D arrays of at least 2 points")
+
+        lat_rad = np.radians(lats)
+        lon_rad = np.radians(lons)
+        cos_lat = np.cos(lat_rad)
+        track = np.column_stack(
+            (cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad))
+        )
+
+        seg_chords = np.linalg.norm(np.diff(track, axis=0), axis=1)
+        seg_angles = 2.0 * np.arcsin(np.clip(seg_chords / 2.0, 0.0, 1.0))
+        seg_starts = np.concatenate(([0.0], np.cumsum(seg_angles)))
+        total_angle = seg_starts[-1]
+        max_angle = max_distance_km / EARTH_RADIUS_KM
+
+        # Chunk c covers segments [start, end) and their vertices [start, end]
+        bounds = list(range(0, len(track) - 1, chunk_size - 1)) + [len(track) - 1]
+        chunks = list(zip(bounds, bounds[1:]))
+
+        centers = np.empty((len(chunks), 3))
+        radii = np.empty(len(chunks))
+        for c, (start, end) in enumerate(chunks):
+            points = track[start:end + 1]
+            center = points.sum(axis=0)
+            norm = np.linalg.norm(center)
+            center = points[0] if norm < 1e-9 else center / norm
+            chord = np.linalg.norm(points - center, axis=1).max()
+            spread = 2.0 * np.arcsin(np.clip(chord / 2.0, 0.0, 1.0))
+            centers[c] = center
+            angle = spread + max_angle
+            radii[c] = 2.0 if angle >= math.pi else 2.0 * math.sin(angle / 2.0)
+
+        hits = self._tree.query_ball_point(centers, radii * (1 + 1e-9))
+
+        best: dict[int, tuple[float, float]] = {}
+        for c, (start, end) in enumerate(chunks):
+            candidates = np.asarray(hits[c], dtype=np.intp)
+            if len(candidates) == 0:
+                continue
+
+            angles, along = _segments_distance(
+                self._xyz[candidates], track[start:end], track[start + 1:end + 1]
+            )
+            nearest_seg = angles.argmin(axis=1)
+            rows = np.arange(len(candidates))
+            closest = angles[rows, nearest_seg]
+            position = seg_starts[start + nearest_seg] + along[rows, nearest_seg]
+
+            for i, angle, pos in zip(candidates.tolist(), closest.tolist(), position.tolist()):
+                if angle <= max_angle and (i not in best or angle < best[i][0]):
+                    best[i] = (angle, pos)
+
+        results = [
+            TrackProximity(
+                self.airports[i],
+                angle * EARTH_RADIUS_KM,
+                pos / total_angle if total_angle > 0 else 0.0
+            )
+            for i, (angle, pos) in best.items()
+        ]
+        results.sort(key=lambda r: (r.fraction, r.distance_km))
+        return results
+
+    def _near_trajectory_linear(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        max_distance_km: float
+    ) -> list[TrackProximity]:
+        if len(lats) != len(lons) or len(lats) < 2:
+            raise ValueError("A track needs matching sequences of at least 2 points")
+
+        for lat, lon in zip(lats, lons):
+            validate_coordinates(lat, lon)
+
+        track = [_unit_vector(lat, lon) for lat, lon in zip(lats, lons)]
+        seg_angles = [_angle_between(a, b) for a, b in zip(track, track[1:])]
+        seg_starts = [0.0]
+        for angle in seg_angles:
+            seg_starts.append(seg_starts[-1] + angle)
+        total_angle = seg_starts[-1]
+        max_angle = max_distance_km / EARTH_RADIUS_KM
+
+        results = []
+        for airport in self.airports:
+            p = _unit_vector(airport.latitude_deg, airport.longitude_deg)
+            angle, pos = min(
+                (
+                    (d, seg_starts[j] + f * seg_angles[j])
+                    for j, (d, f) in enumerate(
+                        _arc_distance(p, a, b) for a, b in zip(track, track[1:])
+                    )
+                ),
+                key=lambda x: x[0]
+            )
+            if angle <= max_angle:
+                results.append(TrackProximity(
+                    airport, angle * EARTH_RADIUS_KM, pos / total_angle if total_angle > 0 else 0.0
+                ))
+
+        results.sort(key=lambda r: (r.fraction, r.distance_km))
+        return results
+
+    def _cap_candidates(self, centers: Sequence[tuple[float, float]], radius_km: float):
+        # Indices of airports within radius_km of any center (a superset is fine;
+        # callers apply the exact test).
+        if not self._use_scipy:
+            return range(len(self.airports))
+
+        points = np.array([_unit_vector(lat, lon) for lat, lon in centers])
+        hits = self._tree.query_ball_point(points, _chord_for_km(radius_km) * (1 + 1e-9))
+        if len(centers) == 1:
+            return sorted(hits[0])
+        return np.unique(np.concatenate([np.asarray(h, dtype=np.intp) for h in hits])).tolist()
+
+    def _bbox_candidates(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float):
+        from ..core.distance import haversine_km
+
+        span = max_lon - min_lon if min_lon <= max_lon else max_lon - min_lon + 360.0
+        center_lat = (min_lat + max_lat) / 2.0
+
+        # Split the box into equal parts spanning at most 180 degrees of
+        # longitude. Within such a part, distance from its center grows
+        # monotonically along every edge, so the farthest point is a corner;
+        # in a wider box the middle of the top or bottom edge can be farther.
+        parts = max(1, math.ceil(span / 180.0))
+        width = span / parts
+        centers = [
+            (center_lat, _normalize_lon(min_lon + width * (i + 0.5))) for i in range(parts)
+        ]
+
+        # All parts are congruent, so one radius covers each of them
+        radius_km = max(
+            haversine_km(center_lat, centers[0][1], lat, lon)
+            for lat in (min_lat, max_lat)
+            for lon in (min_lon, _normalize_lon(min_lon + width))
+        )
+
+        return self._cap_candidates(centers, radius_km)
+
+    def _corridor_candidates(self, waypoints: Sequence[tuple[float, float]], width_km: float):
+        if not self._use_scipy:
+            return range(len(self.airports))
+
+        from ..core.distance import haversine_km
+        from ..core.geodesy import great_circle_path
+
+        # Cover each leg with caps centered on points spaced `step` apart; any
+        # point within width_km of the leg is within width_km + step / 2 of a cap center.
+        legs = list(zip(waypoints, waypoints[1:]))
+        legs_km = [haversine_km(lat1, lon1, lat2, lon2) for (lat1, lon1), (lat2, lon2) in legs]
+        step = max(width_km, 1.0, max(legs_km) / 1000.0)
+
+        centers = []
+        for ((lat1, lon1), (lat2, lon2)), leg_km in zip(legs, legs_km):
+            if leg_km == 0:
+                centers.append((lat1, lon1))
+                continue
+            num_points = math.ceil(leg_km / step) + 1
+            centers.extend(great_circle_path(lat1, lon1, lat2, lon2, num_points))
+
+        return self._cap_candidates(centers, width_km + step / 2.0)
+
+    def _query_scipy(
         self,
         lat: float,
         lon: float,
         n: int,
         max_distance_km: float | None
-    ) -> list["Airport"]:
+    ):
+        query = _unit_vector(lat, lon)
+        k = min(n, len(self.airports))
+
+        if max_distance_km is not None:
+            # Pad the bound slightly so airports exactly on the radius survive
+            # the float round trip; the exact check happens below.
+            chords, indices = self._tree.query(
+                query,
+                k=k,
+                distance_upper_bound=_chord_for_km(max_distance_km) * (1 + 1e-12)
+            )
+        else:
+            chords, indices = self._tree.query(query, k=k)
+
+        chords = np.atleast_1d(chords)
+        indices = np.atleast_1d(indices)
+        found = np.isfinite(chords)
+        distances_km = self._chord_to_km(chords[found])
+        indices = indices[found]
+
+        if max_distance_km is not None:
+            keep = distances_km <= max_distance_km
+            return indices[keep], distances_km[keep]
+
+        return indices, distances_km
+
+    def _query_linear(
+        self,
+        lat: float,
+        lon: float,
+        n: int,
+        max_distance_km: float | None
+    ) -> tuple[list[int], list[float]]:
         from ..core.distance import haversine_km
 
         distances = [
-            (haversine_km(lat, lon, a.latitude_deg, a.longitude_deg), a)
-            for a in self.airports
+            (haversine_km(lat, lon, a.latitude_deg, a.longitude_deg), i)
+            for i, a in enumerate(self.airports)
         ]
 
         distances.sort(key=lambda x: x[0])
 
         if max_distance_km is not None:
-            distances = [(d, a) for d, a in distances if d <= max_distance_km]
+            distances = [(d, i) for d, i in distances if d <= max_distance_km]
 
-        return [a for _, a in distances[:n]]
+        distances = distances[:n]
 
-    def within_radius(self, lat: float, lon: float, radius_km: float) -> list["Airport"]:
-        if self._use_scipy:
-            lat_rad = math.radians(lat)
-            lon_rad = math.radians(lon)
-            radius_rad = radius_km / EARTH_RADIUS_KM
+        return [i for _, i in distances], [d for d, _ in distances]
 
-            indices = self._tree.query_ball_point([lat_rad, lon_rad], radius_rad)
-            return [self.airports[i] for i in indices]
+    @staticmethod
+    def _chord_to_km(chords):
+        return 2.0 * np.arcsin(np.clip(chords / 2.0, 0.0, 1.0)) * EARTH_RADIUS_KM
+
+    def _annotate(
+        self,
+        lat: float,
+        lon: float,
+        indices,
+        distances_km,
+        with_bearing: bool
+    ) -> list[NearbyAirport]:
+        if with_bearing:
+            bearings = self._bearings(lat, lon, indices)
         else:
-            from ..core.distance import haversine_km
+            bearings = [None] * len(indices)
+
+        return [
+            NearbyAirport(self.airports[i], float(d), None if b is None else float(b))
+            for i, d, b in zip(indices, distances_km, bearings)
+        ]
+
+    def _bearings(self, lat: float, lon: float, indices) -> list[float]:
+        if not self._use_scipy:
+            from ..core.geodesy import initial_bearing
 
             return [
-                a for a in self.airports
-                if haversine_km(lat, lon, a.latitude_deg, a.longitude_deg) <= radius_km
+                initial_bearing(
+                    lat, lon,
+                    self.airports[i].latitude_deg, self.airports[i].longitude_deg
+                )
+                for i in indices
             ]
 
+        lat1 = math.radians(lat)
+        lat2 = self._lat_rad[indices]
+        delta_lon = self._lon_rad[indices] - math.radians(lon)
+
+        y = np.sin(delta_lon) * np.cos(lat2)
+        x = math.cos(lat1) * np.sin(lat2) - math.sin(lat1) * np.cos(lat2) * np.cos(delta_lon)
+
+        return list((np.degrees(np.arctan2(y, x)) + 360) % 360)
+
 
 def build_spatial_index(airports: Sequence["Airport"]) -> SpatialIndex:
     return SpatialIndex(airports)
@@ -1,5 +1,11 @@
 import re
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 def is_valid_iata(code: str) -> bool:
     if not isinstance(code, str):
@@ -25,6 +31,36 @@ def validate_coordinates(lat: float, lon: float) -> None:
         raise ValueError(f"Longitude must be in range [-180, 180], got {lon}")
 
 
+def validate_coordinate_arrays(lat, lon) -> tuple:
+    """
+    Convert latitudes and longitudes to float arrays and validate them in bulk.
+
+    Returns:
+        (lat, lon) as float64 NumPy arrays
+
+    Raises:
+        ValueError: If any value is non-numeric, NaN or out of range
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for array coordinate validation")
+
+    try:
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Coordinates must be numeric: {e}")
+
+    bad_lat = ~((lat >= -90.0) & (lat <= 90.0))
+    if bad_lat.any():
+        raise ValueError(f"Latitude must be in range [-90, 90], got {lat[bad_lat].flat[0]}")
+
+    bad_lon = ~((lon >= -180.0) & (lon <= 180.0))
+    if bad_lon.any():
+        raise ValueError(f"Longitude must be in range [-180, 180], got {lon[bad_lon].flat[0]}")
+
+    return lat, lon
+
+
 def normalize_airport_code(code: str) -> str:
     if not isinstance(code, str):
         raise ValueError(f"Airport code must be a string, got {type(code).__name__}")
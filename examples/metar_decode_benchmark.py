@@ -0,0 +1,60 @@
+import random
+import sys
+import time
+
+from aeronavx.core.metar import clear_decoded_cache, decode_columns, decode_reports
+from aeronavx.core.weather import StationReportTable
+
+TEMPLATES = [
+    "{st} 191220Z {dir:03d}{spd:02d}KT 9999 FEW030 BKN{cig:03d} {t:02d}/{d:02d} Q{q}",
+    "{st} 191251Z {dir:03d}{spd:02d}G{gst}KT 10SM SCT250 {t:02d}/{d:02d} A{a} RMK AO2 SLP199",
+    "{st} 191253Z VRB03KT 1 1/2SM BR OVC{cig:03d} M{t:02d}/M{d:02d} A{a} RMK AO2",
+    "METAR {st} 191230Z {dir:03d}{spd:02d}MPS CAVOK {t:02d}/{d:02d} Q{q} NOSIG",
+    "TAF {st} 191100Z 1912/2018 {dir:03d}{spd:02d}KT 9999 BKN{cig:03d}\n"
+    "      TEMPO 1912/1918 4000 -RA BKN008",
+]
+
+
+def synthetic_corpus(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    corpus = []
+    for _ in range(n):
+        corpus.append(rng.choice(TEMPLATES).format(
+            st="".join(rng.choice(letters) for _ in range(4)),
+            dir=rng.randrange(0, 360, 10), spd=rng.randrange(0, 40), gst=rng.randrange(40, 60),
+            cig=rng.randrange(2, 120), t=rng.randrange(0, 30), d=rng.randrange(0, 20),
+            q=rng.randrange(980, 1040), a=rng.randrange(2900, 3100),
+        ))
+    return corpus
+
+
+def timed(label: str, func, repeat: int = 5) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        clear_decoded_cache()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<40} {best * 1000:8.1f} ms")
+
+
+if len(sys.argv) > 1:
+    # Decode a real cycle file, e.g. https://tgftp.nws.noaa.gov/data/observations/metar/cycles/12Z.TXT
+    table = StationReportTable()
+    with open(sys.argv[1]) as f:
+        table.ingest(f)
+    corpus = [table.get("metar", station, float("inf")) for station in table.stations()]
+else:
+    corpus = synthetic_corpus(20000)
+
+print(f"Decoding {len(corpus)} reports\n")
+
+timed("decode_columns (one pass, arrays)", lambda: decode_columns(corpus))
+timed("decode_reports (cold cache)", lambda: decode_reports(corpus))
+timed("decode_reports one at a time (cold)", lambda: [decode_reports([r]) for r in corpus])
+
+decode_reports(corpus)
+start = time.perf_counter()
+decode_reports(corpus)
+print(f"{'decode_reports (warm cache)':<40} {(time.perf_counter() - start) * 1000:8.1f} ms")
@@ -0,0 +1,136 @@
+import dataclasses
+import random
+from pathlib import Path
+
+import pytest
+
+from aeronavx.core import aggregation
+from aeronavx.core.aggregation import AirportTable, group_by, top_n, top_n_per_group
+from aeronavx.core.analytics import (
+    airports_by_type_and_country,
+    airports_per_country,
+    country_centroids,
+    highest_elevation_airports,
+    highest_elevation_airports_per_country,
+    longest_pairs_per_country,
+    lowest_elevation_airports,
+)
+from aeronavx.core.geodesy import midpoint
+from aeronavx.core.loader import load_airports
+
+from .test_spatial_index import make_airports
+
+MINIMAL_DATA = Path(__file__).parent.parent / "aeronavx" / "data" / "airports_minimal.csv"
+
+SPECS = (
+    ("n", "count", None),
+    ("elev", "mean", "elevation_ft"),
+    ("low", "min", "elevation_ft"),
+    ("high", "max", "elevation_ft"),
+    ("total", "sum", "elevation_ft"),
+    ("center", "centroid", None),
+)
+
+
+@pytest.fixture
+def minimal_airports():
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+    yield
+    aggregation.clear_aggregation_cache()
+
+
+def labelled_airports(count):
+    rng = random.Random(3)
+    return [
+        dataclasses.replace(
+            a,
+            iso_country=rng.choice(["TR", "GB", "US", None, ""]),
+            type=rng.choice(["large_airport", "heliport"]),
+            elevation_ft=rng.choice([None, rng.uniform(-50, 9000)]),
+        )
+        for a in make_airports(count)
+    ]
+
+
+@pytest.mark.skipif(not aggregation.HAS_NUMPY, reason="numpy not installed")
+def test_numpy_and_python_paths_agree():
+    airports = labelled_airports(500)
+    table = AirportTable(airports, version=0)
+
+    for columns in (("iso_country",), ("type", "iso_country")):
+        fast = aggregation._group_by_numpy(table, columns, SPECS)
+        slow = aggregation._group_by_python(airports, columns, SPECS)
+
+        assert fast.keys() == slow.keys()
+        assert not any("" in (key if isinstance(key, tuple) else (key,)) for key in fast)
+        for key in fast:
+            for name, _, _ in SPECS:
+                assert fast[key][name] == pytest.approx(slow[key][name]), (key, name)
+
+
+def test_group_by_multiple_aggregates(minimal_airports):
+    stats = group_by("iso_country", n="count", elev=("max", "elevation_ft"), center="centroid")
+
+    assert stats["TR"]["n"] == 1
+    assert stats["US"]["n"] == 2
+    assert stats["US"]["elev"] == 125
+    assert stats["TR"]["center"] == pytest.approx((41.275278, 28.751944))
+
+
+def test_group_by_validates_aggregates(minimal_airports):
+    with pytest.raises(ValueError):
+        group_by("iso_country", avg=("median", "elevation_ft"))
+    with pytest.raises(ValueError):
+        group_by("iso_country", avg="mean")
+
+
+def test_group_by_cached_per_dataset_version(minimal_airports):
+    assert airports_per_country()["US"] == 2
+    assert group_by("iso_country", n="count") is not group_by("iso_country", n="count")
+
+    load_airports(data_path=MINIMAL_DATA, force_reload=True, countries=["US"])
+    assert airports_per_country() == {"US": 2}
+    assert airports_by_type_and_country() == {"large_airport": {"US": 2}}
+
+
+def test_country_centroids_are_spherical(minimal_airports):
+    # Two airports: the spherical mean is their great-circle midpoint
+    expected = midpoint(40.639801, -73.7789, 33.942501, -118.407997)
+
+    assert country_centroids()["US"] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("largest", [True, False])
+def test_top_n_matches_full_sort(monkeypatch, largest):
+    airports = labelled_airports(500)
+    monkeypatch.setattr(aggregation, "get_airport_table", lambda: AirportTable(airports, version=0))
+    with_elevation = [a for a in airports if a.elevation_ft is not None]
+    expected = sorted(with_elevation, key=lambda a: a.elevation_ft, reverse=largest)
+
+    for has_numpy in {aggregation.HAS_NUMPY, False}:
+        monkeypatch.setattr(aggregation, "HAS_NUMPY", has_numpy)
+
+        assert top_n("elevation_ft", 7, largest=largest) == expected[:7]
+
+        grouped = top_n_per_group("elevation_ft", "iso_country", 3, largest=largest)
+        assert grouped.keys() == {a.iso_country for a in with_elevation if a.iso_country}
+        for country, top in grouped.items():
+            assert top == [a for a in expected if a.iso_country == country][:3]
+
+
+def test_elevation_analytics(minimal_airports):
+    highest = highest_elevation_airports(2)
+    lowest = lowest_elevation_airports(1)
+
+    assert [a.iata_code for a in highest] == ["CDG", "FRA"]
+    assert [a.iata_code for a in lowest] == ["JFK"]
+    assert [a.iata_code for a in highest_elevation_airports_per_country(1)["US"]] == ["LAX"]
+
+
+def test_longest_pairs_per_country(minimal_airports):
+    pairs = longest_pairs_per_country(n=1)
+
+    (a, b, dist), = pairs["US"]
+    assert {a.iata_code, b.iata_code} == {"JFK", "LAX"}
+    assert dist == pytest.approx(3974.2, abs=1.0)
+    assert "TR" not in pairs
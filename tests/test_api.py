@@ -0,0 +1,139 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+
+from aeronavx.api import fragments, server
+from aeronavx.api.server import app
+from aeronavx.core.distance import airport_distance
+from aeronavx.core.loader import get_airport_by_iata, load_airports
+from aeronavx.exceptions import DataLoadError
+
+MINIMAL_DATA = Path(__file__).parent.parent / "aeronavx" / "data" / "airports_minimal.csv"
+
+
+@pytest.fixture
+def client():
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+    return TestClient(app)
+
+
+def test_distance_batch_is_columnar_with_item_errors(client):
+    response = client.post("/distance/batch", json={
+        "pairs": [["JFK", "LHR"], ["IST", "XXX"], ["YYY", "CDG"], ["CDG", "JFK"]],
+        "model": "vincenty",
+        "unit": "nmi",
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    jfk, lhr, cdg = (get_airport_by_iata(code) for code in ("JFK", "LHR", "CDG"))
+
+    assert body["count"] == 4
+    assert body["unit"] == "nmi"
+    assert body["distance"][0] == pytest.approx(airport_distance(jfk, lhr, "vincenty", "nmi"))
+    assert body["distance"][1:3] == [None, None]
+    assert body["distance"][3] == pytest.approx(airport_distance(cdg, jfk, "vincenty", "nmi"))
+    assert body["errors"] == [
+        {"index": 1, "error": "Destination airport not found: XXX"},
+        {"index": 2, "error": "Origin airport not found: YYY"},
+    ]
+
+
+def test_flight_time_and_emissions_batches(client):
+    pairs = [["JFK", "LHR"], ["LHR", "XXX"]]
+
+    times = client.post("/flight-time/batch", json={"pairs": pairs, "speed_kts": 500}).json()
+    co2 = client.post("/emissions/batch", json={"pairs": pairs}).json()
+
+    params = {"from": "JFK", "to": "LHR", "speed_kts": 500}
+    single_time = client.get("/flight-time", params=params).json()
+    single_co2 = client.get("/emissions", params={"from": "JFK", "to": "LHR"}).json()
+
+    assert times["time_hours"][0] == pytest.approx(single_time["time_hours"])
+    assert co2["co2_kg_per_passenger"][0] == pytest.approx(
+        single_co2["co2_kg_per_passenger"]
+    )
+    assert times["time_hours"][1] is None and co2["errors"][0]["index"] == 1
+
+
+def test_batch_rejects_invalid_requests(client):
+    invalid_model = {"pairs": [["JFK", "LHR"]], "model": "flat"}
+    assert client.post("/distance/batch", json=invalid_model).status_code == 422
+    assert client.post("/flight-time/batch", json={"pairs": [], "speed_kts": 5}).status_code == 422
+
+
+def test_batch_data_errors_are_bad_requests(client, monkeypatch):
+    def fail(*args, **kwargs):
+        raise DataLoadError("dataset unavailable")
+
+    monkeypatch.setattr(server, "batch_emissions", fail)
+    response = client.post("/emissions/batch", json={"pairs": [["JFK", "LHR"]]})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "dataset unavailable"
+
+
+def test_airport_json_matches_as_dict(client):
+    response = client.get("/airport/IST")
+
+    assert response.status_code == 200
+    assert response.json() == get_airport_by_iata("IST").as_dict()
+
+
+def test_fields_projection(client):
+    params = {"lat": 41.0, "lon": 29.0, "n": 2, "fields": "compact"}
+    body = client.get("/nearest", params=params).json()
+
+    assert body["count"] == 2
+    assert set(body["airports"][0]) == {
+        "iata_code", "gps_code", "name", "latitude_deg", "longitude_deg", "distance_km"
+    }
+    assert body["airports"][0]["iata_code"] == "IST"
+
+    body = client.get("/search", params={"q": "Heathrow", "fields": "iata_code, name"}).json()
+    assert body["airports"][0] == {"iata_code": "LHR", "name": get_airport_by_iata("LHR").name}
+
+    response = client.get("/airport/IST", params={"fields": "iata_code,runways"})
+    assert response.status_code == 400
+    assert "runways" in response.json()["detail"]
+
+
+def test_fragments_are_reused_until_data_changes(client):
+    ist = get_airport_by_iata("IST")
+    table = fragments.get_fragment_table()
+
+    assert table.fragment(ist) is table.fragment(ist)
+    assert fragments.get_fragment_table() is table
+
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+    assert fragments.get_fragment_table() is not table
+
+
+def test_ready_after_startup_warm_up():
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+
+    with TestClient(app) as client:
+        response = client.get("/ready")
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ready"
+        assert body["airports"] > 0
+
+        assert client.get("/health").status_code == 200
+        assert client.get("/airport/LHR").status_code == 200
+        compact = fragments.get_fragment_table(fragments.FIELD_PRESETS["compact"])
+        assert compact._fragments[0] is not None
+
+    assert server._executor is None
+    assert client.get("/ready").status_code == 503
+
+
+def test_not_ready_before_startup(client):
+    server._ready.clear()
+
+    assert client.get("/ready").status_code == 503
+    assert client.get("/health").json()["status"] == "ok"
@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from aeronavx.utils.cache import BoundedCache, memoize
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction():
+    cache = BoundedCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.info().evictions == 1
+
+
+def test_lfu_eviction():
+    cache = BoundedCache(maxsize=2, policy="lfu")
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    cache.set("c", 3)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+
+    cache.set("d", 4)
+    assert "a" in cache and "d" in cache and "c" not in cache
+
+
+def test_ttl_expiry():
+    timer = FakeTimer()
+    cache = BoundedCache(maxsize=10, ttl=5.0, timer=timer)
+    cache.set("a", None)
+    cache.set("b", 2)
+
+    timer.now = 4.0
+    assert "a" in cache
+    assert cache.get("a", "missing") is None
+
+    timer.now = 5.0
+    assert cache.get("b") is None
+    assert cache.purge_expired() == 1
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.expirations, info.currsize) == (1, 1, 2, 0)
+
+
+def test_memoize_bare_and_structured_info():
+    calls = []
+
+    @memoize
+    def square(x, scale=1):
+        calls.append(x)
+        return x * x * scale
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert square(3, scale=2) == 18
+    assert calls == [3, 3]
+
+    info = square.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    assert square.cache_invalidate(3)
+    assert not square.cache_invalidate(3)
+    square.cache_clear()
+    assert square.cache_info().currsize == 0
+
+
+def test_memoize_bounded_and_does_not_cache_errors():
+    attempts = []
+
+    @memoize(maxsize=3)
+    def flaky(x):
+        attempts.append(x)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return x
+
+    with pytest.raises(RuntimeError):
+        flaky(0)
+    for x in range(10):
+        flaky(x)
+
+    assert attempts == [0] + list(range(10))
+    assert flaky.cache_info().currsize == 3
+    assert flaky.cache_info().evictions == 7
+
+
+def test_memoize_single_flight_threads():
+    calls = []
+    started = threading.Event()
+
+    @memoize
+    def slow(x):
+        calls.append(x)
+        started.set()
+        time.sleep(0.05)
+        return x * 2
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow(21))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert calls == [21]
+    assert results == [42] * 8
+
+
+def test_memoize_async_single_flight():
+    calls = []
+
+    @memoize(ttl=60.0)
+    async def fetch(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x + 1
+
+    async def main():
+        return await asyncio.gather(*(fetch(1) for _ in range(5)))
+
+    assert asyncio.run(main()) == [2] * 5
+    assert asyncio.run(fetch(1)) == 2
+    assert calls == [1]
@@ -1,5 +1,30 @@
+from pathlib import Path
+
 import pytest
-from aeronavx.core.distance import haversine_km, slc_km, vincenty_km, distance
+
+from aeronavx.core.distance import (
+    airport_distance,
+    clear_pair_cache,
+    distance,
+    distance_arrays,
+    enable_solver_stats,
+    get_pair_cache_stats,
+    get_solver_stats,
+    haversine_km,
+    karney_km,
+    karney_km_arrays,
+    reset_solver_stats,
+    set_pair_cache_size,
+    slc_km,
+    vincenty_direct,
+    vincenty_direct_arrays,
+    vincenty_km,
+)
+from aeronavx.core.loader import get_airport_by_iata, load_airports
+from aeronavx.core.routing import route_distance
+from aeronavx.models.airport import Airport
+
+MINIMAL_DATA = Path(__file__).parent.parent / "aeronavx" / "data" / "airports_minimal.csv"
 
 
 def test_haversine_distance():
@@ -56,3 +81,127 @@ def test_invalid_coordinates():
 
     with pytest.raises(ValueError):
         distance(0.0, 181.0, 0.0, 0.0)
+
+
+def test_vincenty_direct_inverts_vincenty():
+    lat, lon, _ = vincenty_direct(51.5074, -0.1278, 288.3, 5570.0)
+
+    assert vincenty_km(51.5074, -0.1278, lat, lon) == pytest.approx(5570.0, abs=1e-6)
+
+
+def test_vincenty_direct_arrays_match_scalar():
+    lats, lons, bearings = vincenty_direct_arrays(
+        [51.5, -33.9], [-0.1, 151.2], [45.0, 250.0], 8000.0
+    )
+
+    for i, (lat, lon, bearing) in enumerate([(51.5, -0.1, 45.0), (-33.9, 151.2, 250.0)]):
+        expected = vincenty_direct(lat, lon, bearing, 8000.0)
+        assert (lats[i], lons[i], bearings[i]) == pytest.approx(expected)
+
+
+def test_karney_matches_vincenty():
+    pairs = [
+        (51.5074, -0.1278, 40.7128, -74.0060),
+        (-33.9, 151.2, 35.7, 139.7),
+        (10.0, 20.0, 10.0, 20.5),
+    ]
+
+    for pair in pairs:
+        assert karney_km(*pair) == pytest.approx(vincenty_km(*pair), abs=1e-6)
+
+
+def test_karney_arrays_match_scalar():
+    dists = karney_km_arrays([51.5074, 0.0], [-0.1278, 0.0], [40.7128, 0.0], [-74.0060, 90.0])
+
+    assert dists[0] == pytest.approx(karney_km(51.5074, -0.1278, 40.7128, -74.0060))
+    assert dists[1] == pytest.approx(10018.754171394621)
+
+
+@pytest.mark.parametrize(
+    ("pair", "expected_km"),
+    [
+        ((51.5074, -0.1278, 40.7128, -74.0060), 5585.233579),
+        ((90.0, 0.0, -90.0, 0.0), 20003.931459),
+        ((0.0, 0.0, 0.0, 179.5), 19980.861909),
+        ((-30.0, 0.0, 29.9, 179.8), 19989.832828),
+    ],
+)
+def test_karney_reference_distances(pair, expected_km):
+    # Reference values from GeographicLib; covers the general, meridional,
+    # equatorial and nearly antipodal branches
+    assert karney_km(*pair) == pytest.approx(expected_km, abs=1e-6)
+    assert karney_km_arrays(*pair) == pytest.approx(expected_km, abs=1e-6)
+
+
+@pytest.mark.parametrize("model", ["haversine", "slc", "vincenty", "karney"])
+def test_distance_arrays_match_scalar(model):
+    # Includes a coincident pair and a nearly antipodal one (Vincenty falls back)
+    lat1, lon1 = [51.5074, 10.0, 0.0, -33.9], [-0.1278, 20.0, 0.0, 151.2]
+    lat2, lon2 = [40.7128, 10.0, 0.5, 35.7], [-74.0060, 20.0, 179.7, 139.7]
+
+    dists = distance_arrays(lat1, lon1, lat2, lon2, model=model, unit="mi")
+
+    for i, dist in enumerate(dists):
+        expected = distance(lat1[i], lon1[i], lat2[i], lon2[i], model=model, unit="mi")
+        assert dist == pytest.approx(expected, abs=1e-9)
+
+
+def test_karney_converges_for_nearly_antipodal_points():
+    reset_solver_stats()
+    enable_solver_stats()
+    try:
+        vincenty_km(0.0, 0.0, 0.5, 179.7)
+        dist = karney_km(0.0, 0.0, 0.5, 179.7)
+        stats = get_solver_stats()
+    finally:
+        enable_solver_stats(False)
+        reset_solver_stats()
+
+    assert dist == pytest.approx(19944.1274, abs=1e-3)
+    assert stats["vincenty"]["fallbacks"] == 1
+    assert stats["vincenty"]["recent_fallbacks"] == [(0.0, 0.0, 0.5, 179.7)]
+    assert stats["karney"]["calls"] == 1
+    assert stats["karney"]["fallbacks"] == 0
+
+
+@pytest.fixture
+def minimal_airports():
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+    yield
+    set_pair_cache_size(65536)
+    clear_pair_cache()
+
+
+def test_airport_distance_cache_is_order_normalized(minimal_airports):
+    jfk = get_airport_by_iata("JFK")
+    lhr = get_airport_by_iata("LHR")
+    clear_pair_cache()
+
+    there = airport_distance(jfk, lhr, model="vincenty")
+    back = airport_distance(lhr, jfk, model="vincenty", unit="nmi")
+
+    assert there == pytest.approx(vincenty_km(40.639801, -73.7789, 51.4775, -0.461389), abs=1e-3)
+    assert back == pytest.approx(there / 1.852)
+    assert get_pair_cache_stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 65536}
+
+
+def test_airport_distance_cache_shared_and_bounded(minimal_airports):
+    route = [get_airport_by_iata(code) for code in ("JFK", "LHR", "IST", "DXB")]
+    clear_pair_cache()
+
+    total = route_distance(route)
+    assert total == pytest.approx(sum(a.distance_to(b) for a, b in zip(route, route[1:])))
+    assert get_pair_cache_stats()["misses"] == 3
+    assert get_pair_cache_stats()["hits"] == 3
+
+    set_pair_cache_size(2)
+    assert get_pair_cache_stats()["size"] == 2
+
+
+def test_airport_distance_skips_cache_for_foreign_airports(minimal_airports):
+    jfk = get_airport_by_iata("JFK")
+    copy = Airport(**{**jfk.as_dict(), "name": "Copy"})
+    clear_pair_cache()
+
+    assert airport_distance(jfk, copy) == 0.0
+    assert get_pair_cache_stats()["misses"] == 0
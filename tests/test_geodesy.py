@@ -1,5 +1,28 @@
 import pytest
-from aeronavx.core.geodesy import initial_bearing, final_bearing, midpoint, intermediate_point, great_circle_path
+
+from aeronavx.core.distance import haversine_km
+from aeronavx.core.geodesy import (
+    along_track_distance_km,
+    cross_track_distance_km,
+    densify,
+    densify_route,
+    destination_point,
+    destination_points,
+    distance_to_segment_km,
+    final_bearing,
+    final_bearings,
+    great_circle_path,
+    initial_and_final_bearings,
+    initial_bearing,
+    initial_bearings,
+    intermediate_point,
+    intermediate_points,
+    iter_great_circle_path,
+    midpoint,
+    midpoints,
+    range_ring,
+    range_rings,
+)
 
 
 def test_initial_bearing():
@@ -65,3 +88,134 @@ def test_great_circle_path():
 def test_invalid_fraction():
     with pytest.raises(ValueError):
         intermediate_point(0.0, 0.0, 10.0, 10.0, 1.5)
+
+
+def test_great_circle_path_matches_intermediate_point():
+    path = great_circle_path(51.5, -0.1, 40.7, -74.0, num_points=21)
+    streamed = list(iter_great_circle_path(51.5, -0.1, 40.7, -74.0, num_points=21))
+
+    for i, (point, streamed_point) in enumerate(zip(path, streamed)):
+        expected = intermediate_point(51.5, -0.1, 40.7, -74.0, i / 20)
+        assert point == pytest.approx(expected, abs=1e-9)
+        assert streamed_point == pytest.approx(expected, abs=1e-9)
+
+
+def test_densify_segment_length():
+    path = densify(41.275, 28.752, 40.640, -73.779, max_segment_km=250)
+
+    segments = [haversine_km(*p, *q) for p, q in zip(path, path[1:])]
+
+    assert max(segments) <= 250
+    assert path[0] == (41.275, 28.752)
+    assert path[-1] == (40.640, -73.779)
+
+
+def test_densify_route_shares_waypoints():
+    route = [(0.0, 0.0), (0.0, 10.0), (10.0, 10.0)]
+
+    path = densify_route(route, max_segment_km=200)
+
+    assert path[0] == (0.0, 0.0)
+    assert (0.0, 10.0) in path
+    assert path.count((0.0, 10.0)) == 1
+    assert path[-1] == (10.0, 10.0)
+
+
+LEGS = [
+    (51.5074, -0.1278, 40.7128, -74.0060),
+    (41.275, 28.752, 1.350, 103.994),
+    (-33.9, 151.2, 37.6, -122.4),
+    (0.0, 0.0, 10.0, 10.0),
+]
+
+
+def test_batch_bearings_match_scalar():
+    lat1, lon1, lat2, lon2 = (list(c) for c in zip(*LEGS))
+
+    initial, final = initial_and_final_bearings(lat1, lon1, lat2, lon2)
+
+    assert list(initial) == pytest.approx([initial_bearing(*leg) for leg in LEGS])
+    assert list(final) == pytest.approx([final_bearing(*leg) for leg in LEGS])
+    assert list(initial_bearings(lat1, lon1, lat2, lon2)) == pytest.approx(list(initial))
+    assert list(final_bearings(lat1, lon1, lat2, lon2)) == pytest.approx(list(final))
+
+
+def test_final_bearing_is_reversed_initial_bearing():
+    for lat1, lon1, lat2, lon2 in LEGS:
+        expected = (initial_bearing(lat2, lon2, lat1, lon1) + 180) % 360
+        assert final_bearing(lat1, lon1, lat2, lon2) == pytest.approx(expected)
+
+
+def test_batch_midpoints_and_intermediate_points():
+    lat1, lon1, lat2, lon2 = (list(c) for c in zip(*LEGS))
+
+    mid_lats, mid_lons = midpoints(lat1, lon1, lat2, lon2)
+    for leg, mid_lat, mid_lon in zip(LEGS, mid_lats, mid_lons):
+        assert (mid_lat, mid_lon) == pytest.approx(midpoint(*leg))
+
+    lats, lons = intermediate_points(lat1[0], lon1[0], lat2[0], lon2[0], [0.0, 0.25, 1.0])
+    assert (lats[0], lons[0]) == (lat1[0], lon1[0])
+    assert (lats[1], lons[1]) == pytest.approx(intermediate_point(*LEGS[0], 0.25))
+    assert (lats[2], lons[2]) == (lat2[0], lon2[0])
+
+
+def test_batch_invalid_coordinates():
+    with pytest.raises(ValueError):
+        initial_bearings([0.0, 91.0], [0.0, 0.0], [1.0, 1.0], [1.0, 1.0])
+
+    with pytest.raises(ValueError):
+        intermediate_points(0.0, 0.0, 10.0, 10.0, [0.5, 1.5])
+
+
+def test_cross_and_along_track_distance():
+    # Path along the equator; the point is one degree north of its middle
+    one_degree_km = haversine_km(0.0, 0.0, 1.0, 0.0)
+
+    north = cross_track_distance_km(1.0, 5.0, 0.0, 0.0, 0.0, 10.0)
+    south = cross_track_distance_km(-1.0, 5.0, 0.0, 0.0, 0.0, 10.0)
+
+    assert north == pytest.approx(-one_degree_km, rel=1e-6)
+    assert south == pytest.approx(one_degree_km, rel=1e-6)
+    assert along_track_distance_km(1.0, 5.0, 0.0, 0.0, 0.0, 10.0) == pytest.approx(
+        haversine_km(0.0, 0.0, 0.0, 5.0), rel=1e-3
+    )
+
+
+def test_distance_to_segment_km():
+    dist, fraction = distance_to_segment_km(-1.0, 5.0, 0.0, 0.0, 0.0, 10.0)
+    assert dist == pytest.approx(haversine_km(0.0, 0.0, 1.0, 0.0), rel=1e-6)
+    assert fraction == pytest.approx(0.5)
+
+    dist, fraction = distance_to_segment_km(0.0, 12.0, 0.0, 0.0, 0.0, 10.0)
+    assert dist == pytest.approx(haversine_km(0.0, 12.0, 0.0, 10.0))
+    assert fraction == 1.0
+
+
+def test_destination_point_roundtrip():
+    lat, lon = destination_point(51.5074, -0.1278, 288.3, 5570.0)
+
+    assert haversine_km(51.5074, -0.1278, lat, lon) == pytest.approx(5570.0, rel=1e-9)
+    assert initial_bearing(51.5074, -0.1278, lat, lon) == pytest.approx(288.3, abs=1e-6)
+
+
+def test_destination_points_match_scalar():
+    bearings = [0.0, 45.0, 190.0, 300.0]
+
+    for model in ("spherical", "vincenty"):
+        lats, lons = destination_points(41.275, 28.752, bearings, 2500.0, model=model)
+        for b, lat, lon in zip(bearings, lats, lons):
+            expected = destination_point(41.275, 28.752, b, 2500.0, model=model)
+            assert (lat, lon) == pytest.approx(expected)
+
+
+def test_range_rings():
+    ring = range_ring(-33.9, 151.2, 1000.0, num_points=12)
+
+    assert len(ring) == 13
+    assert ring[0] == ring[-1]
+    for lat, lon in ring:
+        assert haversine_km(-33.9, 151.2, lat, lon) == pytest.approx(1000.0, rel=1e-9)
+
+    ring_lats, ring_lons = range_rings([-33.9, 64.1], [151.2, -21.9], 1000.0, num_points=12)
+    assert ring_lats.shape == (2, 13)
+    assert list(zip(ring_lats[0], ring_lons[0])) == pytest.approx(ring)
@@ -0,0 +1,111 @@
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from aeronavx.core import analytics, search
+from aeronavx.core.aggregation import group_by
+from aeronavx.core.incremental import get_analytics_snapshot
+from aeronavx.core.loader import (
+    apply_changes,
+    get_airport_by_iata,
+    load_airports,
+    subscribe,
+    unsubscribe,
+)
+from aeronavx.core.tiles import TileNearestCache
+from aeronavx.exceptions import AirportNotFoundError
+
+MINIMAL_DATA = Path(__file__).parent.parent / "aeronavx" / "data" / "airports_minimal.csv"
+
+
+@pytest.fixture
+def deltas():
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+    received = []
+    subscribe(received.append)
+    yield received
+    unsubscribe(received.append)
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+
+
+def assert_matches_full_scan():
+    snapshot = get_analytics_snapshot()
+    counts = group_by("iso_country", n="count", center="centroid")
+
+    assert dict(snapshot.per_country) == {k: v["n"] for k, v in counts.items()}
+    for country, stats in counts.items():
+        assert snapshot.country_centroids[country] == pytest.approx(stats["center"])
+
+
+def test_snapshot_is_shared_until_data_changes(deltas):
+    snapshot = get_analytics_snapshot()
+
+    assert snapshot is get_analytics_snapshot()
+    assert analytics.total_airports() == 10
+    assert analytics.airports_with_scheduled_service() == 9
+    assert analytics.airports_per_continent()["EU"] == 3
+
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+    assert deltas[-1].added == () and deltas[-1].removed == ()
+    assert get_analytics_snapshot() is not snapshot
+
+
+def test_apply_changes_updates_aggregates(deltas):
+    jfk = get_airport_by_iata("JFK")
+    ist = get_airport_by_iata("IST")
+    moved = dataclasses.replace(jfk, iso_country="CA", scheduled_service=False)
+    new = dataclasses.replace(ist, id=99, iata_code="SAW", latitude_deg=40.9, longitude_deg=29.3)
+    before = get_analytics_snapshot()
+
+    version = apply_changes(added=[moved, new], removed=[jfk])
+
+    snapshot = get_analytics_snapshot()
+    assert snapshot.version == version == deltas[-1].version
+    assert deltas[-1].removed == (jfk,)
+    assert snapshot.total == before.total + 1
+    assert snapshot.scheduled == before.scheduled
+    assert snapshot.per_country["US"] == 1
+    assert snapshot.per_country["CA"] == 1
+    assert snapshot.per_country["TR"] == 2
+    assert_matches_full_scan()
+
+    apply_changes(removed=[moved, moved])
+    assert deltas[-1].removed == (moved,)
+    assert "CA" not in get_analytics_snapshot().per_country
+    assert "CA" not in get_analytics_snapshot().country_centroids
+    assert_matches_full_scan()
+
+
+def test_reload_diff_and_unknown_removal(deltas):
+    load_airports(data_path=MINIMAL_DATA, force_reload=True, countries=["US", "GB"])
+
+    assert len(deltas[-1].removed) == 7
+    assert deltas[-1].added == ()
+    assert analytics.airports_per_country() == {"US": 2, "GB": 1}
+    assert_matches_full_scan()
+
+    with pytest.raises(AirportNotFoundError):
+        apply_changes(removed=[dataclasses.replace(get_airport_by_iata("JFK"))])
+
+
+def test_derived_lookups_follow_apply_changes(deltas):
+    jfk = get_airport_by_iata("JFK")
+    lax = get_airport_by_iata("LAX")
+    tiles = TileNearestCache(zoom=4, k=3)
+
+    assert search.nearest_airport(40.64, -73.78) is jfk
+    assert tiles.nearest(40.64, -73.78, n=1)[0].airport is jfk
+    assert jfk in search.filter_airports_page(limit=20).items
+    analytics.precompute_nearest_neighbors(k=2)
+    assert analytics.get_precomputed_neighbors("LAX")[0] is jfk
+
+    apply_changes(removed=[jfk])
+
+    assert search.nearest_airport(40.64, -73.78) is lax
+    assert tiles.nearest(40.64, -73.78, n=1)[0].airport is lax
+    assert jfk not in search.filter_airports_page(limit=20).items
+    assert analytics.get_precomputed_neighbors("LAX") is None
+
+    analytics.precompute_nearest_neighbors(k=2)
+    assert jfk not in analytics.get_precomputed_neighbors("LAX")
@@ -0,0 +1,107 @@
+import math
+
+import pytest
+
+from aeronavx.core import metar
+from aeronavx.core.metar import decode_columns, decode_report, decode_reports, flight_category
+
+EGLL = "EGLL 191220Z 24015G25KT 9999 BKN012 12/10 Q1003"
+KJFK = "KJFK 191251Z 31008KT 1 1/2SM BR OVC004 17/04 A3012 RMK AO2 SLP199 T01720039"
+LTFM = "METAR LTFM 191220Z VRB02MPS CAVOK M02/M05 Q1018 NOSIG"
+TAF = (
+    "TAF AMD EGLL 191120Z 1912/2018 24014KT 9999 BKN030\n"
+    "      TEMPO 1912/1918 4000 -RA BKN008"
+)
+
+
+def test_decodes_main_groups():
+    report = decode_report(EGLL)
+
+    assert report.station == "EGLL"
+    assert (report.wind_direction_deg, report.wind_speed_kt, report.wind_gust_kt) == (240, 15, 25)
+    assert report.visibility_m == 10000
+    assert report.ceiling_ft == 1200
+    assert (report.temperature_c, report.dewpoint_c) == (12, 10)
+    assert report.altimeter_hpa == 1003
+    assert report.flight_category == "MVFR"
+
+
+def test_decodes_us_units_and_skips_remarks():
+    report = decode_report(KJFK)
+
+    assert report.visibility_m == pytest.approx(1.5 * metar.SM_TO_M)
+    assert report.ceiling_ft == 400
+    assert report.altimeter_hpa == pytest.approx(1019.98, abs=0.01)
+    assert report.flight_category == "LIFR"
+
+
+def test_decodes_variable_wind_cavok_and_negative_temperatures():
+    report = decode_report(LTFM)
+
+    assert report.station == "LTFM"
+    assert report.wind_direction_deg is None
+    assert report.wind_speed_kt == pytest.approx(3.89, abs=0.01)
+    assert report.ceiling_ft is None
+    assert (report.temperature_c, report.dewpoint_c) == (-2, -5)
+    assert report.flight_category == "VFR"
+
+
+def test_taf_uses_prevailing_group_only():
+    report = decode_report(TAF)
+
+    assert report.station == "EGLL"
+    assert report.visibility_m == 10000
+    assert report.ceiling_ft == 3000
+    assert report.temperature_c is None
+
+
+@pytest.mark.parametrize("visibility_m, ceiling_ft, expected", [
+    (10000, None, "VFR"),
+    (10000, 3000, "MVFR"),
+    (4000, None, "IFR"),
+    (10000, 400, "LIFR"),
+    (None, 800, "IFR"),
+    (None, None, None),
+])
+def test_flight_category(visibility_m, ceiling_ft, expected):
+    assert flight_category(visibility_m, ceiling_ft) == expected
+
+
+def test_batch_matches_single_and_reuses_cached_results():
+    metar.clear_decoded_cache()
+    batch = decode_reports([EGLL, None, "garbage", KJFK, EGLL])
+
+    assert batch[0] is batch[4]
+    assert batch[1] is None
+    assert batch[2].station is None and batch[2].flight_category is None
+    assert batch[3] == decode_report(KJFK)
+    assert decode_report(EGLL) is batch[0]
+    assert batch[0].as_dict()["raw"] == EGLL
+
+
+@pytest.mark.parametrize("degenerate", ["METAR", "TAF", "TAF AMD", "", "EGLL\x1eKJFK"])
+def test_degenerate_report_keeps_batch_aligned(degenerate):
+    metar.clear_decoded_cache()
+    batch = decode_reports([EGLL, degenerate, KJFK, LTFM])
+
+    assert [r.station for r in batch[::2]] == ["EGLL", "KJFK"]
+    assert batch[3].station == "LTFM"
+    assert decode_report(KJFK).station == "KJFK"
+    assert decode_report(LTFM).flight_category == "VFR"
+    assert len(decode_columns([degenerate, EGLL])["station"]) == 2
+
+
+def test_columns_match_decoded_reports():
+    reports = [EGLL, KJFK, LTFM, TAF, "garbage"]
+    columns = decode_columns(reports)
+
+    for i, report in enumerate(decode_reports(reports)):
+        assert columns["station"][i] == report.station
+        assert columns["flight_category"][i] == report.flight_category
+        numeric = ("wind_speed_kt", "visibility_m", "ceiling_ft", "temperature_c", "altimeter_hpa")
+        for name in numeric:
+            value = getattr(report, name)
+            if value is None:
+                assert math.isnan(columns[name][i]) if metar.HAS_NUMPY else columns[name][i] is None
+            else:
+                assert columns[name][i] == pytest.approx(value)
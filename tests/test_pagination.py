@@ -0,0 +1,110 @@
+import random
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from aeronavx.core import search
+from aeronavx.core.loader import load_airports
+from aeronavx.core.search import (
+    airports_within_radius,
+    airports_within_radius_page,
+    clear_spatial_index,
+    filter_airports,
+    filter_airports_page,
+)
+from aeronavx.utils.pagination import decode_cursor, encode_cursor
+from aeronavx.utils.spatial_index import SpatialIndex
+
+MINIMAL_DATA = Path(__file__).parent.parent / "aeronavx" / "data" / "airports_minimal.csv"
+
+
+@pytest.fixture(autouse=True)
+def minimal_airports():
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+    clear_spatial_index()
+    yield
+    clear_spatial_index()
+
+
+def test_cursor_roundtrip():
+    cursor = encode_cursor((123.5, 42, "Istanbul Airport"))
+
+    assert decode_cursor(cursor, (float, int, str)) == (123.5, 42, "Istanbul Airport")
+
+
+def test_invalid_cursor():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor", (int, str))
+
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor((1, 2)), (int, str))
+
+
+def test_filter_airports_pages_cover_all_results():
+    expected = sorted(a.id for a in filter_airports())
+
+    seen = []
+    cursor = None
+    while True:
+        page = filter_airports_page(limit=3, cursor=cursor)
+        assert len(page.items) <= 3
+        seen.extend(a.id for a in page.items)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert seen == expected
+
+
+def test_within_radius_pages_are_sorted_by_distance():
+    lat, lon = 50.0, 5.0
+    expected = {a.id for a in airports_within_radius(lat, lon, 1000)}
+
+    first = airports_within_radius_page(lat, lon, 1000, limit=2)
+    rest = airports_within_radius_page(lat, lon, 1000, limit=100, cursor=first.next_cursor)
+
+    airports = [r.airport for r in first.items + rest.items]
+    distances = [r.distance_km for r in first.items + rest.items]
+
+    assert first.has_more
+    assert {a.id for a in airports} == expected
+    assert len(airports) == len(expected)
+    assert distances == sorted(distances)
+    assert rest.next_cursor is None
+
+
+
+@pytest.mark.parametrize("count", [50, 2000])
+def test_within_radius_deep_pages_match_full_query(count, monkeypatch):
+    rng = random.Random(3)
+    base = load_airports(data_path=MINIMAL_DATA)[0]
+    airports = [
+        replace(base, id=i, name=f"Airport {i}",
+                latitude_deg=rng.uniform(30.0, 60.0), longitude_deg=rng.uniform(-20.0, 40.0))
+        for i in range(count)
+    ]
+    # Same coordinates as airport 0, so ties are broken by airport id
+    airports[1] = replace(airports[1], latitude_deg=airports[0].latitude_deg,
+                          longitude_deg=airports[0].longitude_deg)
+    index = SpatialIndex(airports)
+    monkeypatch.setattr(search, "_get_spatial_index", lambda: index)
+
+    lat, lon = airports[0].latitude_deg, airports[0].longitude_deg
+    expected = [
+        r.airport.id for r in sorted(
+            index.within_radius_with_distance(lat, lon, 1500),
+            key=lambda r: (r.distance_km, r.airport.id),
+        )
+    ]
+
+    seen = []
+    cursor = None
+    while True:
+        page = airports_within_radius_page(lat, lon, 1500, limit=7, cursor=cursor)
+        seen.extend(r.airport.id for r in page.items)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert seen == expected
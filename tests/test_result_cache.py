@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import pytest
+
+from aeronavx.core import analytics
+from aeronavx.core.loader import get_dataset_fingerprint, load_airports
+from aeronavx.core.search import clear_spatial_index
+from aeronavx.utils.result_cache import (
+    JSON_CODEC,
+    ResultCache,
+    get_result_cache,
+    set_result_cache_dir,
+)
+
+MINIMAL_DATA = Path(__file__).parent.parent / "aeronavx" / "data" / "airports_minimal.csv"
+
+
+@pytest.fixture
+def result_cache(tmp_path):
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+    clear_spatial_index()
+    previous = get_result_cache()
+    set_result_cache_dir(tmp_path)
+    yield get_result_cache()
+    set_result_cache_dir(None if previous is None else previous.directory)
+    clear_spatial_index()
+
+
+def test_roundtrip_and_key_addressing(tmp_path):
+    cache = ResultCache(tmp_path)
+    key = cache.key("abc", "f", {"k": 5, "model": "haversine"})
+
+    assert key == cache.key("abc", "f", {"model": "haversine", "k": 5})
+    assert key != cache.key("abd", "f", {"k": 5, "model": "haversine"})
+
+    path = cache.put(key, {"IST": [41.3, 28.8]}, JSON_CODEC)
+    assert path.parent.name == key[:2]
+    assert cache.get(key, JSON_CODEC) == {"IST": [41.3, 28.8]}
+    assert list(tmp_path.glob("**/*.tmp")) == []
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = ResultCache(tmp_path)
+    key = cache.key("abc", "f", {})
+    path = cache.put(key, [1, 2, 3], JSON_CODEC)
+
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    assert cache.get(key, JSON_CODEC) is None
+    assert cache.get_or_compute("abc", "f", {}, lambda: [4], JSON_CODEC) == [4]
+    assert cache.get(key, JSON_CODEC) == [4]
+
+
+def test_none_result_is_cached(tmp_path):
+    cache = ResultCache(tmp_path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return None
+
+    assert cache.get_or_compute("abc", "f", {}, compute, JSON_CODEC) is None
+    assert cache.get_or_compute("abc", "f", {}, compute, JSON_CODEC) is None
+    assert calls == [1]
+    assert cache.get(cache.key("abc", "f", {}), JSON_CODEC, default=0) is None
+    assert cache.get(cache.key("abc", "g", {}), JSON_CODEC, default=0) == 0
+
+
+def test_fingerprint_tracks_loaded_data():
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+    fingerprint = get_dataset_fingerprint()
+
+    load_airports(data_path=MINIMAL_DATA, force_reload=True, countries=["US"])
+    assert get_dataset_fingerprint() != fingerprint
+
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+    assert get_dataset_fingerprint() == fingerprint
+
+
+def test_neighbor_graph_is_reused(result_cache, monkeypatch):
+    graph = analytics.precompute_nearest_neighbors(k=3)
+    assert len(list(result_cache.directory.glob("*/*.anx"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("recomputed")
+
+    monkeypatch.setattr(analytics, "get_spatial_index", fail)
+
+    cached = analytics.precompute_nearest_neighbors(k=3)
+    assert list(cached.indices) == list(graph.indices)
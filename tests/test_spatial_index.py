@@ -0,0 +1,199 @@
+import random
+
+import pytest
+
+from aeronavx.core.distance import haversine_km
+from aeronavx.core.geodesy import distance_to_segment_km, initial_bearing
+from aeronavx.models.airport import Airport
+from aeronavx.utils.spatial_index import SpatialIndex
+
+
+def make_airports(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        Airport(
+            id=i, ident=f"X{i:04d}", type="small_airport", name=f"Airport {i}",
+            latitude_deg=rng.uniform(-89.0, 89.0), longitude_deg=rng.uniform(-180.0, 180.0),
+            elevation_ft=None, continent=None, iso_country=None, iso_region=None,
+            municipality=None, scheduled_service=None, gps_code=None, iata_code=None,
+            local_code=None, home_link=None, wikipedia_link=None, keywords=None,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("count", [50, 2000])
+def test_nearest_with_distance_matches_haversine(count):
+    index = SpatialIndex(make_airports(count))
+    lat, lon = 41.0, 29.0
+
+    results = index.nearest_with_distance(lat, lon, n=5, with_bearing=True)
+    expected = sorted(
+        index.airports,
+        key=lambda a: haversine_km(lat, lon, a.latitude_deg, a.longitude_deg)
+    )[:5]
+
+    assert [r.airport for r in results] == expected
+    for r in results:
+        a = r.airport
+        assert r.distance_km == pytest.approx(
+            haversine_km(lat, lon, a.latitude_deg, a.longitude_deg), abs=1e-6
+        )
+        assert r.bearing_deg == pytest.approx(
+            initial_bearing(lat, lon, a.latitude_deg, a.longitude_deg), abs=1e-6
+        )
+
+
+@pytest.mark.parametrize("count", [50, 2000])
+def test_within_radius_sorted_and_limited(count):
+    index = SpatialIndex(make_airports(count))
+    lat, lon = -10.0, 170.0
+
+    results = index.within_radius_with_distance(lat, lon, 3000)
+    expected = {
+        a.id for a in index.airports
+        if haversine_km(lat, lon, a.latitude_deg, a.longitude_deg) <= 3000
+    }
+
+    distances = [r.distance_km for r in results]
+    assert {r.airport.id for r in results} == expected
+    assert distances == sorted(distances)
+
+    limited = index.within_radius_with_distance(lat, lon, 3000, limit=3)
+    assert [r.airport for r in limited] == [r.airport for r in results[:3]]
+
+
+@pytest.mark.parametrize("count", [50, 2000])
+def test_within_bbox_crossing_antimeridian(count):
+    index = SpatialIndex(make_airports(count))
+
+    results = index.within_bbox(-30.0, 150.0, 30.0, -150.0)
+    expected = [
+        a for a in index.airports
+        if -30.0 <= a.latitude_deg <= 30.0
+        and (a.longitude_deg >= 150.0 or a.longitude_deg <= -150.0)
+    ]
+
+    assert results == expected
+
+
+@pytest.mark.parametrize("count", [50, 2000])
+@pytest.mark.parametrize("box", [(-10.0, -175.0, 10.0, 175.0), (-30.0, -170.0, 30.0, 100.0)])
+def test_within_wide_bbox_and_polygon(count, box):
+    # Boxes spanning more than 180 degrees of longitude, whose farthest points
+    # from the center lie on the top and bottom edges rather than the corners
+    index = SpatialIndex(make_airports(count))
+    min_lat, min_lon, max_lat, max_lon = box
+    expected = [
+        a for a in index.airports
+        if min_lat <= a.latitude_deg <= max_lat and min_lon <= a.longitude_deg <= max_lon
+    ]
+
+    mid_lon = (min_lon + max_lon) / 2.0
+    polygon = [
+        (min_lat, min_lon), (min_lat, mid_lon), (min_lat, max_lon),
+        (max_lat, max_lon), (max_lat, mid_lon), (max_lat, min_lon),
+    ]
+
+    assert index.within_bbox(*box) == expected
+    assert index.within_polygon(polygon) == expected
+
+
+@pytest.mark.parametrize("count", [50, 2000])
+def test_within_polygon(count):
+    index = SpatialIndex(make_airports(count))
+    # Triangle crossing the antimeridian
+    triangle = [(0.0, 160.0), (40.0, -160.0), (-40.0, -160.0)]
+
+    results = index.within_polygon(triangle)
+
+    def inside(a):
+        x = a.longitude_deg if a.longitude_deg >= 0 else a.longitude_deg + 360.0
+        if not 160.0 <= x <= 200.0:
+            return False
+        half_height = (x - 160.0)
+        return abs(a.latitude_deg) <= half_height
+
+    assert results == [a for a in index.airports if inside(a)]
+
+
+def test_polygon_around_pole_rejected():
+    index = SpatialIndex(make_airports(50))
+
+    with pytest.raises(ValueError):
+        index.within_polygon([(80.0, 0.0), (80.0, 120.0), (80.0, -120.0)])
+
+
+@pytest.mark.parametrize("count", [50, 2000])
+def test_within_corridor(count):
+    index = SpatialIndex(make_airports(count))
+    route = [(0.0, 0.0), (0.0, 60.0)]
+
+    results = index.within_corridor(route, 500.0)
+
+    # Along the equator the distance to the route is the distance to the
+    # nearest point of the segment
+    def distance_to_route(a):
+        lon = min(max(a.longitude_deg, 0.0), 60.0)
+        return haversine_km(a.latitude_deg, a.longitude_deg, 0.0, lon)
+
+    expected = {a.id for a in index.airports if distance_to_route(a) <= 500.0}
+
+    assert {r.airport.id for r in results} == expected
+    for r in results:
+        assert r.distance_km == pytest.approx(distance_to_route(r.airport), abs=1e-6)
+
+
+@pytest.mark.parametrize("count", [50, 2000])
+def test_knn_graph_matches_single_queries(count, tmp_path):
+    index = SpatialIndex(make_airports(count))
+
+    graph = index.knn_graph(4)
+
+    assert len(graph) == count
+    for row in (0, count // 2, count - 1):
+        a = index.airports[row]
+        expected = [
+            r.airport for r in index.nearest_with_distance(a.latitude_deg, a.longitude_deg, 5)
+            if r.airport is not a
+        ][:4]
+        assert [index.airports[i] for i in graph.neighbors(row)] == expected
+
+    path = tmp_path / "knn.bin"
+    graph.save(path)
+    loaded = type(graph).load(path)
+
+    assert loaded.k == graph.k
+    assert loaded.indptr == graph.indptr
+    assert loaded.indices == graph.indices
+    assert loaded.distances_km == graph.distances_km
+
+
+@pytest.mark.parametrize("count", [50, 2000])
+def test_near_trajectory_matches_segment_distance(count):
+    index = SpatialIndex(make_airports(count))
+    rng = random.Random(11)
+
+    # A wandering track of short steps heading roughly east
+    lats, lons = [10.0], [-40.0]
+    for _ in range(120):
+        lats.append(max(-80.0, min(80.0, lats[-1] + rng.uniform(-1.0, 1.0))))
+        lons.append(lons[-1] + rng.uniform(0.0, 1.0))
+
+    results = index.near_trajectory(lats, lons, 1000.0, chunk_size=16)
+
+    def closest(a):
+        return min(
+            distance_to_segment_km(a.latitude_deg, a.longitude_deg, *p, *q)[0]
+            for p, q in zip(zip(lats, lons), zip(lats[1:], lons[1:]))
+        )
+
+    expected = {a.id for a in index.airports if closest(a) <= 1000.0}
+
+    assert expected
+    assert {r.airport.id for r in results} == expected
+    fractions = [r.fraction for r in results]
+    assert fractions == sorted(fractions)
+    for r in results:
+        assert r.distance_km == pytest.approx(closest(r.airport), abs=1e-6)
+        assert 0.0 <= r.fraction <= 1.0
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from aeronavx.core import search
+from aeronavx.core.tiles import TileNearestCache, tile_bounds, tile_for_point
+from aeronavx.utils.spatial_index import SpatialIndex
+
+from .test_spatial_index import make_airports
+
+
+@pytest.fixture
+def synthetic_index(monkeypatch):
+    index = SpatialIndex(make_airports(3000))
+    monkeypatch.setattr(search, "_get_spatial_index", lambda: index)
+    return index
+
+
+def test_tile_for_point_roundtrip():
+    x, y = tile_for_point(41.0, 29.0, 10)
+    min_lat, min_lon, max_lat, max_lon = tile_bounds(x, y, 10)
+
+    assert min_lat <= 41.0 <= max_lat
+    assert min_lon <= 29.0 <= max_lon
+
+
+@pytest.mark.parametrize("zoom", [2, 6, 10])
+def test_tile_cache_matches_direct_query(synthetic_index, zoom):
+    cache = TileNearestCache(zoom=zoom, k=4)
+    rng = random.Random(3)
+
+    for _ in range(200):
+        lat, lon = rng.uniform(-85.0, 85.0), rng.uniform(-180.0, 180.0)
+        expected = synthetic_index.nearest_with_distance(lat, lon, 4)
+        results = cache.nearest(lat, lon)
+
+        assert [r.airport for r in results] == [r.airport for r in expected]
+        assert [r.distance_km for r in results] == pytest.approx(
+            [r.distance_km for r in expected], abs=1e-6
+        )
+
+
+def test_tile_cache_is_bounded(synthetic_index):
+    cache = TileNearestCache(zoom=6, k=2, maxsize=3)
+
+    for lon in range(-170, 170, 20):
+        cache.nearest(10.0, float(lon))
+    cache.nearest(10.0, 150.0)
+
+    stats = cache.stats()
+    assert stats["tiles"] == 3
+    assert stats["hits"] == 1
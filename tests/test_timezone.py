@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from aeronavx.core import timezone
+from aeronavx.core.loader import get_airport_by_iata, load_airports
+from aeronavx.models.airport import Airport
+from aeronavx.utils.result_cache import get_result_cache, set_result_cache_dir
+
+MINIMAL_DATA = Path(__file__).parent.parent / "aeronavx" / "data" / "airports_minimal.csv"
+
+pytestmark = pytest.mark.skipif(
+    not timezone.HAS_TIMEZONEFINDER, reason="timezonefinder not installed"
+)
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    load_airports(data_path=MINIMAL_DATA, force_reload=True)
+    monkeypatch.setattr(timezone, "_column", None)
+    calls = []
+    lookup = timezone._lookup
+
+    def counting_lookup(airport):
+        calls.append(airport.iata_code)
+        return lookup(airport)
+
+    monkeypatch.setattr(timezone, "_lookup", counting_lookup)
+    return calls
+
+
+def test_column_resolves_each_airport_once(lookups):
+    jfk = get_airport_by_iata("JFK")
+
+    assert timezone.get_timezone_for_airport(jfk) == "America/New_York"
+    assert timezone.get_timezone_for_code("JFK") == "America/New_York"
+    assert lookups == ["JFK"]
+
+    column = timezone.precompute_timezones()
+    assert column.complete
+    assert sorted(lookups) == sorted(a.iata_code for a in column.airports)
+    assert timezone.get_timezone_for_code("IST") == "Europe/Istanbul"
+    assert len(lookups) == len(column.airports)
+
+
+def test_reload_reuses_resolved_rows(lookups):
+    timezone.precompute_timezones()
+    lookups.clear()
+
+    load_airports(data_path=MINIMAL_DATA, force_reload=True, countries=["US", "GB"])
+    column = timezone.precompute_timezones()
+
+    assert lookups == []
+    assert sorted(column.names) == ["America/Los_Angeles", "America/New_York", "Europe/London"]
+
+
+def test_column_is_persisted(lookups, tmp_path):
+    previous = get_result_cache()
+    set_result_cache_dir(tmp_path)
+    try:
+        timezone.precompute_timezones()
+        timezone._column = None
+        lookups.clear()
+
+        column = timezone.get_timezone_column()
+        assert column.complete
+        assert timezone.get_timezone_for_code("HND") == "Asia/Tokyo"
+        assert lookups == []
+    finally:
+        set_result_cache_dir(None if previous is None else previous.directory)
+
+
+def test_airports_outside_dataset_are_looked_up(lookups):
+    fields = {**get_airport_by_iata("JFK").as_dict(), "latitude_deg": 41.0, "longitude_deg": 29.0}
+
+    assert timezone.get_timezone_for_airport(Airport(**fields)) == "Europe/Istanbul"
+
+
+@pytest.mark.skipif(not timezone.HAS_NUMPY, reason="numpy not installed")
+def test_batch_offsets_match_zoneinfo_across_dst(lookups):
+    import numpy as np
+
+    jfk, lhr, hnd = (get_airport_by_iata(code) for code in ("JFK", "LHR", "HND"))
+    # Around the 2024 US spring-forward transition (2024-03-10 07:00 UTC)
+    start = datetime(2024, 3, 10, 6, 59, 59, tzinfo=dt_timezone.utc)
+    instants = [start + timedelta(seconds=s) for s in (0, 1, 3600 * 24 * 30, -3600 * 24 * 200)]
+    airports = [jfk, jfk, lhr, hnd]
+
+    offsets = timezone.utc_offsets(airports, instants)
+    expected = [
+        dt.astimezone(ZoneInfo(timezone.get_timezone_for_airport(a))).utcoffset().total_seconds()
+        for a, dt in zip(airports, instants)
+    ]
+    assert offsets.tolist() == expected == [-18000.0, -14400.0, 3600.0, 32400.0]
+
+    naive_utc = [dt.replace(tzinfo=None) for dt in instants]
+    local = timezone.local_times(airports, np.array(naive_utc, dtype="datetime64[s]"))
+    assert local[1] == np.datetime64("2024-03-10T03:00:00")
+
+
+@pytest.mark.skipif(not timezone.HAS_NUMPY, reason="numpy not installed")
+def test_batch_unknown_timezone_and_single_instant(lookups, monkeypatch):
+    import numpy as np
+
+    jfk, ist = get_airport_by_iata("JFK"), get_airport_by_iata("IST")
+    get_tz = timezone.get_timezone_for_airport
+    monkeypatch.setattr(
+        timezone, "get_timezone_for_airport", lambda a: None if a is ist else get_tz(a)
+    )
+
+    offsets = timezone.utc_offsets([jfk, ist], datetime(2024, 7, 1, 12))
+    local = timezone.local_times([jfk, ist], datetime(2024, 7, 1, 12))
+
+    assert offsets[0] == -14400.0 and np.isnan(offsets[1])
+    assert local[0] == np.datetime64("2024-07-01T08:00:00") and np.isnat(local[1])
+
+
+def test_local_time_defaults_to_now(lookups):
+    local = timezone.local_time_for_code("IST")
+
+    assert local.tzinfo is not None
+    assert abs(local - datetime.now(dt_timezone.utc)) < timedelta(minutes=1)
@@ -0,0 +1,325 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from aeronavx.core import weather
+from aeronavx.exceptions import WeatherDataError
+
+DATA_DIR = Path(__file__).parent / "data"
+
+pytestmark = pytest.mark.skipif(not weather.HAS_HTTPX, reason="httpx not installed")
+
+
+REPORTS = {
+    "/observations/metar/stations/LTFM.TXT": (
+        "2026/10/19 12:20\n"
+        "LTFM 191220Z 03012KT 9999 FEW030 14/08 Q1018 NOSIG\n"
+    ),
+    "/observations/metar/stations/EGLL.TXT": (
+        "2026/10/19 12:20\n"
+        "EGLL 191220Z 24015G25KT 9999 BKN012 12/10 Q1003\n"
+    ),
+    "/forecasts/taf/stations/EGLL.TXT": (
+        "2026/10/19 11:00\n"
+        "TAF EGLL 191100Z 1912/2018 24014KT 9999 BKN012\n"
+        "      TEMPO 1912/1918 BKN008\n"
+    ),
+}
+
+
+class StationServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StationHandler)
+        self.lock = threading.Lock()
+        self.paths = []
+        self.connections = set()
+        self.active = 0
+        self.peak = 0
+        self.delay = 0.0
+        self.reports = dict(REPORTS)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StationHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.paths.append(self.path)
+            server.connections.add(self.client_address)
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+
+        time.sleep(server.delay)
+
+        with server.lock:
+            server.active -= 1
+
+        body = server.reports.get(self.path)
+        self.send_response(404 if body is None else 200)
+        data = (body or "Not Found").encode("ascii")
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = StationServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    weather.set_weather_base_url(server.base_url)
+    weather.clear_weather_cache()
+    weather.clear_station_table()
+    yield server
+    weather.set_weather_base_url(None)
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_client_fetches_reports(server):
+    async def fetch():
+        async with weather.WeatherClient(base_url=server.base_url) as client:
+            return await client.get_metar("ltfm"), await client.get_taf("EGLL")
+
+    metar, taf = asyncio.run(fetch())
+
+    assert metar == "LTFM 191220Z 03012KT 9999 FEW030 14/08 Q1018 NOSIG"
+    assert taf.startswith("TAF EGLL 191100Z")
+    assert taf.endswith("TEMPO 1912/1918 BKN008")
+
+
+def test_batch_fetch_is_bounded_and_reuses_connections(server):
+    server.delay = 0.05
+
+    async def fetch():
+        async with weather.WeatherClient(
+            base_url=server.base_url, max_concurrency=2, max_connections=2
+        ) as client:
+            return await client.get_metars(["LTFM", "EGLL", "KJFK", "LTFM", "EDDF", "LFPG"])
+
+    reports = asyncio.run(fetch())
+
+    assert list(reports) == ["LTFM", "EGLL", "KJFK", "EDDF", "LFPG"]
+    assert reports["EGLL"].startswith("EGLL 191220Z")
+    assert reports["KJFK"] is None
+    assert len(server.paths) == 5
+    assert server.peak <= 2
+    assert len(server.connections) <= 2
+
+
+def test_sync_wrappers_use_configured_base_url(server):
+    assert weather.get_metar("EGLL") == "EGLL 191220Z 24015G25KT 9999 BKN012 12/10 Q1003"
+    assert weather.get_taf("LTFM") is None
+
+    reports = weather.get_metars(["LTFM", "EGLL"])
+    assert reports["LTFM"].startswith("LTFM 191220Z")
+    assert server.paths[0] == "/observations/metar/stations/EGLL.TXT"
+
+
+def test_sync_wrapper_inside_running_loop(server):
+    async def handler():
+        return weather.get_metar("LTFM")
+
+    assert asyncio.run(handler()).startswith("LTFM")
+
+
+def test_invalid_icao_raises_before_any_request(server):
+    with pytest.raises(WeatherDataError):
+        weather.get_metars(["EGLL", "not-a-code"])
+
+    assert server.paths == []
+
+
+def test_unreachable_server_yields_none():
+    async def fetch():
+        async with weather.WeatherClient(base_url="http://127.0.0.1:9", timeout=1.0) as client:
+            return await client.get_metar("EGLL")
+
+    assert asyncio.run(fetch()) is None
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run_with_cache(server, cache, *calls):
+    """Run calls (coroutine functions of the client) in order on one client."""
+    async def run():
+        async with weather.WeatherClient(base_url=server.base_url, cache=cache) as client:
+            results = [await call(client) for call in calls]
+            await asyncio.gather(*client._refreshes)
+            return results
+
+    return asyncio.run(run())
+
+
+def test_cache_applies_per_product_ttls(server):
+    clock = FakeClock()
+    cache = weather.WeatherCache(ttls={"metar": 300.0, "taf": 1800.0}, stale_ttl=0.0, timer=clock)
+
+    def advance(seconds):
+        async def call(client):
+            clock.now += seconds
+        return call
+
+    run_with_cache(
+        server, cache,
+        lambda c: c.get_metar("EGLL"), lambda c: c.get_taf("EGLL"),
+        advance(299), lambda c: c.get_metar("EGLL"), lambda c: c.get_taf("EGLL"),
+        advance(2), lambda c: c.get_metar("EGLL"), lambda c: c.get_taf("EGLL"),
+    )
+
+    assert server.paths.count("/observations/metar/stations/EGLL.TXT") == 2
+    assert server.paths.count("/forecasts/taf/stations/EGLL.TXT") == 1
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (3, 3)
+
+
+def test_stale_report_is_served_while_refreshing(server):
+    clock = FakeClock()
+    cache = weather.WeatherCache(timer=clock)
+    path = "/observations/metar/stations/LTFM.TXT"
+
+    def update(client):
+        clock.now += cache.ttls["metar"] + 1
+        server.reports[path] = "2026/10/19 12:50\nLTFM 191250Z 03010KT CAVOK 15/07 Q1018\n"
+        return asyncio.sleep(0)
+
+    first, _, stale = run_with_cache(server, cache, lambda c: c.get_metar("LTFM"), update,
+                                     lambda c: c.get_metar("LTFM"))
+    (fresh,) = run_with_cache(server, cache, lambda c: c.get_metar("LTFM"))
+
+    assert first == stale and first.startswith("LTFM 191220Z")
+    assert fresh.startswith("LTFM 191250Z")
+    assert cache.stats().stale_hits == 1
+    assert cache.stats().refreshes == 1
+    assert server.paths.count(path) == 2
+
+
+def test_missing_station_is_negatively_cached(server):
+    cache = weather.WeatherCache()
+
+    results = run_with_cache(
+        server, cache, lambda c: c.get_metar("KJFK"), lambda c: c.get_metar("KJFK")
+    )
+
+    assert results == [None, None]
+    assert len(server.paths) == 1
+    assert cache.stats().negative_hits == 1
+
+
+def test_concurrent_misses_are_coalesced(server):
+    server.delay = 0.05
+    cache = weather.WeatherCache()
+
+    async def burst(client):
+        return await asyncio.gather(*(client.get_metar("EGLL") for _ in range(5)))
+
+    (reports,) = run_with_cache(server, cache, burst)
+
+    assert len(set(reports)) == 1
+    assert len(server.paths) == 1
+    assert cache.stats().coalesced == 4
+
+
+def test_failures_are_not_cached():
+    cache = weather.WeatherCache()
+    client_calls = []
+
+    async def run():
+        client = weather.WeatherClient(base_url="http://127.0.0.1:9", timeout=1.0, cache=cache)
+        async with client:
+            client_calls.append(await client.get_metar("EGLL"))
+            client_calls.append(await client.get_metar("EGLL"))
+
+    asyncio.run(run())
+
+    assert client_calls == [None, None]
+    assert cache.stats().errors == 2
+    assert cache.stats().currsize == 0
+
+
+def test_cycle_file_is_served_from_the_station_table(server):
+    assert weather.ingest_cycle(DATA_DIR / "metar_cycle_12Z.TXT") == 6
+    assert sorted(weather.get_station_table().stations("metar")) == [
+        "EDDF", "EGLL", "KJFK", "LFPG", "LTFM"
+    ]
+
+    assert weather.get_metar("EGLL") == "EGLL 191250Z 24016G27KT 9999 -RA BKN010 12/11 Q1003"
+    assert weather.get_metar("EDDF").startswith("EDDF 191200Z AUTO")
+    assert server.paths == []
+    assert weather.get_weather_cache_stats().table_hits == 2
+
+    # Stations missing from the bundle still go upstream
+    assert weather.get_metar("LTFM").startswith("LTFM 191220Z")
+    weather.get_metar("EHAM")
+    assert server.paths == ["/observations/metar/stations/EHAM.TXT"]
+
+
+def test_taf_cycle_keeps_multiline_reports(server):
+    assert weather.ingest_cycle(str(DATA_DIR / "taf_cycle_12Z.TXT"), product="taf") == 2
+
+    taf = weather.get_taf("EGLL")
+    assert taf.startswith("TAF AMD EGLL 191120Z")
+    assert taf.splitlines()[-1].strip() == "PROB30 1920/2002 7000 -RA"
+    assert server.paths == []
+
+
+def test_older_cycle_does_not_replace_newer_reports(server):
+    table = weather.StationReportTable()
+    table.ingest(["2026/10/19 12:50", "EGLL 191250Z 24016KT 9999 Q1003"])
+    assert table.ingest(["2026/10/19 11:50", "EGLL 191150Z 24010KT 9999 Q1004"]) == 0
+    assert table.get("metar", "EGLL", max_age=60).startswith("EGLL 191250Z")
+
+
+def test_cycle_file_is_streamed_from_url(server):
+    text = (DATA_DIR / "metar_cycle_12Z.TXT").read_text()
+    server.reports["/observations/metar/cycles/12Z.TXT"] = text
+
+    assert weather.ingest_cycle(weather.cycle_url("metar", 12)) == 6
+    weather.clear_station_table()
+
+    async def ingest():
+        async with weather.WeatherClient(base_url=server.base_url) as client:
+            count = await client.ingest_cycle(weather.cycle_url("metar", 12, server.base_url))
+            return count, await client.get_metar("KJFK")
+
+    count, report = asyncio.run(ingest())
+    assert count == 6
+    assert report.startswith("KJFK 191251Z")
+    assert server.paths == ["/observations/metar/cycles/12Z.TXT"] * 2
+
+
+def test_missing_cycle_file_raises(server, tmp_path):
+    with pytest.raises(WeatherDataError):
+        weather.ingest_cycle(tmp_path / "missing.TXT")
+
+    with pytest.raises(WeatherDataError):
+        weather.ingest_cycle(weather.cycle_url("taf", 3), product="taf")
+
+
+def test_decoded_metars(server):
+    decoded = weather.get_decoded_metars(["EGLL", "KJFK"])
+
+    assert decoded["EGLL"].ceiling_ft == 1200
+    assert decoded["EGLL"].flight_category == "MVFR"
+    assert decoded["KJFK"] is None